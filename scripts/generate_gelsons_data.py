@@ -18,6 +18,8 @@ from pathlib import Path
 from typing import List, Dict, Any, Optional
 import string
 
+import numpy as np
+
 # Try to import Faker, fall back to basic generation if not available
 try:
     from faker import Faker
@@ -30,6 +32,7 @@ except ImportError:
 
 # Seed for reproducibility
 random.seed(42)
+np.random.seed(42)
 
 # Constants
 OUTPUT_DIR = Path("/Users/pankajsharma/Documents/Development/thedatastudio/data/bronze/gelsons")
@@ -90,6 +93,9 @@ POSITIONS = {
     "Management": ["Store Manager", "Assistant Manager", "Department Manager"],
 }
 
+# Positions eligible to be assigned as a store's manager
+MANAGER_POSITIONS = {"Store Manager", "Manager"}
+
 # Supplier certifications
 CERTIFICATIONS = [
     "USDA Organic", "Non-GMO Project Verified", "Certified Humane",
@@ -191,6 +197,11 @@ def generate_supplier_description(company_name: str, certification: str) -> str:
     return random.choice(descriptions)
 
 
+def sample_indices(n: int, pct: float) -> np.ndarray:
+    """Indices selected by n independent Bernoulli(pct) draws."""
+    return np.flatnonzero(np.random.random(n) < pct)
+
+
 def introduce_data_quality_issues(records: List[Dict], config: Dict) -> List[Dict]:
     """Introduce intentional data quality issues into records."""
     result = records.copy()
@@ -198,8 +209,9 @@ def introduce_data_quality_issues(records: List[Dict], config: Dict) -> List[Dic
     # Null values
     if "null_fields" in config:
         for field, pct in config["null_fields"].items():
-            for record in result:
-                if field in record and random.random() < pct:
+            for i in sample_indices(len(result), pct):
+                record = result[i]
+                if field in record:
                     record[field] = None
 
     # Duplicates
@@ -214,8 +226,9 @@ def introduce_data_quality_issues(records: List[Dict], config: Dict) -> List[Dic
 
     # Invalid formats
     if "invalid_email_pct" in config:
-        for record in result:
-            if "email" in record and record["email"] and random.random() < config["invalid_email_pct"]:
+        for i in sample_indices(len(result), config["invalid_email_pct"]):
+            record = result[i]
+            if "email" in record and record["email"]:
                 # Create invalid email
                 invalid_formats = [
                     record["email"].replace("@", ""),
@@ -228,8 +241,9 @@ def introduce_data_quality_issues(records: List[Dict], config: Dict) -> List[Dic
     # Negative values (anomalies)
     if "negative_fields" in config:
         for field, pct in config["negative_fields"].items():
-            for record in result:
-                if field in record and record[field] and random.random() < pct:
+            for i in sample_indices(len(result), pct):
+                record = result[i]
+                if field in record and record[field]:
                     record[field] = -abs(float(record[field]))
 
     # Inconsistent date formats
@@ -755,6 +769,7 @@ def main():
 
     # Set seed
     random.seed(args.seed)
+    np.random.seed(args.seed)
     if HAS_FAKER:
         Faker.seed(args.seed)
 
@@ -786,11 +801,14 @@ def main():
     print("  5. Employees...")
     employees = generate_employees(stores, 200)
 
-    # Update store managers
+    # Update store managers (first eligible employee per store wins)
+    managers_by_store = {}
+    for e in employees:
+        if e.get("position") in MANAGER_POSITIONS:
+            managers_by_store.setdefault(e.get("store_id"), e)
+
     for store in stores:
-        manager = next((e for e in employees
-                       if e.get("store_id") == store["store_id"]
-                       and e.get("position") in ["Store Manager", "Manager"]), None)
+        manager = managers_by_store.get(store["store_id"])
         if manager:
             store["manager_id"] = manager["employee_id"]
 
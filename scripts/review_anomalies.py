@@ -10,6 +10,25 @@ from pathlib import Path
 import pandas as pd
 
 
+# Columns this report actually displays; everything else is skipped at parse time
+KEY_COLUMNS = [
+    'Claim Number',
+    'Billed Amount',
+    '_meta_anomaly_method',
+    '_meta_anomaly_reasons',
+    '_meta_quality_score',
+]
+
+# Explicit dtypes for the numeric key columns (avoids pandas type sniffing)
+KEY_DTYPES = {
+    'Billed Amount': 'float64',
+    '_meta_quality_score': 'float32',
+}
+
+# Statistics shown in the numeric summaries
+SUMMARY_STATS = ['count', 'mean', 'std', 'min', 'max']
+
+
 def print_banner(text):
     """Print a formatted banner"""
     print("\n" + "=" * 80)
@@ -39,8 +58,19 @@ def review_anomalies(quarantine_file: str = "../data/etl/quarantine/medical-clai
     print_banner("Anomaly Review")
     print(f"Quarantine file: {quarantine_path}\n")
 
-    # Load anomalies
-    df_anomalies = pd.read_csv(quarantine_path)
+    # Load anomalies - read the header first so only displayed columns are parsed
+    all_columns = pd.read_csv(quarantine_path, nrows=0).columns
+    key_columns = [col for col in KEY_COLUMNS if col in all_columns]
+
+    if key_columns:
+        df_anomalies = pd.read_csv(
+            quarantine_path,
+            usecols=key_columns,
+            dtype={col: KEY_DTYPES[col] for col in key_columns if col in KEY_DTYPES},
+            engine='c'
+        )
+    else:
+        df_anomalies = pd.read_csv(quarantine_path)
 
     if len(df_anomalies) == 0:
         print("✅ No anomalies detected - all records are clean!")
@@ -51,7 +81,7 @@ def review_anomalies(quarantine_file: str = "../data/etl/quarantine/medical-clai
     # ========================================================================
     print_section("📊 Overall Statistics")
     print(f"Total anomalies: {len(df_anomalies)}")
-    print(f"Total columns:   {len(df_anomalies.columns)}")
+    print(f"Total columns:   {len(all_columns)}")
 
     # ========================================================================
     # 2. Breakdown by Detection Method
@@ -83,18 +113,6 @@ def review_anomalies(quarantine_file: str = "../data/etl/quarantine/medical-clai
     print_section("📋 Sample Anomalies (First 5)")
 
     # Show key columns if available
-    key_columns = []
-    if 'Claim Number' in df_anomalies.columns:
-        key_columns.append('Claim Number')
-    if 'Billed Amount' in df_anomalies.columns:
-        key_columns.append('Billed Amount')
-    if '_meta_anomaly_method' in df_anomalies.columns:
-        key_columns.append('_meta_anomaly_method')
-    if '_meta_anomaly_reasons' in df_anomalies.columns:
-        key_columns.append('_meta_anomaly_reasons')
-    if '_meta_quality_score' in df_anomalies.columns:
-        key_columns.append('_meta_quality_score')
-
     if key_columns:
         sample = df_anomalies[key_columns].head(5)
         # Set display options for better readability
@@ -108,12 +126,12 @@ def review_anomalies(quarantine_file: str = "../data/etl/quarantine/medical-clai
     # ========================================================================
     if 'Billed Amount' in df_anomalies.columns:
         print_section("💰 Billed Amount Statistics (Anomalies)")
-        billed_stats = df_anomalies['Billed Amount'].describe()
+        billed_stats = df_anomalies['Billed Amount'].agg(SUMMARY_STATS)
         print(billed_stats.to_string())
 
     if '_meta_quality_score' in df_anomalies.columns:
         print_section("⭐ Quality Score Statistics (Anomalies)")
-        quality_stats = df_anomalies['_meta_quality_score'].describe()
+        quality_stats = df_anomalies['_meta_quality_score'].agg(SUMMARY_STATS)
         print(quality_stats.to_string())
 
     # ========================================================================
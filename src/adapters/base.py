@@ -2,7 +2,8 @@
 Base adapter interfaces for sources and destinations
 """
 from abc import ABC, abstractmethod
-from typing import Any, Dict, Iterator, Optional
+from itertools import islice
+from typing import Any, Dict, Iterator, List, Optional
 
 from src.common.models import Record, Schema
 from src.common.exceptions import ConnectionError, ReadError, WriteError, SchemaError
@@ -49,6 +50,29 @@ class SourceAdapter(ABC):
         """
         pass
 
+    def read_batches(self, batch_size: int = 1000) -> Iterator[List[Record]]:
+        """
+        Read records from source as lists
+
+        The default groups the records of read(); sources that fetch in
+        batches override it to build each list directly.
+
+        Args:
+            batch_size: Maximum number of records per list
+
+        Yields:
+            List[Record]: Up to batch_size records
+
+        Raises:
+            ReadError: If reading fails
+        """
+        records = self.read(batch_size)
+        while True:
+            batch = list(islice(records, batch_size))
+            if not batch:
+                return
+            yield batch
+
     @abstractmethod
     def get_schema(self) -> Schema:
         """
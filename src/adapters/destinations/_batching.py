@@ -0,0 +1,66 @@
+"""
+Record batching helpers shared by the file-based destination adapters
+"""
+from itertools import islice
+from operator import attrgetter
+from typing import Dict, FrozenSet, Iterator, List, Tuple
+
+from src.common.models import Record
+
+
+# Pulls the payload dict off each incoming Record
+_record_data = attrgetter('data')
+
+
+def fill_batch(batch: List[Dict], records: Iterator[Record], batch_size: int) -> int:
+    """
+    Move record payloads into batch until it holds batch_size of them
+
+    extend(map(...)) runs the per-record loop in C.
+
+    Args:
+        batch: Buffered record dicts, extended in place
+        records: Iterator of incoming records
+        batch_size: Records per batch
+
+    Returns:
+        Number of records added; batch stays short of batch_size only
+        once records is exhausted
+    """
+    filled = len(batch)
+    batch.extend(map(_record_data, islice(records, batch_size - filled)))
+    return len(batch) - filled
+
+
+def column_order(
+    columns: List[str],
+    schema_columns: Tuple[str, ...],
+    schema_column_set: FrozenSet[str]
+) -> List[str]:
+    """
+    Determine output column order for a batch
+
+    NOTE: Only use schema for column ordering if all columns match.
+    Don't drop extra columns (e.g., metadata columns added by transformers).
+
+    Args:
+        columns: Columns present in the batch, in first-seen order
+        schema_columns: Schema column names in schema order (empty without a schema)
+        schema_column_set: The same names as a set
+
+    Returns:
+        List of column names to write
+    """
+    if not schema_columns:
+        return columns
+
+    extra_columns = [c for c in columns if c not in schema_column_set]
+
+    if not extra_columns:
+        # Exact match - use schema order
+        return list(schema_columns)
+
+    # Extra columns exist (e.g., metadata) - preserve all columns
+    # Put schema columns first, then extra columns
+    present = set(columns)
+    return [c for c in schema_columns if c in present] + extra_columns
@@ -0,0 +1,32 @@
+"""
+File helpers shared by the file-based destination adapters
+"""
+import os
+import uuid
+from pathlib import Path
+
+
+def create_temp_file(directory: Path, suffix: str) -> Path:
+    """
+    Create an empty, uniquely named file for staging output
+
+    Unlike tempfile.mkstemp, which always creates files 0600, the file is
+    opened with mode 0666 so the kernel applies the process umask, as for
+    any normally created file - committed output gets the usual
+    permissions without reading or changing the umask.
+
+    Args:
+        directory: Directory to create the file in
+        suffix: File name suffix (e.g. '.csv.tmp')
+
+    Returns:
+        Path of the new file
+    """
+    while True:
+        path = directory / f"tmp{uuid.uuid4().hex}{suffix}"
+        try:
+            fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666)
+        except FileExistsError:
+            continue
+        os.close(fd)
+        return path
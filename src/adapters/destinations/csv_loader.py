@@ -1,17 +1,161 @@
 """
 CSV destination adapter for writing data to CSV files
 """
+import asyncio
+import bz2
+import csv
+import gzip
+import io
+import lzma
+import numbers
+import os
+import sys
+import threading
 import pandas as pd
 from pathlib import Path
-from typing import Any, Dict, Iterator, List, Optional
-import tempfile
+from typing import Any, Callable, Dict, Iterator, List, Optional
 import shutil
 
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
+
+try:
+    import aiofiles
+    HAS_AIOFILES = True
+except ImportError:
+    HAS_AIOFILES = False
+
 from src.adapters.base import DestinationAdapter
+from src.adapters.destinations._batching import column_order
+from src.adapters.destinations._files import create_temp_file
 from src.common.models import Field, FieldType, Record, Schema
 from src.common.exceptions import ConnectionError, SchemaError, WriteError
 
 
+# Supported writer backends: 'pandas' (DataFrame.to_csv), 'python' (csv module),
+# 'pyarrow' (multi-threaded C++ writer, best for wide numeric tables)
+WRITER_BACKENDS = ('pandas', 'python', 'pyarrow')
+
+# Compression formats applied per batch as (payload, level) -> bytes; each
+# flush appends one compressed member/stream, which the gzip, bz2 and xz
+# readers all decode transparently. gzip uses mtime=0 for reproducible output.
+_STREAM_COMPRESSORS: Dict[str, Callable[[bytes, int], bytes]] = {
+    'gzip': lambda data, level: gzip.compress(data, compresslevel=level, mtime=0),
+    'bz2': lambda data, level: bz2.compress(data, compresslevel=level),
+    'xz': lambda data, level: lzma.compress(data, preset=level),
+}
+
+# Auto-tuned batches aim for ~16 MiB of serialized CSV per flush
+TARGET_BATCH_BYTES = 16 * 1024 * 1024
+MIN_BATCH_SIZE = 256
+MAX_BATCH_SIZE = 100_000  # Bounds in-memory Python objects for very narrow rows
+
+# Schema types whose values never need CSV quoting (python backend fast path)
+_UNQUOTED_FIELD_TYPES = frozenset({FieldType.INTEGER, FieldType.FLOAT, FieldType.BOOLEAN})
+
+# Characters that can appear in a formatted number/bool; the fast path is
+# only safe when the delimiter is none of them
+_NUMERIC_CHARS = frozenset('0123456789.+-eEinfaTrueFls')
+
+# Encoded batches allowed to wait for the background writer (async_io=True)
+ASYNC_QUEUE_DEPTH = 4
+
+
+class _AsyncFileWriter:
+    """
+    Background writer that drains encoded CSV chunks through aiofiles
+
+    Runs a private event loop in a daemon thread, so the loader can serialize
+    batch N+1 while batch N is being written. The queue is bounded: submit()
+    blocks once ASYNC_QUEUE_DEPTH chunks are pending, capping memory use.
+    """
+
+    def __init__(self, max_pending: int = ASYNC_QUEUE_DEPTH):
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(
+            target=self._loop.run_forever,
+            name="csv-async-writer",
+            daemon=True
+        )
+        self._thread.start()
+
+        self._handle = None
+        self._handle_path: Optional[Path] = None
+        self._error: Optional[BaseException] = None
+        self._run(self._start(max_pending))
+
+    def _run(self, coro):
+        """Run a coroutine on the writer loop and wait for its result"""
+        return asyncio.run_coroutine_threadsafe(coro, self._loop).result()
+
+    async def _start(self, max_pending: int) -> None:
+        self._queue = asyncio.Queue(maxsize=max_pending)
+        self._consumer = asyncio.get_running_loop().create_task(self._drain())
+
+    async def _stop(self) -> None:
+        self._consumer.cancel()
+        try:
+            await self._consumer
+        except asyncio.CancelledError:
+            pass
+
+    async def _close_handle(self) -> None:
+        if self._handle is not None:
+            await self._handle.close()
+            self._handle = None
+            self._handle_path = None
+
+    async def _drain(self) -> None:
+        """Consumer coroutine: write queued chunks in submission order"""
+        while True:
+            path, file_mode, payload = await self._queue.get()
+            try:
+                if self._error is None:
+                    # 'w' means start the file over; otherwise keep appending
+                    if file_mode == 'w' or path != self._handle_path:
+                        await self._close_handle()
+                        self._handle = await aiofiles.open(path, file_mode + 'b')
+                        self._handle_path = path
+                    await self._handle.write(payload)
+            except Exception as e:
+                self._error = e
+            finally:
+                self._queue.task_done()
+
+    async def _wait_idle(self) -> None:
+        await self._queue.join()
+        await self._close_handle()
+
+    def _raise_pending_error(self) -> None:
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise error
+
+    def submit(self, path: Path, file_mode: str, payload: bytes) -> None:
+        """Queue an encoded chunk for writing (blocks while the queue is full)"""
+        self._raise_pending_error()
+        self._run(self._queue.put((path, file_mode, payload)))
+
+    def flush(self) -> None:
+        """Wait until every queued chunk is on disk and the file is closed"""
+        self._run(self._wait_idle())
+        self._raise_pending_error()
+
+    def close(self) -> None:
+        """Flush pending chunks and stop the writer thread"""
+        try:
+            self.flush()
+        finally:
+            self._run(self._stop())
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join()
+            self._loop.close()
+
+
 class CSVLoader(DestinationAdapter):
     """Destination adapter for CSV files"""
 
@@ -23,6 +167,10 @@ class CSVLoader(DestinationAdapter):
         mode: str = "overwrite",  # 'overwrite' or 'append'
         compression: Optional[str] = None,  # None, 'gzip', 'bz2', 'zip', 'xz'
         include_index: bool = False,
+        writer_backend: str = "pandas",  # 'pandas', 'python' or 'pyarrow'
+        batch_size: Optional[int] = None,
+        async_io: bool = False,
+        compresslevel: int = 1,
         **kwargs
     ):
         """
@@ -35,8 +183,51 @@ class CSVLoader(DestinationAdapter):
             mode: Write mode - 'overwrite' (default) or 'append'
             compression: Compression format (None, 'gzip', 'bz2', 'zip', 'xz')
             include_index: Include pandas index in output (default: False)
-            **kwargs: Additional pandas to_csv parameters
+            writer_backend: Serializer used on flush - 'pandas' (default),
+                'python' (stdlib csv module) or 'pyarrow' (Arrow C++ writer;
+                fastest for numeric-heavy data, UTF-8 only, requires each
+                column to hold a single type)
+            batch_size: Records per flush. If None (default), sized from the
+                first record to target ~16 MiB of CSV per flush
+            async_io: Hand encoded batches to a background aiofiles writer so
+                serialization overlaps file I/O (default: False)
+            compresslevel: Level for gzip/bz2/xz compression (default: 1,
+                the fastest; CSV compresses well even at low levels)
+            **kwargs: Additional pandas to_csv parameters (pandas backend
+                only, as is include_index)
         """
+        if writer_backend not in WRITER_BACKENDS:
+            raise ValueError(
+                f"Invalid writer_backend '{writer_backend}'. "
+                f"Must be one of: {', '.join(WRITER_BACKENDS)}"
+            )
+        if writer_backend == 'pyarrow':
+            if not HAS_PYARROW:
+                raise ImportError(
+                    "pyarrow is required for writer_backend='pyarrow'. "
+                    "Install it with: pip install pyarrow"
+                )
+            if encoding.lower().replace('-', '') != 'utf8':
+                raise ValueError("writer_backend='pyarrow' only supports utf-8 encoding")
+        if compression not in (None, *_STREAM_COMPRESSORS) and (
+            writer_backend != 'pandas' or async_io
+        ):
+            raise ValueError(
+                f"Compression '{compression}' is only supported by "
+                f"writer_backend='pandas' without async_io"
+            )
+        if writer_backend != 'pandas' and (include_index or kwargs):
+            options = ['include_index'] if include_index else []
+            raise ValueError(
+                f"Options only supported by writer_backend='pandas': "
+                f"{', '.join(options + sorted(kwargs))}"
+            )
+        if async_io and not HAS_AIOFILES:
+            raise ImportError(
+                "aiofiles is required for async_io=True. "
+                "Install it with: pip install aiofiles"
+            )
+
         config = {
             'file_path': file_path,
             'delimiter': delimiter,
@@ -44,6 +235,10 @@ class CSVLoader(DestinationAdapter):
             'mode': mode,
             'compression': compression,
             'include_index': include_index,
+            'writer_backend': writer_backend,
+            'batch_size': batch_size,
+            'async_io': async_io,
+            'compresslevel': compresslevel,
             **kwargs
         }
         super().__init__(config)
@@ -53,13 +248,26 @@ class CSVLoader(DestinationAdapter):
         self.encoding = encoding
         self.write_mode = mode
         self.compression = compression
+        self.compresslevel = compresslevel
         self.include_index = include_index
+        self.writer_backend = writer_backend
+        self.batch_size = batch_size
+        self.async_io = async_io
         self.pandas_kwargs = kwargs
 
-        self._batch: List[Dict] = []
+        # Column-oriented (SoA) buffer: column name -> values, one per buffered row
+        self._batch: Dict[str, List[Any]] = {}
+        self._batch_rows = 0
         self._temp_file: Optional[Path] = None
+        self._temp_has_data = False
         self._schema: Optional[Schema] = None
         self._header_written = False
+        self._async_writer: Optional[_AsyncFileWriter] = None
+
+        # Derived from the schema once in create_schema
+        self._schema_col_order: tuple = ()
+        self._schema_col_set: frozenset = frozenset()
+        self._unquoted_columns: frozenset = frozenset()
 
     def connect(self) -> None:
         """Establish connection (validate/create output directory)"""
@@ -78,10 +286,12 @@ class CSVLoader(DestinationAdapter):
 
             # Create temporary file for transaction support
             temp_dir = self.file_path.parent
-            self._temp_file = Path(tempfile.mktemp(
-                suffix='.csv.tmp',
-                dir=str(temp_dir)
-            ))
+            if self._temp_file is None:
+                self._temp_file = create_temp_file(temp_dir, '.csv.tmp')
+            self._temp_has_data = False
+
+            if self.async_io and self._async_writer is None:
+                self._async_writer = _AsyncFileWriter()
 
             self._connected = True
             self.logger.info(f"CSV loader connected")
@@ -104,6 +314,11 @@ class CSVLoader(DestinationAdapter):
 
         try:
             self._schema = schema
+            self._schema_col_order = tuple(f.name for f in schema.fields)
+            self._schema_col_set = frozenset(self._schema_col_order)
+            self._unquoted_columns = frozenset(
+                f.name for f in schema.fields if f.type in _UNQUOTED_FIELD_TYPES
+            )
             self.logger.info(f"Schema set with {len(schema.fields)} columns")
 
         except Exception as e:
@@ -126,127 +341,265 @@ class CSVLoader(DestinationAdapter):
             raise WriteError("Not connected. Call connect() first.")
 
         count = 0
-        batch_size = self.config.get('batch_size', 1000)
+        batch_size = self.batch_size
 
         try:
             for record in records:
-                self._batch.append(record.data)
+                if batch_size is None:
+                    batch_size = self.batch_size = self._estimate_batch_size(record.data)
+
+                self._buffer_row(record.data)
                 count += 1
 
                 # Write batch when it reaches batch_size
-                if len(self._batch) >= batch_size:
+                if self._batch_rows >= batch_size:
                     self._flush_batch()
 
             # Write remaining records
-            if self._batch:
+            if self._batch_rows:
                 self._flush_batch()
 
+            # Make sure queued batches have reached disk before returning
+            if self._async_writer:
+                self._async_writer.flush()
+
             self.logger.info(f"Wrote {count} records to CSV batch")
             return count
 
         except Exception as e:
             raise WriteError(f"Failed to write records: {e}")
 
+    def _estimate_batch_size(self, data: Dict[str, Any]) -> int:
+        """
+        Size batches so each flush writes roughly TARGET_BATCH_BYTES
+
+        Args:
+            data: Sample record used to estimate the serialized row width
+
+        Returns:
+            int: Number of records per batch
+        """
+        row_bytes = len(self.delimiter.join(map(str, data.values())).encode(self.encoding)) + 1
+        batch_size = min(MAX_BATCH_SIZE, max(MIN_BATCH_SIZE, TARGET_BATCH_BYTES // row_bytes))
+
+        self.logger.debug(f"Auto-tuned batch size to {batch_size} (~{row_bytes} bytes/row)")
+        return batch_size
+
+    def _buffer_row(self, data: Dict[str, Any]) -> None:
+        """
+        Append a record to the column-oriented batch buffer
+
+        Columns first seen mid-batch are back-filled with None, and columns
+        missing from this record are padded with None, so every column list
+        always holds exactly one value per buffered row.
+        """
+        batch = self._batch
+        rows = self._batch_rows
+
+        for key, value in data.items():
+            column = batch.get(key)
+            if column is None:
+                column = batch[key] = [None] * rows
+            column.append(value)
+
+        rows += 1
+        self._batch_rows = rows
+
+        # Record did not carry every buffered column - pad the short ones
+        if len(data) != len(batch):
+            for column in batch.values():
+                if len(column) < rows:
+                    column.append(None)
+
+    def _reset_batch(self) -> None:
+        """Clear the batch buffer"""
+        self._batch = {}
+        self._batch_rows = 0
+
     def _flush_batch(self) -> None:
         """Flush current batch to CSV file"""
-        if not self._batch:
+        if not self._batch_rows:
             return
 
         try:
-            # Convert batch to DataFrame
-            df = pd.DataFrame(self._batch)
-
-            # Determine column order from schema if available
-            # NOTE: Only use schema for column ordering if all columns match
-            # Don't drop extra columns (e.g., metadata columns added by transformers)
-            if self._schema:
-                schema_columns = [field.name for field in self._schema.fields]
-                # Only reorder if no extra columns exist
-                df_columns = list(df.columns)
-                extra_columns = [c for c in df_columns if c not in schema_columns]
-
-                if not extra_columns:
-                    # Exact match - use schema order
-                    df = df.reindex(columns=schema_columns)
-                else:
-                    # Extra columns exist (e.g., metadata) - preserve all columns
-                    # Put schema columns first, then extra columns
-                    ordered_columns = [c for c in schema_columns if c in df_columns] + extra_columns
-                    df = df[ordered_columns]
+            # Buffer keys are the union of record keys, in first-seen order
+            columns = column_order(list(self._batch), self._schema_col_order, self._schema_col_set)
 
             # Determine write mode
             if self._transaction_active:
                 # During transaction, write to temp file
                 output_file = self._temp_file
                 write_header = not self._header_written
-                file_mode = 'a' if self._header_written else 'w'
+                file_mode = 'a' if self._temp_has_data else 'w'
+                self._temp_has_data = True
             else:
                 # Not in transaction, write directly
                 output_file = self.file_path
-                if self.write_mode == 'append' and self.file_path.exists():
+                # Later batches of this run append after the first one
+                if self._header_written or (self.write_mode == 'append' and self.file_path.exists()):
                     write_header = False
                     file_mode = 'a'
                 else:
                     write_header = True
                     file_mode = 'w'
 
-            # Write to CSV
-            df.to_csv(
-                output_file,
-                sep=self.delimiter,
-                encoding=self.encoding,
-                mode=file_mode,
-                header=write_header,
-                index=self.include_index,
-                compression=self.compression,
-                **self.pandas_kwargs
-            )
+            if self.compression in _STREAM_COMPRESSORS or self.compression is None:
+                payload = self._encode_batch(columns, write_header)
+                if self._async_writer:
+                    self._async_writer.submit(output_file, file_mode, payload)
+                else:
+                    with open(output_file, file_mode + 'b') as fh:
+                        fh.write(payload)
+            else:
+                # Formats only pandas can produce (e.g. zip) go through to_csv
+                self._write_pandas(output_file, file_mode, columns, write_header)
 
+            batch_len = self._batch_rows
             self._header_written = True
-            self._batch = []
+            self._reset_batch()
 
-            self.logger.debug(f"Flushed batch of {len(df)} records to {output_file}")
+            self.logger.debug(f"Flushed batch of {batch_len} records to {output_file}")
 
         except Exception as e:
             raise WriteError(f"Failed to flush batch: {e}")
 
+    def _write_pandas(
+        self, output_file: Path, file_mode: str, columns: List[str], write_header: bool
+    ) -> None:
+        """Write the current batch with DataFrame.to_csv"""
+        df = pd.DataFrame(self._batch, copy=False).reindex(columns=columns)
+
+        df.to_csv(
+            output_file,
+            sep=self.delimiter,
+            encoding=self.encoding,
+            mode=file_mode,
+            header=write_header,
+            index=self.include_index,
+            compression=self.compression,
+            **self.pandas_kwargs
+        )
+
+    def _encode_batch(self, columns: List[str], write_header: bool) -> bytes:
+        """Serialize the current batch to (optionally compressed) CSV bytes"""
+        if self.writer_backend == 'pyarrow':
+            payload = self._encode_pyarrow(columns, write_header)
+        elif self.writer_backend == 'python':
+            payload = self._encode_python(columns, write_header)
+        else:
+            payload = self._encode_pandas(columns, write_header)
+
+        compress = _STREAM_COMPRESSORS.get(self.compression)
+        return compress(payload, self.compresslevel) if compress else payload
+
+    def _encode_pandas(self, columns: List[str], write_header: bool) -> bytes:
+        """Serialize the current batch with DataFrame.to_csv"""
+        df = pd.DataFrame(self._batch, copy=False).reindex(columns=columns)
+
+        text = df.to_csv(
+            None,
+            sep=self.delimiter,
+            header=write_header,
+            index=self.include_index,
+            **self.pandas_kwargs
+        )
+        return text.encode(self.encoding)
+
+    def _encode_python(self, columns: List[str], write_header: bool) -> bytes:
+        """Serialize the current batch with the stdlib csv module"""
+        missing = [None] * self._batch_rows
+        column_values = [self._batch.get(c, missing) for c in columns]
+
+        buffer = io.StringIO(newline='')
+        writer = csv.writer(
+            buffer,
+            delimiter=self.delimiter,
+            quoting=csv.QUOTE_MINIMAL,
+            lineterminator='\n'
+        )
+        if write_header:
+            writer.writerow(columns)
+
+        if self._is_unquoted_batch(columns, column_values):
+            # Every cell is a number/bool/null - nothing can need quoting, so
+            # skip csv.writer's per-character scan and join the fields directly
+            join = self.delimiter.join
+            buffer.writelines(
+                join(['' if v is None or v != v else str(v) for v in row]) + '\n'
+                for row in zip(*column_values)
+            )
+        else:
+            # None, NaN and pd.NA are written as empty fields, matching
+            # pandas (pd.NA is tested first - its != is not a bool)
+            writer.writerows(
+                [None if v is pd.NA or v != v else v for v in row]
+                for row in zip(*column_values)
+            )
+        return buffer.getvalue().encode(self.encoding)
+
+    def _is_unquoted_batch(self, columns: List[str], column_values: List[List[Any]]) -> bool:
+        """
+        Check whether a batch can bypass csv quoting entirely
+
+        Columns come from the schema's numeric/boolean fields; the values are
+        still type-checked (one pass over distinct types) so a mistyped schema
+        can never produce malformed CSV.
+        """
+        if self.delimiter in _NUMERIC_CHARS:
+            return False
+        if not all(c in self._unquoted_columns for c in columns):
+            return False
+        return all(
+            t is type(None) or issubclass(t, (numbers.Number, bool))
+            for values in column_values
+            for t in set(map(type, values))
+        )
+
+    def _encode_pyarrow(self, columns: List[str], write_header: bool) -> bytes:
+        """Serialize the current batch with Arrow's C++ CSV writer"""
+        arrays = [
+            pa.array(self._batch[c], from_pandas=True) if c in self._batch
+            else pa.nulls(self._batch_rows)
+            for c in columns
+        ]
+        table = pa.Table.from_arrays(arrays, names=columns)
+        write_options = pa_csv.WriteOptions(
+            include_header=write_header,
+            delimiter=self.delimiter
+        )
+
+        sink = pa.BufferOutputStream()
+        pa_csv.write_csv(table, sink, write_options=write_options)
+        return sink.getvalue().to_pybytes()
+
     def begin_transaction(self) -> None:
         """Begin transaction"""
         super().begin_transaction()
-        self._header_written = False  # Reset for transaction
+        # Temp file only carries a header if it will become the whole file;
+        # when appending to an existing CSV it is spliced on verbatim
+        self._header_written = self.write_mode == 'append' and self.file_path.exists()
 
     def commit(self) -> None:
         """Commit transaction - finalize the file"""
         if self._transaction_active:
             try:
                 # Flush any remaining batch
-                if self._batch:
+                if self._batch_rows:
                     self._flush_batch()
+                if self._async_writer:
+                    self._async_writer.flush()
 
                 # Move temp file to final location
-                if self._temp_file and self._temp_file.exists():
+                if self._temp_has_data:
                     # If appending and target exists, append temp to target
                     if self.write_mode == 'append' and self.file_path.exists():
-                        # Read temp file and append to target
-                        temp_df = pd.read_csv(
-                            self._temp_file,
-                            sep=self.delimiter,
-                            encoding=self.encoding
-                        )
-                        temp_df.to_csv(
-                            self.file_path,
-                            sep=self.delimiter,
-                            encoding=self.encoding,
-                            mode='a',
-                            header=False,
-                            index=self.include_index,
-                            compression=self.compression
-                        )
-                        # Remove temp file
+                        # Temp holds header-less rows - splice them onto the target
+                        self._append_file(self._temp_file, self.file_path)
                         self._temp_file.unlink()
                     else:
                         # Move temp file to final location
                         shutil.move(str(self._temp_file), str(self.file_path))
+                    self._temp_has_data = False
 
                     self.logger.info(f"Transaction committed, CSV written to {self.file_path}")
 
@@ -257,19 +610,53 @@ class CSVLoader(DestinationAdapter):
 
         super().commit()
 
+    @staticmethod
+    def _append_file(source: Path, target: Path) -> None:
+        """
+        Append the raw bytes of source to target
+
+        Uses os.sendfile on Linux so the copy stays in the kernel; other
+        platforms (or filesystems that reject sendfile) fall back to
+        shutil.copyfileobj.
+        """
+        with open(source, 'rb') as src, open(target, 'ab') as dst:
+            if sys.platform.startswith('linux') and hasattr(os, 'sendfile'):
+                remaining = os.fstat(src.fileno()).st_size
+                offset = 0
+                try:
+                    while remaining > 0:
+                        sent = os.sendfile(dst.fileno(), src.fileno(), offset, remaining)
+                        if sent == 0:
+                            break
+                        offset += sent
+                        remaining -= sent
+                    return
+                except OSError:
+                    if offset:
+                        raise
+            shutil.copyfileobj(src, dst, 1024 * 1024)
+
     def rollback(self) -> None:
         """Rollback transaction - discard temp file"""
         if self._transaction_active:
+            # Let the background writer finish with the temp file first
+            if self._async_writer:
+                try:
+                    self._async_writer.flush()
+                except Exception as e:
+                    self.logger.warning(f"Discarding failed async write: {e}")
+
             # Delete temp file
-            if self._temp_file and self._temp_file.exists():
+            if self._temp_has_data:
                 try:
-                    self._temp_file.unlink()
+                    self._temp_file.unlink(missing_ok=True)
                     self.logger.debug("Temp file deleted (rollback)")
                 except Exception as e:
                     self.logger.warning(f"Failed to delete temp file: {e}")
+                self._temp_has_data = False
 
             # Clear batch
-            self._batch = []
+            self._reset_batch()
             self._header_written = False
 
             self.logger.debug("Transaction rolled back")
@@ -279,18 +666,28 @@ class CSVLoader(DestinationAdapter):
     def close(self) -> None:
         """Close and cleanup"""
         # If not in transaction, flush any remaining batch
-        if not self._transaction_active and self._batch:
+        if not self._transaction_active and self._batch_rows:
             try:
                 self._flush_batch()
             except Exception as e:
                 self.logger.error(f"Error during final flush: {e}")
 
-        # Clean up temp file if exists
-        if self._temp_file and self._temp_file.exists():
+        # Stop the background writer (drains anything still queued)
+        if self._async_writer:
+            try:
+                self._async_writer.close()
+            except Exception as e:
+                self.logger.error(f"Error during async write: {e}")
+            self._async_writer = None
+
+        # Clean up temp file (created empty in connect, may already be moved)
+        if self._temp_file:
             try:
-                self._temp_file.unlink()
+                self._temp_file.unlink(missing_ok=True)
             except Exception as e:
                 self.logger.warning(f"Failed to cleanup temp file: {e}")
+            self._temp_file = None
+            self._temp_has_data = False
 
         self._connected = False
         self.logger.info("CSV loader closed")
@@ -1,19 +1,134 @@
 """
 JSON destination adapter for writing data to JSON/JSONL files
 """
+import codecs
 import json
+from concurrent.futures import ProcessPoolExecutor
+from json.encoder import encode_basestring
 from pathlib import Path
-from typing import Any, Dict, Iterator, List, Optional
+from typing import Any, Callable, Dict, Iterator, List, Optional
 import tempfile
 import shutil
 import gzip
 import bz2
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+try:
+    import zstandard
+    HAS_ZSTANDARD = True
+except ImportError:
+    HAS_ZSTANDARD = False
+
 from src.adapters.base import DestinationAdapter
+from src.adapters.destinations._batching import fill_batch
 from src.common.models import Field, FieldType, Record, Schema
 from src.common.exceptions import ConnectionError, SchemaError, WriteError
 
 
+# orjson options: numpy scalars (pandas-backed sources) and non-string keys,
+# which json.dumps also accepted
+_ORJSON_OPTIONS = (orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS) if HAS_ORJSON else 0
+
+# Output file buffer; batches smaller than this are coalesced into fewer write() calls
+WRITE_BUFFER_SIZE = 1 << 20
+
+# Smallest batch worth shipping to encode_workers processes; below this the
+# pickling round-trip costs more than the encoding it parallelizes
+PARALLEL_ENCODE_MIN_RECORDS = 10_000
+
+# Shared stdlib encoder - json.dumps builds a new one per call whenever
+# non-default options are passed
+_JSON_ENCODER = json.JSONEncoder(ensure_ascii=False)
+
+# Field types the generated record encoders format inline:
+# exact Python type -> f-string replacement field for a value
+_INLINE_FORMATS = {
+    FieldType.STRING: (str, '{_str(%s)}'),
+    FieldType.INTEGER: (int, '{_int(%s)}'),
+    FieldType.BOOLEAN: (bool, '{_bool[%s]}'),
+}
+
+
+def _encode_chunk(records: List[Dict], separator: bytes, use_orjson: bool, encoding: str) -> bytes:
+    """Encode a slice of records in a worker process (compact output only)"""
+    if use_orjson:
+        return separator.join(orjson.dumps(r, option=_ORJSON_OPTIONS) for r in records)
+    return separator.join(_JSON_ENCODER.encode(r).encode(encoding) for r in records)
+
+
+def _compile_record_encoder(
+    fields: List[Field],
+    encoding: str,
+    fallback: Callable[[Dict], bytes]
+) -> Callable[[Dict], bytes]:
+    """
+    Generate a record encoder specialized for a schema
+
+    The generated function formats records whose keys match the schema
+    (same names, same order) with straight-line code: no per-key dict
+    iteration and no per-value type dispatch. Output is identical to
+    json.dumps(record, ensure_ascii=False). Records of any other shape or
+    with unexpected value types go to ``fallback``.
+
+    Args:
+        fields: Schema fields, in record key order
+        encoding: Output encoding
+        fallback: Generic encoder for records the fast path cannot handle
+
+    Returns:
+        Function encoding one record dict to bytes
+    """
+    namespace = {
+        '_names': tuple(field.name for field in fields),
+        '_str': encode_basestring,
+        '_int': int.__repr__,
+        '_bool': ('false', 'true'),
+        '_float': float.__repr__,
+        '_any': _JSON_ENCODER.encode,
+        '_fallback': fallback,
+        '_encoding': encoding,
+    }
+
+    values = ', '.join(f'v{i}' for i in range(len(fields)))
+    guards = []
+    parts = []
+    for i, field in enumerate(fields):
+        # Key text (with separators) is a constant looked up from the namespace
+        namespace[f'_k{i}'] = ('{' if i == 0 else ', ') + encode_basestring(field.name) + ': '
+        parts.append(f'{{_k{i}}}')
+
+        if field.type in _INLINE_FORMATS:
+            py_type, fmt = _INLINE_FORMATS[field.type]
+            namespace[f'_t{i}'] = py_type
+            guards.append(f'type(v{i}) is _t{i}')
+            parts.append(fmt % f'v{i}')
+        elif field.type == FieldType.FLOAT and not field.nullable:
+            # Finite floats only (v - v is NaN for NaN/inf, which json
+            # spells differently from repr)
+            guards.append(f'type(v{i}) is float and v{i} - v{i} == 0.0')
+            parts.append(f'{{_float(v{i})}}')
+        else:
+            parts.append(f'{{_any(v{i})}}')
+
+    # Closing brace is doubled because the template is itself an f-string
+    template = "f'" + ''.join(parts) + "}}'"
+    source = (
+        'def encode_record(r):\n'
+        '    if tuple(r) == _names:\n'
+        f'        {values}, = r.values()\n'
+        f'        if {" and ".join(guards) or "True"}:\n'
+        f'            return {template}.encode(_encoding)\n'
+        '    return _fallback(r)\n'
+    )
+    exec(compile(source, '<json record encoder>', 'exec'), namespace)
+    return namespace['encode_record']
+
+
 class JSONLoader(DestinationAdapter):
     """Destination adapter for JSON and JSONL files"""
 
@@ -24,8 +139,10 @@ class JSONLoader(DestinationAdapter):
         encoding: str = "utf-8",
         pretty: bool = False,  # Pretty print JSON (only for 'array' mode)
         indent: int = 2,  # Indentation for pretty printing
-        compression: Optional[str] = None,  # None, 'gzip', 'bz2'
+        compression: Optional[str] = None,  # None, 'gzip', 'bz2', 'zstd'
         export_schema: bool = False,  # Export schema to .schema.json file
+        compresslevel: int = 3,  # Compression level (speed over ratio)
+        encode_workers: int = 1,  # Processes encoding large batches
         **kwargs
     ):
         """
@@ -39,8 +156,14 @@ class JSONLoader(DestinationAdapter):
             encoding: File encoding (default: 'utf-8')
             pretty: Pretty print JSON (array mode only, default: False)
             indent: Indentation level for pretty printing (default: 2)
-            compression: Compression format (None, 'gzip', 'bz2')
+            compression: Compression format (None, 'gzip', 'bz2', 'zstd')
             export_schema: Export schema to separate .schema.json file
+            compresslevel: Compression level (default: 3; gzip/bz2 default
+                to 9, which is several times slower for a small size gain)
+            encode_workers: Worker processes for encoding batches of at
+                least PARALLEL_ENCODE_MIN_RECORDS records (default: 1, off).
+                Pays off with the stdlib json fallback and a large
+                batch_size; not used for pretty output
             **kwargs: Additional configuration
         """
         config = {
@@ -51,6 +174,8 @@ class JSONLoader(DestinationAdapter):
             'indent': indent,
             'compression': compression,
             'export_schema': export_schema,
+            'compresslevel': compresslevel,
+            'encode_workers': encode_workers,
             **kwargs
         }
         super().__init__(config)
@@ -62,20 +187,49 @@ class JSONLoader(DestinationAdapter):
         self.indent = indent
         self.compression = compression
         self.export_schema = export_schema
+        self.compresslevel = compresslevel
+        self.encode_workers = encode_workers
 
         # Validate mode
         if mode not in ['array', 'lines']:
             raise ValueError(f"Invalid mode: {mode}. Must be 'array' or 'lines'")
 
-        self._batch: List[Dict] = []
+        if encode_workers < 1:
+            raise ValueError(f"encode_workers must be at least 1, got {encode_workers}")
+
+        if compression == 'zstd' and not HAS_ZSTANDARD:
+            raise ImportError(
+                "zstandard is required for zstd compression. "
+                "Install it with: pip install zstandard"
+            )
+
+        # orjson emits UTF-8 bytes directly; other encodings use stdlib json
+        self._use_orjson = HAS_ORJSON and codecs.lookup(encoding).name == 'utf-8'
+
+        # Per-record encoder; replaced by a schema-specialized one when the
+        # stdlib json fallback is in use (see create_schema)
+        self._encode_record: Callable[[Dict], bytes] = self._dumps
+
+        self._batch: List[Dict] = []  # Records awaiting encoding (array mode or encode_workers)
+        self._encode_pool: Optional[ProcessPoolExecutor] = None  # Started on first large batch
+        # Encoded output awaiting write; one buffer reused for the whole load
+        # (lines mode encodes records into it as they arrive)
+        self._write_buf = bytearray()
         self._schema: Optional[Schema] = None
-        self._file_handle = None
+        self._file_handle = None  # Kept open across flushes
+        self._file_started = False  # Output truncated once per connection
+        self._array_items = 0  # Records already streamed into the open JSON array
+
+        # Array-mode framing; pretty output nests each record one indent level
+        self._item_indent = b' ' * indent if pretty else b''
+        self._item_separator = b',\n' if pretty else b','
 
     def connect(self) -> None:
         """Establish connection (validate/create output directory)"""
         try:
             # Create parent directory if it doesn't exist
             self.file_path.parent.mkdir(parents=True, exist_ok=True)
+            self._file_started = False
 
             self._connected = True
             self.logger.info(f"JSON loader connected, will write to: {self.file_path}")
@@ -98,6 +252,13 @@ class JSONLoader(DestinationAdapter):
 
         try:
             self._schema = schema
+
+            # orjson outpaces generated Python; specialize only the stdlib path
+            if not self._use_orjson and schema.fields:
+                self._encode_record = _compile_record_encoder(
+                    schema.fields, self.encoding, self._dumps
+                )
+
             self.logger.info(f"Schema set with {len(schema.fields)} fields")
 
         except Exception as e:
@@ -120,19 +281,15 @@ class JSONLoader(DestinationAdapter):
             raise WriteError("Not connected. Call connect() first.")
 
         count = 0
+        batch_size = self.config.get('batch_size', 1000)
 
         try:
-            # For array mode, buffer all records
-            # For lines mode, can write incrementally
-            for record in records:
-                self._batch.append(record.data)
-                count += 1
-
-                # For JSONL mode, write incrementally to save memory
-                if self.mode == 'lines':
-                    batch_size = self.config.get('batch_size', 1000)
-                    if len(self._batch) >= batch_size:
-                        self._flush_jsonl_batch()
+            # Both modes stream to the file, so memory stays bounded
+            # regardless of output size
+            if self.mode == 'lines' and self.encode_workers == 1:
+                count = self._write_lines(records)
+            else:
+                count = self._buffer_records(records, batch_size)
 
             self.logger.info(f"Buffered {count} records for JSON output")
             return count
@@ -140,77 +297,206 @@ class JSONLoader(DestinationAdapter):
         except Exception as e:
             raise WriteError(f"Failed to write records: {e}")
 
-    def _flush_jsonl_batch(self) -> None:
-        """Flush batch for JSONL mode (incremental writing)"""
-        if not self._batch:
+    def _write_lines(self, records: Iterator[Record]) -> int:
+        """
+        Encode JSONL records as they arrive into the pending output buffer
+
+        Records are serialized straight into one bytearray (no intermediate
+        list of dicts), which is written out each time it reaches
+        WRITE_BUFFER_SIZE.
+
+        Args:
+            records: Iterator of records to write
+
+        Returns:
+            int: Number of records encoded
+        """
+        encode = self._encode_record
+        buffer = self._write_buf
+        count = 0
+
+        for record in records:
+            buffer += encode(record.data)
+            buffer += b'\n'
+            count += 1
+
+            if len(buffer) >= WRITE_BUFFER_SIZE:
+                self._flush_batch()
+
+        return count
+
+    def _buffer_records(self, records: Iterator[Record], batch_size: int) -> int:
+        """
+        Buffer records for batch encoding, flushing every batch_size records
+
+        Args:
+            records: Iterator of records to write
+            batch_size: Records per flush
+
+        Returns:
+            int: Number of records buffered
+        """
+        count = 0
+
+        records = iter(records)
+        while True:
+            count += fill_batch(self._batch, records, batch_size)
+
+            # A short batch means records ran out; a full one is written
+            if len(self._batch) < batch_size:
+                break
+            self._flush_batch()
+
+        return count
+
+    def _dumps(self, obj: Any) -> bytes:
+        """Serialize one record to compact JSON bytes"""
+        if self._use_orjson:
+            return orjson.dumps(obj, option=_ORJSON_OPTIONS)
+        return _JSON_ENCODER.encode(obj).encode(self.encoding)
+
+    def _dumps_array_item(self, obj: Any) -> bytes:
+        """Serialize one record as an element of the output JSON array"""
+        if not self.pretty:
+            return self._encode_record(obj)
+
+        if self._use_orjson and self.indent == 2:
+            encoded = orjson.dumps(obj, option=_ORJSON_OPTIONS | orjson.OPT_INDENT_2)
+        else:
+            encoded = json.dumps(obj, ensure_ascii=False, indent=self.indent).encode(self.encoding)
+
+        # Strings never contain raw newlines, so this only re-indents structure
+        pad = self._item_indent
+        return pad + encoded.replace(b'\n', b'\n' + pad)
+
+    def _open_output(self) -> None:
+        """Open the output handle once and reuse it across flushes"""
+        if self._file_handle is not None:
             return
 
-        try:
-            # Open file in append mode
-            file_handle = self._get_file_handle('a')
+        # JSONL keeps appending after the first truncation; an array is
+        # always rewritten as a whole document
+        append = self.mode == 'lines' and self._file_started
+        self._file_handle = self._get_file_handle('a' if append else 'w')
+        self._file_started = True
+        self._array_items = 0
 
-            for record in self._batch:
-                json_line = json.dumps(record, ensure_ascii=False)
-                file_handle.write(json_line + '\n')
+    def _flush_batch(self) -> None:
+        """Write pending output: encoded JSONL lines, or the buffered array records"""
+        if not (self._batch or self._write_buf):
+            return
 
-            file_handle.close()
+        try:
+            self._open_output()
+
+            # Hand the whole batch to the OS in a single write
+            buffer = self._write_buf
+            if self.mode == 'array':
+                if self._array_items == 0:
+                    buffer += b'[\n' if self.pretty else b'['
+                else:
+                    buffer += self._item_separator
+                buffer += self._encode_batch(self._batch, self._item_separator)
+                self._array_items += len(self._batch)
+            elif self._batch:
+                buffer += self._encode_batch(self._batch, b'\n')
+                buffer += b'\n'
             self._batch = []
 
-            self.logger.debug(f"Flushed JSONL batch")
+            self._file_handle.write(buffer)
+            buffer.clear()
+
+            self.logger.debug(f"Flushed JSON batch")
 
         except Exception as e:
-            raise WriteError(f"Failed to flush JSONL batch: {e}")
+            raise WriteError(f"Failed to flush JSON batch: {e}")
+
+    def _encode_batch(self, records: List[Dict], separator: bytes) -> bytes:
+        """
+        Encode buffered records joined by separator
+
+        Large batches are split across encode_workers processes; the
+        workers produce the same bytes as the in-process encoders.
+
+        Args:
+            records: Record dicts to encode
+            separator: Bytes placed between encoded records
+
+        Returns:
+            bytes: Encoded records
+        """
+        pretty = self.pretty and self.mode == 'array'
+        if self.encode_workers == 1 or pretty or len(records) < PARALLEL_ENCODE_MIN_RECORDS:
+            encode = self._dumps_array_item if self.mode == 'array' else self._encode_record
+            return separator.join(map(encode, records))
+
+        if self._encode_pool is None:
+            self._encode_pool = ProcessPoolExecutor(max_workers=self.encode_workers)
+
+        chunk_size = -(-len(records) // self.encode_workers)
+        chunks = [records[i:i + chunk_size] for i in range(0, len(records), chunk_size)]
+        encoded = self._encode_pool.map(
+            _encode_chunk,
+            chunks,
+            [separator] * len(chunks),
+            [self._use_orjson] * len(chunks),
+            [self.encoding] * len(chunks)
+        )
+        return separator.join(encoded)
+
+    def _shutdown_encode_pool(self) -> None:
+        """Stop the encode_workers processes, if started"""
+        if self._encode_pool is not None:
+            self._encode_pool.shutdown()
+            self._encode_pool = None
 
     def _get_file_handle(self, mode: str):
         """
-        Get appropriate file handle based on compression
+        Get appropriate binary file handle based on compression
 
         Args:
             mode: File open mode ('w', 'a', etc.)
 
         Returns:
-            File handle
+            Binary file handle (records are already encoded to bytes)
         """
         if self.compression == 'gzip':
-            return gzip.open(self.file_path, mode + 't', encoding=self.encoding)
+            return gzip.open(self.file_path, mode + 'b', compresslevel=self.compresslevel)
         elif self.compression == 'bz2':
-            return bz2.open(self.file_path, mode + 't', encoding=self.encoding)
+            return bz2.open(self.file_path, mode + 'b', compresslevel=self.compresslevel)
+        elif self.compression == 'zstd':
+            compressor = zstandard.ZstdCompressor(level=self.compresslevel)
+            return compressor.stream_writer(
+                open(self.file_path, mode + 'b', buffering=WRITE_BUFFER_SIZE)
+            )
         else:
-            return open(self.file_path, mode, encoding=self.encoding)
+            return open(self.file_path, mode + 'b', buffering=WRITE_BUFFER_SIZE)
 
-    def _write_array_mode(self) -> None:
-        """Write all records as JSON array"""
-        try:
-            file_handle = self._get_file_handle('w')
-
-            if self.pretty:
-                json.dump(
-                    self._batch,
-                    file_handle,
-                    ensure_ascii=False,
-                    indent=self.indent
-                )
-            else:
-                json.dump(self._batch, file_handle, ensure_ascii=False)
-
-            file_handle.close()
-
-            self.logger.info(f"Wrote {len(self._batch)} records to JSON array")
+    def _close_file_handle(self) -> None:
+        """Close the persistent output handle, if open"""
+        if self._file_handle is not None:
+            try:
+                self._file_handle.close()
+            finally:
+                self._file_handle = None
 
-        except Exception as e:
-            raise WriteError(f"Failed to write JSON array: {e}")
+    def _finish_output(self) -> None:
+        """Flush remaining records, terminate the JSON array and close the file"""
+        try:
+            self._flush_batch()
 
-    def _write_lines_mode(self) -> None:
-        """Write remaining records as JSONL"""
-        if not self._batch:
-            return
+            if self.mode == 'array':
+                self._open_output()
+                if self._array_items == 0:
+                    self._file_handle.write(b'[]')
+                else:
+                    self._file_handle.write(b'\n]' if self.pretty else b']')
+                self.logger.info(f"Wrote {self._array_items} records to JSON array")
 
-        try:
-            # If there are remaining records, flush them
-            self._flush_jsonl_batch()
+            self._close_file_handle()
 
         except Exception as e:
-            raise WriteError(f"Failed to write JSONL: {e}")
+            raise WriteError(f"Failed to write JSON output: {e}")
 
     def _export_schema_file(self) -> None:
         """Export schema to separate .schema.json file"""
@@ -239,8 +525,11 @@ class JSONLoader(DestinationAdapter):
                 'primary_key': self._schema.primary_key
             }
 
-            with open(schema_path, 'w', encoding='utf-8') as f:
-                json.dump(schema_dict, f, indent=2, ensure_ascii=False)
+            if HAS_ORJSON:
+                schema_path.write_bytes(orjson.dumps(schema_dict, option=orjson.OPT_INDENT_2))
+            else:
+                with open(schema_path, 'w', encoding='utf-8') as f:
+                    json.dump(schema_dict, f, indent=2, ensure_ascii=False)
 
             self.logger.info(f"Schema exported to {schema_path}")
 
@@ -255,11 +544,8 @@ class JSONLoader(DestinationAdapter):
         """Commit transaction - write buffered records to file"""
         if self._transaction_active:
             try:
-                # Write based on mode
-                if self.mode == 'array':
-                    self._write_array_mode()
-                elif self.mode == 'lines':
-                    self._write_lines_mode()
+                # Write remaining records and finalize the file
+                self._finish_output()
 
                 # Export schema if requested
                 if self.export_schema and self._schema:
@@ -267,6 +553,7 @@ class JSONLoader(DestinationAdapter):
 
                 # Clear batch
                 self._batch = []
+                self._write_buf.clear()
 
                 self.logger.info(f"Transaction committed, JSON written to {self.file_path}")
 
@@ -282,6 +569,12 @@ class JSONLoader(DestinationAdapter):
         if self._transaction_active:
             # Clear batch
             self._batch = []
+            self._write_buf.clear()
+
+            try:
+                self._close_file_handle()
+            except Exception as e:
+                self.logger.warning(f"Failed to close output file: {e}")
 
             # Delete output file if it exists (for JSONL partial writes)
             if self.file_path.exists():
@@ -297,13 +590,22 @@ class JSONLoader(DestinationAdapter):
 
     def close(self) -> None:
         """Close and cleanup"""
-        # If not in transaction and there's data, this is an error
-        # (should have been committed)
-        if not self._transaction_active and self._batch:
-            self.logger.warning(
-                f"{len(self._batch)} records in buffer were not written "
-                "(commit was not called)"
-            )
+        # Outside a transaction, records were streamed as they arrived -
+        # finish the file so it is complete (e.g. closing JSON array)
+        if not self._transaction_active and (
+            self._batch or self._write_buf or self._file_handle is not None
+        ):
+            try:
+                self._finish_output()
+            except Exception as e:
+                self.logger.error(f"Error during final flush: {e}")
+
+        try:
+            self._close_file_handle()
+        except Exception as e:
+            self.logger.warning(f"Failed to close output file: {e}")
+
+        self._shutdown_encode_pool()
 
         self._connected = False
         self.logger.info("JSON loader closed")
@@ -1,17 +1,60 @@
 """
 Parquet destination adapter for writing data to Parquet files
 """
+import os
 import pandas as pd
+import pyarrow as pa
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
 from pathlib import Path
-from typing import Any, Dict, Iterator, List, Optional
-import tempfile
-import shutil
+from typing import Any, Callable, Dict, Iterator, List, Optional
+import uuid
 
 from src.adapters.base import DestinationAdapter
+from src.adapters.destinations._batching import column_order, fill_batch
+from src.adapters.destinations._files import create_temp_file
 from src.common.models import Field, FieldType, Record, Schema
 from src.common.exceptions import ConnectionError, SchemaError, WriteError
 
 
+# Arrow storage type for each schema field type (JSON and ARRAY are inferred)
+ARROW_TYPES = {
+    FieldType.STRING: pa.string(),
+    FieldType.INTEGER: pa.int64(),
+    FieldType.FLOAT: pa.float64(),
+    FieldType.BOOLEAN: pa.bool_(),
+    FieldType.DATE: pa.timestamp('us'),
+    FieldType.DATETIME: pa.timestamp('us'),
+    FieldType.TIMESTAMP: pa.timestamp('us'),
+}
+
+# pandas coercions for columns the arrow cast cannot parse; unparseable
+# values become null
+PANDAS_CASTERS = {
+    FieldType.STRING: lambda s: s.astype('string'),
+    FieldType.INTEGER: lambda s: pd.to_numeric(s, errors='coerce').astype('Int64'),
+    FieldType.FLOAT: lambda s: pd.to_numeric(s, errors='coerce'),
+    FieldType.BOOLEAN: lambda s: s.astype('boolean'),
+    FieldType.DATE: lambda s: pd.to_datetime(s, errors='coerce'),
+    FieldType.DATETIME: lambda s: pd.to_datetime(s, errors='coerce'),
+    FieldType.TIMESTAMP: lambda s: pd.to_datetime(s, errors='coerce'),
+}
+
+# Errors raised when values cannot be converted to the requested arrow type
+_CONVERSION_ERRORS = (pa.ArrowInvalid, pa.ArrowTypeError, TypeError, ValueError, OverflowError)
+
+
+def _widen_type(current: pa.DataType, incoming: pa.DataType) -> pa.DataType:
+    """Pick a column type able to hold values of both types"""
+    if current == incoming or pa.types.is_null(incoming):
+        return current
+    if pa.types.is_null(current):
+        return incoming
+    if pa.types.is_integer(current) and pa.types.is_floating(incoming):
+        return incoming
+    return current
+
+
 class ParquetLoader(DestinationAdapter):
     """Destination adapter for Parquet files"""
 
@@ -33,7 +76,8 @@ class ParquetLoader(DestinationAdapter):
             mode: Write mode - 'overwrite' (default) or 'append'
             partition_cols: Columns to partition by (for directory partitioning)
             row_group_size: Number of rows per row group
-            **kwargs: Additional pandas to_parquet parameters
+            **kwargs: Additional pyarrow ParquetWriter parameters
+                (batch_size sets the number of records per flush)
         """
         config = {
             'file_path': file_path,
@@ -50,11 +94,21 @@ class ParquetLoader(DestinationAdapter):
         self.write_mode = mode
         self.partition_cols = partition_cols
         self.row_group_size = row_group_size
-        self.pandas_kwargs = kwargs
+        self.writer_kwargs = {k: v for k, v in kwargs.items() if k != 'batch_size'}
 
         self._batch: List[Dict] = []
         self._temp_file: Optional[Path] = None
+        self._temp_has_data = False  # Writer has been opened on the temp file
         self._schema: Optional[Schema] = None
+        self._schema_col_order: tuple = ()
+        self._schema_col_set: frozenset = frozenset()
+        self._arrow_types: Dict[str, pa.DataType] = {}
+        self._type_casters: Dict[str, Callable[[pd.Series], pd.Series]] = {}
+        self._target_schemas: Dict[pa.Schema, pa.Schema] = {}  # Inferred -> cast target
+
+        # Single writer kept open across flushes; each flush adds row groups
+        self._writer: Optional[pq.ParquetWriter] = None
+        self._writer_schema: Optional[pa.Schema] = None
 
     def connect(self) -> None:
         """Establish connection (validate/create output directory)"""
@@ -71,11 +125,9 @@ class ParquetLoader(DestinationAdapter):
                 self.logger.info(f"Will write Parquet to: {self.file_path}")
 
             # Create temporary file for transaction support
-            temp_dir = self.file_path.parent
-            self._temp_file = Path(tempfile.mktemp(
-                suffix='.parquet.tmp',
-                dir=str(temp_dir)
-            ))
+            if self._temp_file is None:
+                self._temp_file = create_temp_file(self.file_path.parent, '.parquet.tmp')
+            self._temp_has_data = False
 
             self._connected = True
             self.logger.info(f"Parquet loader connected")
@@ -98,6 +150,19 @@ class ParquetLoader(DestinationAdapter):
 
         try:
             self._schema = schema
+            self._schema_col_order = tuple(field.name for field in schema.fields)
+            self._schema_col_set = frozenset(self._schema_col_order)
+            self._arrow_types = {
+                field.name: ARROW_TYPES[field.type]
+                for field in schema.fields
+                if field.type in ARROW_TYPES
+            }
+            self._type_casters = {
+                field.name: PANDAS_CASTERS[field.type]
+                for field in schema.fields
+                if field.type in PANDAS_CASTERS
+            }
+            self._target_schemas = {}
             self.logger.info(f"Schema set with {len(schema.fields)} columns")
 
         except Exception as e:
@@ -123,13 +188,14 @@ class ParquetLoader(DestinationAdapter):
         batch_size = self.config.get('batch_size', 1000)
 
         try:
-            for record in records:
-                self._batch.append(record.data)
-                count += 1
+            records = iter(records)
+            while True:
+                count += fill_batch(self._batch, records, batch_size)
 
-                # Write batch when it reaches batch_size
-                if len(self._batch) >= batch_size:
-                    self._flush_batch()
+                # A short batch means records ran out; a full one is written
+                if len(self._batch) < batch_size:
+                    break
+                self._flush_batch()
 
             # Write remaining records
             if self._batch:
@@ -141,113 +207,286 @@ class ParquetLoader(DestinationAdapter):
         except Exception as e:
             raise WriteError(f"Failed to write records: {e}")
 
+    def _build_table(self, rows: List[Dict]) -> pa.Table:
+        """
+        Convert buffered records into an arrow table with schema types applied
+
+        Columns are built with inferred types and converted to the schema
+        types in a single vectorized cast. The cast is safe: batches holding
+        values it cannot parse or would truncate/overflow (e.g. 1.7 into an
+        INTEGER column) fall back to converting column by column.
+
+        Args:
+            rows: Buffered record dicts
+
+        Returns:
+            Arrow table with schema types applied
+        """
+        columns = column_order(
+            list(dict.fromkeys(k for row in rows for k in row)),
+            self._schema_col_order,
+            self._schema_col_set
+        )
+        values = [[row.get(name) for row in rows] for name in columns]
+
+        try:
+            table = pa.Table.from_arrays(
+                [pa.array(column, from_pandas=True) for column in values],
+                names=columns
+            )
+            target = self._target_schema(table.schema)
+
+            # Batches whose inferred types already match (typed upstream
+            # sources) need no cast at all
+            if table.schema.equals(target):
+                return table
+            return table.cast(target)
+        except _CONVERSION_ERRORS:
+            arrays = [self._column_array(name, column) for name, column in zip(columns, values)]
+            return pa.Table.from_arrays(arrays, names=columns)
+
+    def _target_schema(self, schema: pa.Schema) -> pa.Schema:
+        """Replace inferred types with schema types for declared columns (cached)"""
+        target = self._target_schemas.get(schema)
+        if target is None:
+            arrow_types = self._arrow_types
+            target = pa.schema([
+                field.with_type(arrow_types[field.name]) if field.name in arrow_types else field
+                for field in schema
+            ])
+            self._target_schemas[schema] = target
+        return target
+
+    def _column_array(self, name: str, values: List[Any]) -> pa.Array:
+        """Build one column, casting to the schema type when possible"""
+        target = self._arrow_types.get(name)
+
+        try:
+            array = pa.array(values, from_pandas=True)
+            if target is None or array.type == target:
+                return array
+            return array.cast(target)
+        except _CONVERSION_ERRORS:
+            if target is None:
+                raise
+            # Mixed or unparseable values (e.g. ints and text in one column)
+            return self._coerce_column(name, values, target)
+
+    def _coerce_column(self, name: str, values: List[Any], target: pa.DataType) -> pa.Array:
+        """
+        Coerce a column that does not convert directly to its schema type
+
+        Unparseable values become null, matching the previous pandas behaviour.
+
+        Args:
+            name: Column name
+            values: Raw column values
+            target: Arrow type from the schema
+
+        Returns:
+            Arrow array of the target type, or the inferred type if coercion fails
+        """
+        try:
+            series = self._type_casters[name](pd.Series(values, dtype=object))
+            return pa.Array.from_pandas(series).cast(target)
+
+        except Exception as e:
+            self.logger.warning(f"Failed to convert column {name} to {target}: {e}")
+            return pa.array(values, from_pandas=True)
+
     def _flush_batch(self) -> None:
         """Flush current batch to Parquet file"""
         if not self._batch:
             return
 
         try:
-            # Convert batch to DataFrame
-            df = pd.DataFrame(self._batch)
-
-            # Determine column order from schema if available
-            if self._schema:
-                schema_columns = [field.name for field in self._schema.fields]
-                df_columns = list(df.columns)
-                extra_columns = [c for c in df_columns if c not in schema_columns]
-
-                if not extra_columns:
-                    # Exact match - use schema order
-                    df = df.reindex(columns=schema_columns)
-                else:
-                    # Extra columns exist (e.g., metadata) - preserve all columns
-                    # Put schema columns first, then extra columns
-                    ordered_columns = [c for c in schema_columns if c in df_columns] + extra_columns
-                    df = df[ordered_columns]
-
-            # Apply type conversions based on schema
-            if self._schema:
-                df = self._apply_schema_types(df)
-
-            # Determine output file
-            if self._transaction_active:
-                # During transaction, write to temp file
-                output_file = self._temp_file
-            else:
-                # Not in transaction, write directly
-                output_file = self.file_path
-
-            # Prepare to_parquet kwargs
-            parquet_kwargs = {
-                'compression': self.compression,
-                'index': False,
-                **self.pandas_kwargs
-            }
+            table = self._build_table(self._batch)
 
-            # Add row_group_size if specified
-            if self.row_group_size:
-                parquet_kwargs['row_group_size'] = self.row_group_size
-
-            # Handle append mode
-            if self.write_mode == 'append' and output_file.exists():
-                # For append, read existing and concatenate
-                existing_df = pd.read_parquet(output_file)
-                df = pd.concat([existing_df, df], ignore_index=True)
-
-            # Write to Parquet
             if self.partition_cols:
-                # Partitioned write (creates directory structure)
-                df.to_parquet(
-                    output_file.parent,
-                    partition_cols=self.partition_cols,
-                    **parquet_kwargs
-                )
+                self._write_partitions(table)
             else:
-                # Single file write
-                df.to_parquet(output_file, **parquet_kwargs)
+                # Single file - append row groups to the open writer
+                if self._writer is None:
+                    self._start_output(table.schema)
+                table = self._conform_to_writer(table)
+
+                self._writer.write_table(table, row_group_size=self.row_group_size)
 
             self._batch = []
 
-            self.logger.debug(f"Flushed batch of {len(df)} records to {output_file}")
+            self.logger.debug(f"Flushed batch of {table.num_rows} records to {self._temp_file}")
 
         except Exception as e:
             raise WriteError(f"Failed to flush batch: {e}")
 
-    def _apply_schema_types(self, df: pd.DataFrame) -> pd.DataFrame:
+    def _write_partitions(self, table: pa.Table) -> None:
+        """
+        Write a batch into the hive-partitioned directory tree
+
+        Each flush adds one new uniquely named file per partition it
+        touches; nothing already written is read back or rewritten.
+
+        Args:
+            table: Batch table
+        """
+        file_options = ds.ParquetFileFormat().make_write_options(
+            compression=self.compression or 'none',
+            **self.writer_kwargs
+        )
+        group_options = {}
+        if self.row_group_size:
+            group_options['max_rows_per_group'] = self.row_group_size
+            group_options['min_rows_per_group'] = min(self.row_group_size, table.num_rows)
+
+        ds.write_dataset(
+            table,
+            str(self.file_path.parent),
+            format='parquet',
+            file_options=file_options,
+            partitioning=self.partition_cols,
+            partitioning_flavor='hive',
+            basename_template=f'part-{uuid.uuid4().hex}-{{i}}.parquet',
+            existing_data_behavior='overwrite_or_ignore',
+            **group_options
+        )
+
+    def _start_output(self, schema: pa.Schema) -> None:
+        """
+        Open the writer for the first batch
+
+        When appending to an existing file, its row groups are copied into
+        the temp file as-is, so new batches become further row groups and
+        commit only has to move the file into place.
+
+        Args:
+            schema: Schema of the first batch
+        """
+        if not (self.write_mode == 'append' and self.file_path.exists()):
+            self._open_writer(schema)
+            return
+
+        with pq.ParquetFile(str(self.file_path)) as existing:
+            schema = self._widen_schema(existing.schema_arrow, schema)
+            self._open_writer(schema)
+
+            for i in range(existing.num_row_groups):
+                self._writer.write_table(self._conform_table(existing.read_row_group(i), schema))
+
+            self.logger.debug(f"Copied {existing.metadata.num_rows} existing rows into {self._temp_file}")
+
+    def _open_writer(self, schema: pa.Schema) -> None:
+        """Open the Parquet writer on the temp file"""
+        self._writer = pq.ParquetWriter(
+            str(self._temp_file),
+            schema,
+            compression=self.compression,
+            **self.writer_kwargs
+        )
+        self._writer_schema = schema
+        self._temp_has_data = True
+
+    def _close_writer(self) -> None:
+        """Close the Parquet writer, writing the file footer"""
+        if self._writer is not None:
+            try:
+                self._writer.close()
+            finally:
+                self._writer = None
+
+    def _conform_to_writer(self, table: pa.Table) -> pa.Table:
         """
-        Apply schema type conversions to DataFrame
+        Align a batch with the open writer's schema
+
+        Columns missing from the batch are written as nulls. Columns first
+        seen in this batch (e.g. metadata added only to some records) widen
+        the file schema, which rewrites the row groups written so far.
 
         Args:
-            df: Input DataFrame
+            table: Batch table
 
         Returns:
-            DataFrame with correct types
+            Table matching the writer schema
         """
-        if not self._schema:
-            return df
+        widened = self._widen_schema(self._writer_schema, table.schema)
+        if not widened.equals(self._writer_schema):
+            self._rewrite_with_schema(widened)
+
+        return self._conform_table(table, self._writer_schema)
+
+    @staticmethod
+    def _widen_schema(current: pa.Schema, incoming: pa.Schema) -> pa.Schema:
+        """Merge new columns and concrete types from an incoming batch schema"""
+        fields = []
+        for field in current:
+            index = incoming.get_field_index(field.name)
+            if index >= 0:
+                field = field.with_type(_widen_type(field.type, incoming.field(index).type))
+            fields.append(field)
+
+        fields.extend(field for field in incoming if current.get_field_index(field.name) < 0)
+        return pa.schema(fields)
+
+    @staticmethod
+    def _conform_table(table: pa.Table, schema: pa.Schema) -> pa.Table:
+        """Reorder, cast and null-fill table columns to match a schema"""
+        if table.schema.equals(schema):
+            return table
+
+        columns = []
+        for field in schema:
+            if field.name in table.column_names:
+                column = table[field.name]
+                if column.type != field.type:
+                    column = column.cast(field.type)
+                columns.append(column)
+            else:
+                columns.append(pa.nulls(table.num_rows, field.type))
 
-        for field in self._schema.fields:
-            if field.name not in df.columns:
-                continue
+        return pa.Table.from_arrays(columns, schema=schema)
 
-            try:
-                # Map FieldType to pandas dtype
-                if field.type == FieldType.INTEGER:
-                    df[field.name] = pd.to_numeric(df[field.name], errors='coerce').astype('Int64')
-                elif field.type == FieldType.FLOAT:
-                    df[field.name] = pd.to_numeric(df[field.name], errors='coerce')
-                elif field.type == FieldType.BOOLEAN:
-                    df[field.name] = df[field.name].astype('boolean')
-                elif field.type in [FieldType.DATE, FieldType.DATETIME, FieldType.TIMESTAMP]:
-                    df[field.name] = pd.to_datetime(df[field.name], errors='coerce')
-                elif field.type == FieldType.STRING:
-                    df[field.name] = df[field.name].astype('string')
-                # JSON and ARRAY types remain as objects
+    def _rewrite_with_schema(self, schema: pa.Schema) -> None:
+        """Rewrite the temp file under a wider schema and reopen the writer"""
+        self.logger.info(f"New columns in batch, widening Parquet schema to {len(schema)} columns")
 
-            except Exception as e:
-                self.logger.warning(f"Failed to convert column {field.name} to {field.type}: {e}")
+        self._close_writer()
+        written = self._conform_table(pq.read_table(str(self._temp_file)), schema)
+
+        self._open_writer(schema)
+        self._writer.write_table(written, row_group_size=self.row_group_size)
 
-        return df
+    def _finalize_output(self) -> None:
+        """Close the writer and move the finished temp file into place"""
+        self._close_writer()
+
+        if self._temp_has_data:
+            self._release_page_cache(self._temp_file)
+
+            # Temp file already holds any appended-to rows; same directory,
+            # so this is a single atomic rename
+            os.replace(self._temp_file, self.file_path)
+            self._temp_has_data = False
+
+    def _release_page_cache(self, path: Path) -> None:
+        """
+        Drop a finished output file's pages from the OS page cache
+
+        The pages were only ever written, so keeping them cached just
+        evicts data other processes are reading. Best effort: pages not
+        yet written back stay cached (Linux starts their writeback), as
+        forcing them out with a sync would cost a disk flush per commit.
+        A no-op where posix_fadvise is unavailable.
+        """
+        if not hasattr(os, 'posix_fadvise'):
+            return
+
+        try:
+            fd = os.open(path, os.O_RDONLY)
+            try:
+                os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+            finally:
+                os.close(fd)
+        except OSError as e:
+            self.logger.debug(f"Could not release page cache for {path}: {e}")
 
     def begin_transaction(self) -> None:
         """Begin transaction"""
@@ -261,33 +500,9 @@ class ParquetLoader(DestinationAdapter):
                 if self._batch:
                     self._flush_batch()
 
-                # Move temp file to final location
-                if self._temp_file and self._temp_file.exists():
-                    # If appending and target exists, merge
-                    if self.write_mode == 'append' and self.file_path.exists():
-                        # Read both and concatenate
-                        existing_df = pd.read_parquet(self.file_path)
-                        temp_df = pd.read_parquet(self._temp_file)
-                        merged_df = pd.concat([existing_df, temp_df], ignore_index=True)
-
-                        # Write merged data
-                        parquet_kwargs = {
-                            'compression': self.compression,
-                            'index': False,
-                            **self.pandas_kwargs
-                        }
-                        if self.row_group_size:
-                            parquet_kwargs['row_group_size'] = self.row_group_size
-
-                        merged_df.to_parquet(self.file_path, **parquet_kwargs)
-
-                        # Remove temp file
-                        self._temp_file.unlink()
-                    else:
-                        # Move temp file to final location
-                        shutil.move(str(self._temp_file), str(self.file_path))
-
-                    self.logger.info(f"Transaction committed, Parquet written to {self.file_path}")
+                self._finalize_output()
+
+                self.logger.info(f"Transaction committed, Parquet written to {self.file_path}")
 
             except Exception as e:
                 self.logger.error(f"Error during commit: {e}")
@@ -299,10 +514,16 @@ class ParquetLoader(DestinationAdapter):
     def rollback(self) -> None:
         """Rollback transaction - discard temp file"""
         if self._transaction_active:
+            try:
+                self._close_writer()
+            except Exception as e:
+                self.logger.warning(f"Failed to close Parquet writer: {e}")
+
             # Delete temp file
-            if self._temp_file and self._temp_file.exists():
+            if self._temp_has_data:
                 try:
-                    self._temp_file.unlink()
+                    self._temp_file.unlink(missing_ok=True)
+                    self._temp_has_data = False
                     self.logger.debug("Temp file deleted (rollback)")
                 except Exception as e:
                     self.logger.warning(f"Failed to delete temp file: {e}")
@@ -316,19 +537,26 @@ class ParquetLoader(DestinationAdapter):
 
     def close(self) -> None:
         """Close and cleanup"""
-        # If not in transaction, flush any remaining batch
-        if not self._transaction_active and self._batch:
+        # If not in transaction, flush any remaining batch and finish the file
+        if not self._transaction_active and (self._batch or self._writer is not None):
             try:
                 self._flush_batch()
+                self._finalize_output()
             except Exception as e:
                 self.logger.error(f"Error during final flush: {e}")
 
-        # Clean up temp file if exists
-        if self._temp_file and self._temp_file.exists():
+        try:
+            self._close_writer()
+        except Exception as e:
+            self.logger.warning(f"Failed to close Parquet writer: {e}")
+
+        # Clean up temp file (created empty in connect, may already be moved)
+        if self._temp_file:
             try:
-                self._temp_file.unlink()
+                self._temp_file.unlink(missing_ok=True)
             except Exception as e:
                 self.logger.warning(f"Failed to cleanup temp file: {e}")
+            self._temp_file = None
 
         self._connected = False
         self.logger.info("Parquet loader closed")
@@ -1,21 +1,310 @@
 """
 PostgreSQL destination adapter for loading data into PostgreSQL database
 """
-from typing import Any, Dict, Iterator, List, Optional
+import io
+import json
+import math
+import queue
+import struct
+import threading
+from datetime import date, datetime, time, timedelta
+from decimal import ROUND_HALF_UP, Decimal
+from operator import itemgetter
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
 
 try:
     import psycopg2
     import psycopg2.extras
     import psycopg2.extensions
+    import psycopg2.sql
     HAS_PSYCOPG2 = True
 except ImportError:
     HAS_PSYCOPG2 = False
 
+try:
+    import psycopg
+    import psycopg.sql
+    HAS_PSYCOPG = True
+except ImportError:
+    HAS_PSYCOPG = False
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 from src.adapters.base import DestinationAdapter
 from src.common.models import Field, FieldType, Record, Schema
 from src.common.exceptions import ConnectionError, SchemaError, WriteError
 
 
+# Dicts and lists are stored as JSON text; orjson encodes them several times
+# faster than json.dumps (numpy scalars and non-string keys as json.dumps does)
+if HAS_ORJSON:
+    _ORJSON_OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
+    def _dumps(value: Any) -> str:
+        return orjson.dumps(value, option=_ORJSON_OPTIONS).decode()
+else:
+    _dumps = json.dumps
+
+# Database errors of whichever drivers are installed (psycopg2 and/or psycopg 3)
+_DB_ERRORS = tuple(
+    [psycopg2.Error] if HAS_PSYCOPG2 else []
+) + tuple(
+    [psycopg.Error] if HAS_PSYCOPG else []
+)
+
+# Characters with special meaning in COPY's text format
+_COPY_ESCAPES = str.maketrans({'\\': '\\\\', '\t': '\\t', '\n': '\\n', '\r': '\\r'})
+
+
+def _copy_text(value: Any) -> str:
+    """Format one value as a COPY text-format field"""
+    if value is None:
+        return '\\N'
+    if isinstance(value, str):
+        return value.translate(_COPY_ESCAPES)
+    if isinstance(value, bool):
+        return 't' if value else 'f'
+    if isinstance(value, (dict, list)):
+        return _dumps(value).translate(_COPY_ESCAPES)
+    return str(value)
+
+
+def _integer_value(value: Any) -> Any:
+    """
+    Round a finite float bound for an INTEGER column
+
+    COPY parses fields with the column's input function, which rejects
+    "3.0"; INSERT sent floats as numeric literals and let PostgreSQL's
+    assignment cast round them half away from zero, which is repeated
+    here on the same decimal text. pandas-sourced integer columns holding
+    NaN arrive as floats, so this is common.
+    """
+    if isinstance(value, float) and math.isfinite(value):
+        if value.is_integer():
+            return int(value)
+        return int(Decimal(float.__repr__(value)).to_integral_value(ROUND_HALF_UP))
+    return value
+
+
+# COPY formats accepted by copy_format
+COPY_FORMATS = ('text', 'binary')
+
+# Binary COPY framing: signature, flags and header extension length; the
+# per-row field count; the end-of-data marker; the length of a NULL field
+_BINARY_HEADER = b'PGCOPY\n\xff\r\n\x00' + struct.pack('>ii', 0, 0)
+_BINARY_FIELD_COUNT = struct.Struct('>h')
+_BINARY_TRAILER = b'\xff\xff'
+_BINARY_NULL = struct.pack('>i', -1)
+
+# Binary fields: a 4-byte length followed by the value in network byte order
+_BINARY_LENGTH = struct.Struct('>i')
+_BINARY_INT4 = struct.Struct('>ii')
+_BINARY_INT8 = struct.Struct('>iq')
+_BINARY_FLOAT8 = struct.Struct('>id')
+_BINARY_BOOL = struct.Struct('>i?')
+_BINARY_JSONB_VERSION = struct.Struct('>ib')
+
+# Boolean input spellings accepted by PostgreSQL (compared lowercased)
+_BOOLEAN_LITERALS = {
+    't': True, 'true': True, 'y': True, 'yes': True, 'on': True, '1': True,
+    'f': False, 'false': False, 'n': False, 'no': False, 'off': False, '0': False,
+}
+
+# Errors raised by an encoder for a value that does not fit its column type
+_BINARY_ENCODE_ERRORS = (struct.error, TypeError, ValueError, OverflowError)
+
+# Suffix turning a text-format COPY statement into a binary one
+_BINARY_COPY_OPTION = " (FORMAT BINARY)"
+
+# PostgreSQL counts dates and timestamps from 2000-01-01
+_PG_EPOCH_DATE = date(2000, 1, 1)
+_PG_EPOCH = datetime(2000, 1, 1)
+_MICROSECOND = timedelta(microseconds=1)
+
+
+def _binary_text(value: Any) -> bytes:
+    """Encode a TEXT field, formatting non-strings as the text COPY does"""
+    if isinstance(value, str):
+        data = value.encode()
+    elif isinstance(value, bool):
+        data = b't' if value else b'f'
+    elif isinstance(value, (dict, list)):
+        data = _dumps(value).encode()
+    else:
+        data = str(value).encode()
+    return _BINARY_LENGTH.pack(len(data)) + data
+
+
+def _binary_integer(value: Any) -> bytes:
+    """Encode an INTEGER field"""
+    return _BINARY_INT4.pack(4, value)
+
+
+def _binary_float(value: Any) -> bytes:
+    """Encode a DOUBLE PRECISION field"""
+    return _BINARY_FLOAT8.pack(8, value)
+
+
+def _binary_boolean(value: Any) -> bytes:
+    """Encode a BOOLEAN field from a bool or a PostgreSQL boolean literal"""
+    if not isinstance(value, bool):
+        literal = _BOOLEAN_LITERALS.get(str(value).strip().lower())
+        if literal is None:
+            raise ValueError(f"Not a boolean literal: {value!r}")
+        value = literal
+    return _BINARY_BOOL.pack(1, value)
+
+
+def _binary_date(value: Any) -> bytes:
+    """Encode a DATE field from a date, datetime or ISO 8601 string"""
+    if isinstance(value, str):
+        value = date.fromisoformat(value)
+    elif isinstance(value, datetime):
+        value = value.date()
+    return _BINARY_INT4.pack(4, (value - _PG_EPOCH_DATE).days)
+
+
+def _binary_timestamp(value: Any) -> bytes:
+    """Encode a TIMESTAMP field from a datetime, date or ISO 8601 string"""
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value)
+    elif not isinstance(value, datetime):
+        value = datetime.combine(value, time())
+    # TIMESTAMP has no time zone; like the text format, keep the wall-clock time
+    return _BINARY_INT8.pack(8, (value.replace(tzinfo=None) - _PG_EPOCH) // _MICROSECOND)
+
+
+def _binary_jsonb(value: Any) -> bytes:
+    """Encode a JSONB field; strings are taken to be JSON text already"""
+    data = (value if isinstance(value, str) else _dumps(value)).encode()
+    return _BINARY_JSONB_VERSION.pack(len(data) + 1, 1) + data
+
+
+# Binary field encoder per FieldType, matching _map_field_type_to_postgres;
+# ARRAY schemas never use COPY
+_BINARY_ENCODERS = {
+    FieldType.STRING: _binary_text,
+    FieldType.INTEGER: _binary_integer,
+    FieldType.FLOAT: _binary_float,
+    FieldType.BOOLEAN: _binary_boolean,
+    FieldType.DATE: _binary_date,
+    FieldType.DATETIME: _binary_timestamp,
+    FieldType.TIMESTAMP: _binary_timestamp,
+    FieldType.JSON: _binary_jsonb,
+}
+
+
+def _row_getter(columns: Tuple[str, ...]) -> Callable[[Dict], Tuple]:
+    """Build a callable that pulls the column values out of a record as a tuple"""
+    if len(columns) == 1:
+        # itemgetter with a single key returns the bare value, not a 1-tuple
+        column = columns[0]
+        return lambda record: (record[column],)
+    return itemgetter(*columns)
+
+
+def _normalize_record(data: Dict, columns: Tuple[str, ...]) -> Dict:
+    """Copy a record with exactly the given columns, None for missing ones"""
+    return {column: data.get(column) for column in columns}
+
+
+def _json_row_getter(getter: Callable[[Dict], Tuple], positions: Tuple[int, ...]) -> Callable[[Dict], Tuple]:
+    """Wrap a row getter so dicts and lists at the given positions become JSON text"""
+    def get_row(record: Dict) -> Tuple:
+        row = getter(record)
+        for i in positions:
+            if isinstance(row[i], (dict, list)):
+                row = list(row)
+                for j in positions:
+                    if isinstance(row[j], (dict, list)):
+                        row[j] = _dumps(row[j])
+                return tuple(row)
+        return row
+    return get_row
+
+
+def _integer_row_getter(getter: Callable[[Dict], Tuple], positions: Tuple[int, ...]) -> Callable[[Dict], Tuple]:
+    """Wrap a row getter so floats at the given (INTEGER column) positions become ints"""
+    def get_row(record: Dict) -> Tuple:
+        row = getter(record)
+        for i in positions:
+            if isinstance(row[i], float):
+                row = list(row)
+                for j in positions:
+                    row[j] = _integer_value(row[j])
+                return tuple(row)
+        return row
+    return get_row
+
+
+# Full batches allowed to wait for the background flusher (background_flush=True)
+FLUSH_QUEUE_DEPTH = 4
+
+
+class _BackgroundFlusher:
+    """
+    Worker thread that loads queued batches into the database
+
+    Lets the loader collect batch N+1 from the record iterator while batch
+    N is on the wire. The queue is bounded: submit() blocks once
+    FLUSH_QUEUE_DEPTH batches are pending, capping memory use. The first
+    error is kept and raised to the caller on the next submit() or flush().
+    """
+
+    def __init__(self, load: Callable[[List[Dict]], None], max_pending: int = FLUSH_QUEUE_DEPTH):
+        self._load = load
+        self._queue: "queue.Queue[Optional[List[Dict]]]" = queue.Queue(maxsize=max_pending)
+        self._error: Optional[BaseException] = None
+        self._thread = threading.Thread(
+            target=self._drain,
+            name="postgres-flusher",
+            daemon=True
+        )
+        self._thread.start()
+
+    def _drain(self) -> None:
+        """Consumer loop: load queued batches in submission order"""
+        while True:
+            batch = self._queue.get()
+            try:
+                if batch is None:
+                    return
+                # After a failure the transaction is aborted; skip the rest
+                if self._error is None:
+                    self._load(batch)
+            except Exception as e:
+                self._error = e
+            finally:
+                self._queue.task_done()
+
+    def _raise_pending_error(self) -> None:
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise error
+
+    def submit(self, batch: List[Dict]) -> None:
+        """Queue a batch for loading (blocks while the queue is full)"""
+        self._raise_pending_error()
+        self._queue.put(batch)
+
+    def flush(self) -> None:
+        """Wait until every queued batch has been loaded"""
+        self._queue.join()
+        self._raise_pending_error()
+
+    def close(self) -> None:
+        """Wait for queued batches and stop the worker thread"""
+        try:
+            self.flush()
+        finally:
+            self._queue.put(None)
+            self._thread.join()
+
+
 class PostgreSQLLoader(DestinationAdapter):
     """Destination adapter for PostgreSQL database"""
 
@@ -30,6 +319,15 @@ class PostgreSQLLoader(DestinationAdapter):
         schema: str = "public",
         create_if_missing: bool = True,
         drop_if_exists: bool = False,
+        use_copy: bool = True,
+        page_size: Optional[int] = None,
+        prepare_inserts: bool = False,
+        use_pipeline: bool = False,
+        background_flush: bool = False,
+        bulk_mode: bool = False,
+        unlogged_load: bool = False,
+        skip_duplicates: bool = False,
+        copy_format: str = "text",
         **kwargs
     ):
         """
@@ -45,14 +343,63 @@ class PostgreSQLLoader(DestinationAdapter):
             schema: Schema name (default: 'public')
             create_if_missing: Create table if it doesn't exist
             drop_if_exists: Drop and recreate table if it exists
+            use_copy: Bulk load batches with COPY FROM STDIN (default: True).
+                Schemas with ARRAY fields always use INSERT
+            page_size: Rows per multi-row INSERT statement when not using
+                COPY (default: None, the whole batch in one statement)
+            prepare_inserts: When not using COPY, PREPARE the INSERT once
+                per column layout and EXECUTE it for each row, so the
+                server plans it only once (default: False)
+            use_pipeline: Connect with psycopg 3 instead of psycopg2 and send
+                INSERT batches in pipeline mode, without waiting for each
+                statement's result (default: False). psycopg 3 prepares the
+                repeated INSERT itself, so prepare_inserts and page_size
+                do not apply
+            background_flush: Load full batches on a worker thread so the
+                next batch is collected from the record iterator while the
+                previous one is being sent (default: False). write() still
+                waits for all of its batches before returning
+            bulk_mode: Drop the table's secondary indexes (those not backing
+                a primary key, unique or exclusion constraint) on the first
+                write and rebuild them on commit (default: False). Runs in
+                the load transaction, so a rollback restores them, but the
+                table is locked against readers until the commit
+            unlogged_load: Switch the table to UNLOGGED on the first write
+                and back to LOGGED on commit (default: False). Skips WAL
+                while loading, but both switches rewrite the table
+            skip_duplicates: Load batches into a temporary staging table and
+                move them into the target on commit with INSERT ... ON
+                CONFLICT DO NOTHING, so rows that collide with existing
+                (or earlier) rows on a primary key or unique constraint are
+                skipped instead of failing the load (default: False)
+            copy_format: COPY data format, 'text' or 'binary' (default:
+                'text'). Binary sends values already in PostgreSQL's
+                internal form, so the server does no parsing; it needs
+                the table's column types to match the schema's, and date
+                and timestamp strings must be ISO 8601
             **kwargs: Additional psycopg2 connection parameters
         """
-        if not HAS_PSYCOPG2:
+        if use_pipeline:
+            if not HAS_PSYCOPG:
+                raise ImportError(
+                    "psycopg 3 is required for use_pipeline=True. "
+                    "Install it with: pip install 'psycopg[binary]>=3.1'"
+                )
+        elif not HAS_PSYCOPG2:
             raise ImportError(
                 "psycopg2 is required for PostgreSQL support. "
                 "Install it with: pip install psycopg2-binary"
             )
 
+        if page_size is not None and page_size < 1:
+            raise ValueError(f"page_size must be at least 1, got {page_size}")
+
+        if copy_format not in COPY_FORMATS:
+            raise ValueError(
+                f"Invalid copy_format '{copy_format}'. "
+                f"Must be one of: {', '.join(COPY_FORMATS)}"
+            )
+
         config = {
             'host': host,
             'database': database,
@@ -63,6 +410,15 @@ class PostgreSQLLoader(DestinationAdapter):
             'schema': schema,
             'create_if_missing': create_if_missing,
             'drop_if_exists': drop_if_exists,
+            'use_copy': use_copy,
+            'page_size': page_size,
+            'prepare_inserts': prepare_inserts,
+            'use_pipeline': use_pipeline,
+            'background_flush': background_flush,
+            'bulk_mode': bulk_mode,
+            'unlogged_load': unlogged_load,
+            'skip_duplicates': skip_duplicates,
+            'copy_format': copy_format,
             **kwargs
         }
         super().__init__(config)
@@ -76,33 +432,90 @@ class PostgreSQLLoader(DestinationAdapter):
         self.schema_name = schema
         self.create_if_missing = create_if_missing
         self.drop_if_exists = drop_if_exists
+        self.use_copy = use_copy
+        self.page_size = page_size
+        self.prepare_inserts = prepare_inserts and not use_pipeline
+        self.use_pipeline = use_pipeline
+        self.background_flush = background_flush
+        self.bulk_mode = bulk_mode
+        self.unlogged_load = unlogged_load
+        self.skip_duplicates = skip_duplicates
+        self.copy_format = copy_format
 
-        self._conn: Optional[psycopg2.extensions.connection] = None
-        self._cursor: Optional[psycopg2.extensions.cursor] = None
+        self._conn: Optional["psycopg2.extensions.connection"] = None
+        self._cursor: Optional["psycopg2.extensions.cursor"] = None
         self._batch: List[Dict] = []
+        self._schema: Optional[Schema] = None
+        self._columns: Optional[Tuple[str, ...]] = None
+        self._column_set: frozenset = frozenset()
+        self._json_columns: frozenset = frozenset()
+        self._integer_columns: frozenset = frozenset()
+        self._use_copy = use_copy
+        self._insert_plans: Dict[
+            Tuple[str, ...], Tuple[str, Callable, Optional[Tuple[Callable, ...]]]
+        ] = {}
+        self._prepared: List[str] = []
+        self._prepared_seq = 0
+        self._flusher: Optional[_BackgroundFlusher] = None
+        self._flusher_cursor = None
+        self._bulk_load_active = False
+        self._dropped_indexes: List[str] = []
+        self._staging_table = f"stg_{table}"
+        self._table_sql = ""
+        self._staging_table_sql = ""
+        self._staging_ready = False
 
     def connect(self) -> None:
         """Establish connection to PostgreSQL database"""
         try:
-            self._conn = psycopg2.connect(
-                host=self.host,
-                port=self.port,
-                database=self.database,
-                user=self.user,
-                password=self.password
-            )
+            if self.use_pipeline:
+                self._conn = psycopg.connect(
+                    host=self.host,
+                    port=self.port,
+                    dbname=self.database,
+                    user=self.user,
+                    password=self.password
+                )
+            else:
+                self._conn = psycopg2.connect(
+                    host=self.host,
+                    port=self.port,
+                    database=self.database,
+                    user=self.user,
+                    password=self.password
+                )
             self._conn.autocommit = False  # We'll manage transactions manually
 
             self._cursor = self._conn.cursor()
             self._connected = True
 
+            # Quoted once here and reused by every statement
+            self._table_sql = self._quote_identifier(self.schema_name, self.table)
+            self._staging_table_sql = self._quote_identifier(self._staging_table)
+
             self.logger.info(
                 f"Connected to PostgreSQL: {self.host}:{self.port}/{self.database}"
             )
 
-        except psycopg2.Error as e:
+        except _DB_ERRORS as e:
             raise ConnectionError(f"Failed to connect to PostgreSQL: {e}")
 
+    def _quote_identifier(self, *names: str) -> str:
+        """
+        Quote a (dotted) SQL identifier with the driver's sql module
+
+        Quoted names keep their case and may contain spaces or other
+        characters that are not valid in a bare identifier.
+
+        Args:
+            *names: Name parts, e.g. schema and table
+
+        Returns:
+            Identifier as SQL text, e.g. '"public"."Claims"'
+        """
+        sql = psycopg.sql if self.use_pipeline else psycopg2.sql
+        return sql.Identifier(*names).as_string(self._conn)
+
     def create_schema(self, schema: Schema) -> None:
         """
         Create table based on schema
@@ -116,6 +529,25 @@ class PostgreSQLLoader(DestinationAdapter):
         if not self._connected:
             raise SchemaError("Not connected. Call connect() first.")
 
+        self._schema = schema
+        self._columns = tuple(field.name for field in schema.fields)
+        self._column_set = frozenset(self._columns)
+        self._json_columns = frozenset(
+            field.name for field in schema.fields if field.type == FieldType.JSON
+        )
+        self._integer_columns = frozenset(
+            field.name for field in schema.fields if field.type == FieldType.INTEGER
+        )
+        self._insert_plans.clear()
+        self._staging_ready = False
+        self._deallocate_prepared()
+
+        # Lists are sent to COPY as JSON, which suits JSONB but not
+        # PostgreSQL array columns - those tables go through INSERT
+        self._use_copy = self.use_copy and not any(
+            field.type == FieldType.ARRAY for field in schema.fields
+        )
+
         try:
             # Check if table exists
             self._cursor.execute(
@@ -131,7 +563,7 @@ class PostgreSQLLoader(DestinationAdapter):
 
             # Drop if requested
             if exists and self.drop_if_exists:
-                drop_sql = f"DROP TABLE {self.schema_name}.{self.table}"
+                drop_sql = f"DROP TABLE {self._table_sql}"
                 self._cursor.execute(drop_sql)
                 self._conn.commit()
                 self.logger.info(f"Dropped table '{self.schema_name}.{self.table}'")
@@ -147,7 +579,7 @@ class PostgreSQLLoader(DestinationAdapter):
 
             # Create schema if it doesn't exist
             self._cursor.execute(
-                f"CREATE SCHEMA IF NOT EXISTS {self.schema_name}"
+                f"CREATE SCHEMA IF NOT EXISTS {self._quote_identifier(self.schema_name)}"
             )
 
             # Create table
@@ -155,15 +587,15 @@ class PostgreSQLLoader(DestinationAdapter):
             for field in schema.fields:
                 pg_type = self._map_field_type_to_postgres(field.type)
                 nullable = "NULL" if field.nullable else "NOT NULL"
-                columns.append(f"{field.name} {pg_type} {nullable}")
+                columns.append(f"{self._quote_identifier(field.name)} {pg_type} {nullable}")
 
             # Add primary key if specified
             if schema.primary_key:
-                pk_cols = ", ".join(schema.primary_key)
+                pk_cols = ", ".join(map(self._quote_identifier, schema.primary_key))
                 columns.append(f"PRIMARY KEY ({pk_cols})")
 
             create_sql = f"""
-                CREATE TABLE {self.schema_name}.{self.table} (
+                CREATE TABLE {self._table_sql} (
                     {', '.join(columns)}
                 )
             """
@@ -175,7 +607,7 @@ class PostgreSQLLoader(DestinationAdapter):
                 f"with {len(schema.fields)} columns"
             )
 
-        except psycopg2.Error as e:
+        except _DB_ERRORS as e:
             self._conn.rollback()
             raise SchemaError(f"Failed to create schema: {e}")
 
@@ -212,10 +644,31 @@ class PostgreSQLLoader(DestinationAdapter):
 
         count = 0
         batch_size = self.config.get('batch_size', 1000)
+        columns = self._columns
+        column_set = self._column_set
+
+        if (self.bulk_mode or self.unlogged_load) and not self._bulk_load_active:
+            self._begin_bulk_load()
+
+        if self.skip_duplicates and not self._staging_ready:
+            self._create_staging_table()
+
+        if self.background_flush and self._flusher is None:
+            # The worker gets its own cursor; psycopg cursors are not thread-safe
+            flusher_cursor = self._conn.cursor()
+            self._flusher_cursor = flusher_cursor
+            self._flusher = _BackgroundFlusher(
+                lambda batch: self._load_batch(batch, flusher_cursor)
+            )
 
         try:
             for record in records:
-                self._batch.append(record.data)
+                # Records not shaped like the schema are copied into its
+                # columns, so the flush can pull rows with a plain itemgetter
+                data = record.data
+                if columns and data.keys() != column_set:
+                    data = _normalize_record(data, columns)
+                self._batch.append(data)
                 count += 1
 
                 # Write batch when it reaches batch_size
@@ -226,49 +679,423 @@ class PostgreSQLLoader(DestinationAdapter):
             if self._batch:
                 self._flush_batch()
 
+            # Make sure queued batches have been loaded before returning
+            if self._flusher:
+                self._flusher.flush()
+
             self.logger.info(f"Wrote {count} records to table '{self.schema_name}.{self.table}'")
             return count
 
         except Exception as e:
             raise WriteError(f"Failed to write records: {e}")
 
+    def _prepare_insert(
+        self,
+        columns: Tuple[str, ...]
+    ) -> Tuple[str, Callable, Optional[Tuple[Callable, ...]]]:
+        """
+        Get the load statement, row getter and binary encoders for a set of columns
+
+        All are built once per column layout and reused by every later
+        flush with the same columns. The statement is a COPY or an
+        INSERT depending on the load mode chosen in create_schema(); with
+        prepare_inserts the INSERT is PREPAREd here and an EXECUTE of it
+        is returned. For INSERTs, dicts and lists in JSON columns are
+        serialized by the getter, as psycopg cannot adapt them itself; for
+        COPY, floats in INTEGER columns are rounded to ints by the getter,
+        as COPY does not apply INSERT's assignment cast.
+        Binary COPY needs the column types, so it applies only to the
+        schema's columns; otherwise the text format is used.
+
+        Args:
+            columns: Column names, in table order
+
+        Returns:
+            Tuple of (load SQL, callable mapping a record to a value tuple,
+            per-column binary COPY encoders or None)
+        """
+        plan = self._insert_plans.get(columns)
+        if plan is None:
+            table = self._staging_table_sql if self.skip_duplicates else self._table_sql
+            column_names = ", ".join(map(self._quote_identifier, columns))
+            encoders = None
+            if self._use_copy:
+                sql = f"COPY {table} ({column_names}) FROM STDIN"
+                if self.copy_format == 'binary' and columns == self._columns:
+                    sql += _BINARY_COPY_OPTION
+                    encoders = tuple(
+                        _BINARY_ENCODERS.get(field.type, _binary_text)
+                        for field in self._schema.fields
+                    )
+            elif self.use_pipeline:
+                # One row per statement; the pipeline removes the round-trips
+                sql = (
+                    f"INSERT INTO {table} ({column_names}) "
+                    f"VALUES ({', '.join(['%s'] * len(columns))})"
+                )
+            elif self.prepare_inserts:
+                sql = self._prepare_statement(
+                    f"INSERT INTO {table} ({column_names}) VALUES "
+                    f"({', '.join(f'${i}' for i in range(1, len(columns) + 1))})",
+                    len(columns)
+                )
+            else:
+                sql = f"INSERT INTO {table} ({column_names}) VALUES %s"
+
+            getter = _row_getter(columns)
+            json_positions = tuple(
+                i for i, col in enumerate(columns) if col in self._json_columns
+            )
+            if json_positions and not self._use_copy:
+                getter = _json_row_getter(getter, json_positions)
+            integer_positions = tuple(
+                i for i, col in enumerate(columns) if col in self._integer_columns
+            )
+            if integer_positions and self._use_copy:
+                getter = _integer_row_getter(getter, integer_positions)
+
+            plan = self._insert_plans[columns] = (sql, getter, encoders)
+        return plan
+
+    def _prepare_statement(self, statement: str, param_count: int) -> str:
+        """
+        PREPARE a statement on the server
+
+        Prepared statements outlive transaction rollbacks, so each is
+        tracked until _deallocate_prepared() releases it.
+
+        Args:
+            statement: SQL with $1..$N parameters
+            param_count: Number of parameters
+
+        Returns:
+            str: EXECUTE statement taking the parameters as %s placeholders
+        """
+        self._prepared_seq += 1
+        name = f"etl_ins_{self._prepared_seq}"
+        with self._conn.cursor() as cursor:
+            cursor.execute(f"PREPARE {name} AS {statement}")
+        self._prepared.append(name)
+        return f"EXECUTE {name} ({', '.join(['%s'] * param_count)})"
+
+    def _deallocate_prepared(self) -> None:
+        """Release the statements PREPAREd by this loader"""
+        if not self._prepared or not self._conn:
+            return
+
+        try:
+            with self._conn.cursor() as cursor:
+                for name in self._prepared:
+                    cursor.execute(f"DEALLOCATE {name}")
+        except _DB_ERRORS as e:
+            # An aborted transaction rejects DEALLOCATE; the statements
+            # are dropped with the session anyway
+            self.logger.debug(f"Could not deallocate prepared statements: {e}")
+
+        self._prepared = []
+
+    def _begin_bulk_load(self) -> None:
+        """
+        Prepare the table for a bulk load (bulk_mode / unlogged_load)
+
+        Secondary index definitions are saved and the indexes dropped, so
+        the load does one index build per index at commit instead of an
+        index update per row. Unique indexes are kept: they enforce
+        constraints and are what ON CONFLICT (skip_duplicates) checks.
+
+        Raises:
+            WriteError: If the table cannot be altered
+        """
+        table = self._table_sql
+
+        try:
+            if self.bulk_mode:
+                self._cursor.execute(
+                    """
+                    SELECT ic.relname, pg_get_indexdef(ix.indexrelid)
+                    FROM pg_index ix
+                    JOIN pg_class ic ON ic.oid = ix.indexrelid
+                    WHERE ix.indrelid = to_regclass(%s)
+                      AND NOT ix.indisunique
+                      AND NOT EXISTS (
+                          SELECT FROM pg_constraint c WHERE c.conindid = ix.indexrelid
+                      )
+                    """,
+                    (table,)
+                )
+                for index_name, index_def in self._cursor.fetchall():
+                    self._cursor.execute(
+                        f"DROP INDEX {self._quote_identifier(self.schema_name, index_name)}"
+                    )
+                    self._dropped_indexes.append(index_def)
+
+                if self._dropped_indexes:
+                    self.logger.info(
+                        f"Dropped {len(self._dropped_indexes)} indexes on "
+                        f"'{self.schema_name}.{self.table}' for bulk load"
+                    )
+
+            if self.unlogged_load:
+                self._cursor.execute(f"ALTER TABLE {table} SET UNLOGGED")
+
+        except _DB_ERRORS as e:
+            raise WriteError(f"Failed to prepare table for bulk load: {e}")
+
+        self._bulk_load_active = True
+
+    def _end_bulk_load(self) -> None:
+        """Rebuild dropped indexes and restore logging before committing"""
+        if not self._bulk_load_active:
+            return
+
+        if self.unlogged_load:
+            self._cursor.execute(f"ALTER TABLE {self._table_sql} SET LOGGED")
+
+        for index_def in self._dropped_indexes:
+            self._cursor.execute(index_def)
+
+        if self._dropped_indexes:
+            self.logger.info(
+                f"Rebuilt {len(self._dropped_indexes)} indexes on '{self.schema_name}.{self.table}'"
+            )
+
+        self._dropped_indexes = []
+        self._bulk_load_active = False
+
+    def _create_staging_table(self) -> None:
+        """
+        Create the temporary staging table for skip_duplicates
+
+        The table is session-local and empties itself on every commit. It
+        is created in the current transaction, so a rollback drops it and
+        the next write() recreates it.
+
+        Raises:
+            WriteError: If the staging table cannot be created
+        """
+        try:
+            self._cursor.execute(f"DROP TABLE IF EXISTS {self._staging_table_sql}")
+            self._cursor.execute(
+                f"CREATE TEMP TABLE {self._staging_table_sql} "
+                f"(LIKE {self._table_sql} INCLUDING DEFAULTS) "
+                f"ON COMMIT DELETE ROWS"
+            )
+        except _DB_ERRORS as e:
+            raise WriteError(f"Failed to create staging table: {e}")
+
+        self._staging_ready = True
+
+    def _merge_staging_table(self) -> None:
+        """Move staged rows into the target table, skipping conflicting rows"""
+        if not self._staging_ready:
+            return
+
+        self._cursor.execute(
+            f"INSERT INTO {self._table_sql} SELECT * FROM {self._staging_table_sql} "
+            f"ON CONFLICT DO NOTHING"
+        )
+        self.logger.info(
+            f"Merged {self._cursor.rowcount} staged rows into '{self.schema_name}.{self.table}'"
+        )
+
     def _flush_batch(self) -> None:
-        """Flush current batch to database"""
+        """Flush current batch to database, or queue it for the background flusher"""
         if not self._batch:
             return
 
+        if self._flusher:
+            batch, self._batch = self._batch, []
+            self._flusher.submit(batch)
+            return
+
+        self._load_batch(self._batch, self._cursor)
+
+        # Clear batch
+        self._batch = []
+
+    def _load_batch(self, batch: List[Dict], cursor) -> None:
+        """
+        Load one batch of records through the given cursor
+
+        Args:
+            batch: Record dictionaries
+            cursor: Cursor to load with
+
+        Raises:
+            WriteError: If the database rejects the batch
+        """
         try:
-            # Get column names from first record
-            columns = list(self._batch[0].keys())
-            column_names = ", ".join(columns)
-            placeholders = ", ".join(["%s" for _ in columns])
-
-            insert_sql = f"""
-                INSERT INTO {self.schema_name}.{self.table} ({column_names})
-                VALUES ({placeholders})
-            """
+            # Columns come from the schema; without one, from the first record
+            sql, getter, encoders = self._prepare_insert(self._columns or tuple(batch[0]))
+            rows = map(getter, batch)
 
-            # Prepare data
-            data = [
-                [record.get(col) for col in columns]
-                for record in self._batch
+            if encoders:
+                self._copy_binary_batch(cursor, sql, encoders, rows)
+            elif self._use_copy:
+                self._copy_batch(cursor, sql, rows)
+            elif self.use_pipeline:
+                self._pipeline_batch(cursor, sql, rows)
+            elif self.prepare_inserts:
+                self._execute_prepared(cursor, sql, rows)
+            else:
+                self._insert_batch(cursor, sql, rows)
+
+            self.logger.debug(f"Flushed batch of {len(batch)} records")
+
+        except _DB_ERRORS as e:
+            raise WriteError(f"Failed to flush batch: {e}")
+
+    def _wait_for_flusher(self, stop: bool = False) -> None:
+        """
+        Wait for batches queued on the background flusher
+
+        Args:
+            stop: Also stop the worker thread and close its cursor
+        """
+        if not self._flusher:
+            return
+
+        if not stop:
+            self._flusher.flush()
+            return
+
+        try:
+            self._flusher.close()
+        finally:
+            self._flusher = None
+            self._flusher_cursor.close()
+            self._flusher_cursor = None
+
+    def _copy_batch(self, cursor, copy_sql: str, rows: Iterable[Tuple]) -> None:
+        """
+        Load the batch with COPY FROM STDIN
+
+        COPY streams every row in a single command, avoiding INSERT's
+        per-row statement overhead. Rows use COPY's text format: tab
+        separated, \\N for NULL, dicts and lists as JSON.
+
+        Args:
+            cursor: Cursor to load with
+            copy_sql: COPY ... FROM STDIN statement
+            rows: Value tuples, in column order
+        """
+        buffer = io.StringIO()
+        buffer.writelines(
+            '\t'.join(map(_copy_text, row)) + '\n'
+            for row in rows
+        )
+
+        if self.use_pipeline:
+            with cursor.copy(copy_sql) as copy:
+                copy.write(buffer.getvalue())
+        else:
+            buffer.seek(0)
+            cursor.copy_expert(copy_sql, buffer)
+
+    def _copy_binary_batch(
+        self,
+        cursor,
+        copy_sql: str,
+        encoders: Tuple[Callable, ...],
+        rows: Iterable[Tuple]
+    ) -> None:
+        """
+        Load the batch with COPY FROM STDIN in binary format
+
+        The batch is transposed into one sequence per column so each
+        column is encoded in a single pass with its type's encoder; the
+        encoded fields are then joined back into rows behind their field
+        count. A batch holding a value its column's encoder cannot take
+        (e.g. a string in an INTEGER column) is sent in the text format
+        instead, leaving parsing to PostgreSQL as the INSERT path did.
+
+        Args:
+            cursor: Cursor to load with
+            copy_sql: COPY ... FROM STDIN (FORMAT BINARY) statement
+            encoders: Binary field encoder per column
+            rows: Value tuples, in column order
+        """
+        rows = list(rows)
+        try:
+            encoded_columns = [
+                [_BINARY_NULL if value is None else encode(value) for value in values]
+                for encode, values in zip(encoders, zip(*rows))
             ]
+        except _BINARY_ENCODE_ERRORS as e:
+            self.logger.debug(f"Batch not cleanly typed for binary COPY ({e}); using text format")
+            self._copy_batch(cursor, copy_sql.removesuffix(_BINARY_COPY_OPTION), rows)
+            return
+        field_count = _BINARY_FIELD_COUNT.pack(len(encoders))
+        data = b''.join([
+            _BINARY_HEADER,
+            field_count,
+            field_count.join(map(b''.join, zip(*encoded_columns))),
+            _BINARY_TRAILER,
+        ])
 
-            # Execute batch insert using execute_batch for better performance
-            psycopg2.extras.execute_batch(
-                self._cursor,
-                insert_sql,
-                data,
-                page_size=len(data)
-            )
+        if self.use_pipeline:
+            with cursor.copy(copy_sql) as copy:
+                copy.write(data)
+        else:
+            cursor.copy_expert(copy_sql, io.BytesIO(data))
 
-            # Clear batch
-            self._batch = []
+    def _insert_batch(self, cursor, insert_sql: str, rows: Iterable[Tuple]) -> None:
+        """
+        Load the batch with multi-row INSERT statements
 
-            self.logger.debug(f"Flushed batch of {len(data)} records")
+        execute_values expands the single VALUES %s placeholder into one
+        (..), (..) list per page, so each page costs one round-trip and
+        one parse/plan instead of one per row.
 
-        except psycopg2.Error as e:
-            raise WriteError(f"Failed to flush batch: {e}")
+        Args:
+            cursor: Cursor to load with
+            insert_sql: INSERT ... VALUES %s statement
+            rows: Value tuples, in column order
+        """
+        data = list(rows)
+
+        psycopg2.extras.execute_values(
+            cursor,
+            insert_sql,
+            data,
+            page_size=self.page_size or len(data)
+        )
+
+    def _pipeline_batch(self, cursor, insert_sql: str, rows: Iterable[Tuple]) -> None:
+        """
+        Load the batch with psycopg 3 in pipeline mode
+
+        Every row's INSERT is queued on the connection without waiting for
+        the previous result; psycopg 3 prepares the repeated statement.
+
+        Args:
+            cursor: Cursor to load with
+            insert_sql: INSERT ... VALUES (%s, ...) statement
+            rows: Value tuples, in column order
+        """
+        with self._conn.pipeline():
+            cursor.executemany(insert_sql, rows)
+
+    def _execute_prepared(self, cursor, execute_sql: str, rows: Iterable[Tuple]) -> None:
+        """
+        Load the batch by EXECUTE-ing a prepared INSERT per row
+
+        execute_batch joins the EXECUTE calls into pages, one round-trip
+        each; the server reuses the prepared plan for every row.
+
+        Args:
+            cursor: Cursor to load with
+            execute_sql: EXECUTE statement with %s placeholders
+            rows: Value tuples, in column order
+        """
+        data = list(rows)
+
+        psycopg2.extras.execute_batch(
+            cursor,
+            execute_sql,
+            data,
+            page_size=self.page_size or len(data)
+        )
 
     def begin_transaction(self) -> None:
         """Begin transaction"""
@@ -281,7 +1108,10 @@ class PostgreSQLLoader(DestinationAdapter):
             # Flush any remaining batch
             if self._batch:
                 self._flush_batch()
+            self._wait_for_flusher()
 
+            self._merge_staging_table()
+            self._end_bulk_load()
             self._conn.commit()
             self.logger.debug("Transaction committed")
 
@@ -290,14 +1120,29 @@ class PostgreSQLLoader(DestinationAdapter):
     def rollback(self) -> None:
         """Rollback transaction"""
         if self._conn:
+            try:
+                self._wait_for_flusher()
+            except Exception as e:
+                self.logger.debug(f"Discarding failed background flush: {e}")
             self._conn.rollback()
             self._batch = []  # Clear batch
+
+            # The rollback also undid the index drops and UNLOGGED switch,
+            # and may have dropped a staging table created in it
+            self._dropped_indexes = []
+            self._bulk_load_active = False
+            self._staging_ready = False
             self.logger.debug("Transaction rolled back")
 
         super().rollback()
 
     def close(self) -> None:
         """Close database connection"""
+        try:
+            self._wait_for_flusher(stop=True)
+        except Exception as e:
+            self.logger.error(f"Error during background flush: {e}")
+
         if self._cursor:
             self._cursor.close()
 
@@ -306,11 +1151,14 @@ class PostgreSQLLoader(DestinationAdapter):
             if self._batch:
                 try:
                     self._flush_batch()
+                    self._merge_staging_table()
+                    self._end_bulk_load()
                     self._conn.commit()
                 except Exception as e:
                     self.logger.error(f"Error during final flush: {e}")
                     self._conn.rollback()
 
+            self._deallocate_prepared()
             self._conn.close()
 
         self._connected = False
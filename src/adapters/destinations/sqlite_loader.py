@@ -1,15 +1,63 @@
 """
 SQLite destination adapter for loading data into SQLite database
 """
+import json
 import sqlite3
+from operator import itemgetter
 from pathlib import Path
-from typing import Any, Dict, Iterator, List
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
 
 from src.adapters.base import DestinationAdapter
 from src.common.models import Field, FieldType, Record, Schema
 from src.common.exceptions import ConnectionError, SchemaError, WriteError
 
 
+# Dicts and lists are stored as JSON text; orjson encodes them several times
+# faster than json.dumps (numpy scalars and non-string keys as json.dumps does)
+if HAS_ORJSON:
+    _ORJSON_OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
+    def _dumps(value: Any) -> str:
+        return orjson.dumps(value, option=_ORJSON_OPTIONS).decode()
+else:
+    _dumps = json.dumps
+
+# Accepted values for the journal_mode and synchronous PRAGMAs
+JOURNAL_MODES = ('DELETE', 'TRUNCATE', 'PERSIST', 'MEMORY', 'WAL', 'OFF')
+SYNCHRONOUS_MODES = ('OFF', 'NORMAL', 'FULL', 'EXTRA')
+
+
+def _row_getter(columns: Tuple[str, ...]) -> Callable[[Dict], Tuple]:
+    """Build a callable that pulls the column values out of a record as a tuple"""
+    if len(columns) == 1:
+        # itemgetter with a single key returns the bare value, not a 1-tuple
+        column = columns[0]
+        return lambda record: (record[column],)
+    return itemgetter(*columns)
+
+
+def _normalize_record(data: Dict, columns: Tuple[str, ...]) -> Dict:
+    """Copy a record with exactly the given columns, None for missing ones"""
+    return {column: data.get(column) for column in columns}
+
+
+def _to_sql_row(row: Tuple) -> Tuple:
+    """Convert lists and dicts in a row to JSON strings for SQLite"""
+    for value in row:
+        if isinstance(value, (list, dict)):
+            return tuple([
+                _dumps(value) if isinstance(value, (list, dict)) else value
+                for value in row
+            ])
+    return row
+
+
 class SQLiteLoader(DestinationAdapter):
     """Destination adapter for SQLite database"""
 
@@ -18,6 +66,11 @@ class SQLiteLoader(DestinationAdapter):
         db_path: str,
         table: str,
         create_if_missing: bool = True,
+        journal_mode: str = "WAL",
+        synchronous: str = "NORMAL",
+        mmap_size: int = 256 * 1024 * 1024,
+        cache_size: int = -262144,
+        exclusive: bool = False,
         **kwargs
     ):
         """
@@ -27,12 +80,42 @@ class SQLiteLoader(DestinationAdapter):
             db_path: Path to SQLite database file
             table: Table name to load data into
             create_if_missing: Create table if it doesn't exist
+            journal_mode: SQLite journal mode (default: 'WAL'; 'OFF' disables
+                journaling entirely, losing crash safety)
+            synchronous: When SQLite fsyncs (default: 'NORMAL', which in WAL
+                mode only syncs at checkpoints; use 'FULL' for durability of
+                every commit)
+            mmap_size: Bytes of the database to memory-map for reads
+                (default: 256 MiB, 0 disables)
+            cache_size: Page cache size, in pages if positive or KiB if
+                negative (default: -262144, i.e. 256 MiB)
+            exclusive: Hold an exclusive lock for the whole connection
+                (default: False); faster for a single writer but blocks
+                other connections until close()
             **kwargs: Additional configuration
         """
+        journal_mode = journal_mode.upper()
+        synchronous = synchronous.upper()
+        if journal_mode not in JOURNAL_MODES:
+            raise ValueError(
+                f"Invalid journal_mode '{journal_mode}'. "
+                f"Must be one of: {', '.join(JOURNAL_MODES)}"
+            )
+        if synchronous not in SYNCHRONOUS_MODES:
+            raise ValueError(
+                f"Invalid synchronous '{synchronous}'. "
+                f"Must be one of: {', '.join(SYNCHRONOUS_MODES)}"
+            )
+
         config = {
             'db_path': db_path,
             'table': table,
             'create_if_missing': create_if_missing,
+            'journal_mode': journal_mode,
+            'synchronous': synchronous,
+            'mmap_size': mmap_size,
+            'cache_size': cache_size,
+            'exclusive': exclusive,
             **kwargs
         }
         super().__init__(config)
@@ -40,10 +123,18 @@ class SQLiteLoader(DestinationAdapter):
         self.db_path = Path(db_path)
         self.table = table
         self.create_if_missing = create_if_missing
+        self.journal_mode = journal_mode
+        self.synchronous = synchronous
+        self.mmap_size = int(mmap_size)
+        self.cache_size = int(cache_size)
+        self.exclusive = exclusive
 
         self._conn: sqlite3.Connection = None
         self._cursor: sqlite3.Cursor = None
         self._batch: List[Dict] = []
+        self._insert_plans: Dict[Tuple[str, ...], Tuple[str, Callable]] = {}
+        self._columns: Optional[Tuple[str, ...]] = None
+        self._column_set: frozenset = frozenset()
 
     def connect(self) -> None:
         """Establish connection to SQLite database"""
@@ -51,8 +142,11 @@ class SQLiteLoader(DestinationAdapter):
             # Create parent directory if it doesn't exist
             self.db_path.parent.mkdir(parents=True, exist_ok=True)
 
-            # Connect to database
-            self._conn = sqlite3.connect(str(self.db_path))
+            # Connect to database. isolation_level=None turns off the
+            # sqlite3 module's implicit transactions; the loader issues
+            # BEGIN/COMMIT itself.
+            self._conn = sqlite3.connect(str(self.db_path), isolation_level=None)
+            self._configure_connection()
             self._cursor = self._conn.cursor()
             self._connected = True
 
@@ -61,6 +155,16 @@ class SQLiteLoader(DestinationAdapter):
         except Exception as e:
             raise ConnectionError(f"Failed to connect to SQLite database: {e}")
 
+    def _configure_connection(self) -> None:
+        """Apply the bulk-load PRAGMAs to a new connection"""
+        if self.exclusive:
+            self._conn.execute("PRAGMA locking_mode=EXCLUSIVE")
+        self._conn.execute(f"PRAGMA journal_mode={self.journal_mode}")
+        self._conn.execute(f"PRAGMA synchronous={self.synchronous}")
+        self._conn.execute("PRAGMA temp_store=MEMORY")
+        self._conn.execute(f"PRAGMA cache_size={self.cache_size}")
+        self._conn.execute(f"PRAGMA mmap_size={self.mmap_size}")
+
     def create_schema(self, schema: Schema) -> None:
         """
         Create table based on schema
@@ -74,6 +178,10 @@ class SQLiteLoader(DestinationAdapter):
         if not self._connected:
             raise SchemaError("Not connected. Call connect() first.")
 
+        self._insert_plans.clear()
+        self._columns = tuple(field.name for field in schema.fields)
+        self._column_set = frozenset(self._columns)
+
         try:
             # Check if table exists
             self._cursor.execute(
@@ -144,10 +252,17 @@ class SQLiteLoader(DestinationAdapter):
 
         count = 0
         batch_size = self.config.get('batch_size', 1000)
+        columns = self._columns
+        column_set = self._column_set
 
         try:
             for record in records:
-                self._batch.append(record.data)
+                # Records not shaped like the schema are copied into its
+                # columns, so the flush can pull rows with a plain itemgetter
+                data = record.data
+                if columns and data.keys() != column_set:
+                    data = _normalize_record(data, columns)
+                self._batch.append(data)
                 count += 1
 
                 # Write batch when it reaches batch_size
@@ -164,34 +279,56 @@ class SQLiteLoader(DestinationAdapter):
         except Exception as e:
             raise WriteError(f"Failed to write records: {e}")
 
+    def _prepare_insert(
+        self,
+        columns: Tuple[str, ...]
+    ) -> Tuple[str, Callable]:
+        """
+        Get the INSERT statement and row getter for a set of columns
+
+        Both are built once per column layout and reused by every later
+        flush with the same columns.
+
+        Args:
+            columns: Column names, in table order
+
+        Returns:
+            Tuple of (insert SQL, callable mapping a record to a value tuple)
+        """
+        plan = self._insert_plans.get(columns)
+        if plan is None:
+            placeholders = ", ".join(["?"] * len(columns))
+            column_names = ", ".join(columns)
+            insert_sql = f"INSERT INTO {self.table} ({column_names}) VALUES ({placeholders})"
+            plan = self._insert_plans[columns] = (insert_sql, _row_getter(columns))
+        return plan
+
     def _flush_batch(self) -> None:
         """Flush current batch to database"""
         if not self._batch:
             return
 
         try:
-            # Get column names from first record
-            columns = list(self._batch[0].keys())
-            placeholders = ", ".join(["?" for _ in columns])
-            column_names = ", ".join(columns)
-
-            insert_sql = f"INSERT INTO {self.table} ({column_names}) VALUES ({placeholders})"
+            # Columns come from the schema; without one, from the first record
+            insert_sql, getter = self._prepare_insert(
+                self._columns or tuple(self._batch[0])
+            )
 
             # Prepare data - convert unsupported types to JSON strings
-            import json
-            data = []
-            for record in self._batch:
-                row = []
-                for col in columns:
-                    value = record.get(col)
-                    # Convert lists and dicts to JSON strings for SQLite
-                    if isinstance(value, (list, dict)):
-                        value = json.dumps(value)
-                    row.append(value)
-                data.append(row)
-
-            # Execute batch insert
-            self._cursor.executemany(insert_sql, data)
+            data = list(map(_to_sql_row, map(getter, self._batch)))
+
+            # Execute batch insert - inside the caller's transaction if one
+            # is open, otherwise as its own transaction (one sync per batch)
+            if self._transaction_active:
+                self._cursor.executemany(insert_sql, data)
+            else:
+                self._cursor.execute("BEGIN")
+                try:
+                    self._cursor.executemany(insert_sql, data)
+                except Exception:
+                    self._cursor.execute("ROLLBACK")
+                    raise
+                self._cursor.execute("COMMIT")
 
             # Clear batch
             self._batch = []
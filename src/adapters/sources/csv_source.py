@@ -4,15 +4,49 @@ CSV source adapter for reading CSV files
 import hashlib
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, Iterator, Optional
+from typing import Any, Dict, Iterator, List, Optional
 
 import pandas as pd
 
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
+
 from src.adapters.base import SourceAdapter
 from src.common.models import Field, FieldType, Record, RecordMetadata, Schema
 from src.common.exceptions import ConnectionError, ReadError
 
 
+# Supported reader backends: 'pandas' (chunked read_csv), 'pyarrow'
+# (multi-threaded C++ parser), or 'auto' to use pyarrow whenever no
+# pandas-only option is set (values differ - see CSVSource.__init__)
+READER_BACKENDS = ('auto', 'pandas', 'pyarrow')
+
+# Bytes of CSV parsed per pyarrow batch; pyarrow infers column types from
+# the first block, so larger blocks also make that inference more reliable
+ARROW_BLOCK_SIZE = 8 * 1024 * 1024
+
+# numpy dtype.kind -> FieldType for schema inference (pandas extension dtypes
+# such as Int64 and boolean report the same kinds); anything else is a string
+DTYPE_KIND_TYPES = {
+    'i': FieldType.INTEGER,
+    'u': FieldType.INTEGER,
+    'f': FieldType.FLOAT,
+    'b': FieldType.BOOLEAN,
+    'M': FieldType.DATETIME,
+}
+
+# Change-detection methods for get_state(): 'fingerprint' (size and mtime,
+# no file read) or 'sha256' (content hash, reads the whole file)
+HASH_ALGOS = ('fingerprint', 'sha256')
+
+# Read size when hashing without hashlib.file_digest (Python < 3.11)
+HASH_CHUNK_SIZE = 1024 * 1024
+
+
 class CSVSource(SourceAdapter):
     """Source adapter for CSV files"""
 
@@ -22,6 +56,8 @@ class CSVSource(SourceAdapter):
         delimiter: str = ",",
         encoding: str = "utf-8",
         has_header: bool = True,
+        reader_backend: str = "auto",
+        hash_algo: str = "fingerprint",
         **kwargs
     ):
         """
@@ -32,13 +68,50 @@ class CSVSource(SourceAdapter):
             delimiter: CSV delimiter (default: ',')
             encoding: File encoding (default: 'utf-8')
             has_header: Whether CSV has header row (default: True)
+            reader_backend: Parser used by read() - 'pandas', 'pyarrow', or
+                'auto' (default) which uses pyarrow when it is installed and
+                no pandas read_csv parameters, multi-character delimiter or
+                headerless file require pandas. Without a header, pyarrow
+                names columns f0, f1, ... pyarrow records differ from
+                pandas ones: empty cells are None rather than NaN, and
+                integer columns with empty cells stay int rather than
+                becoming float. Pass 'pandas' to keep pandas values
+            hash_algo: File hash reported by get_state() - 'fingerprint'
+                (default, '<size>-<mtime_ns>') or 'sha256' (content hash).
+                Computed on the first get_state() call
             **kwargs: Additional pandas read_csv parameters
         """
+        if reader_backend not in READER_BACKENDS:
+            raise ValueError(
+                f"Invalid reader_backend '{reader_backend}'. "
+                f"Must be one of: {', '.join(READER_BACKENDS)}"
+            )
+        if hash_algo not in HASH_ALGOS:
+            raise ValueError(
+                f"Invalid hash_algo '{hash_algo}'. "
+                f"Must be one of: {', '.join(HASH_ALGOS)}"
+            )
+        if reader_backend == 'pyarrow':
+            if not HAS_PYARROW:
+                raise ImportError(
+                    "pyarrow is required for reader_backend='pyarrow'. "
+                    "Install it with: pip install pyarrow"
+                )
+            if kwargs:
+                raise ValueError(
+                    "reader_backend='pyarrow' does not accept pandas read_csv "
+                    f"parameters: {', '.join(kwargs)}"
+                )
+            if len(delimiter) != 1:
+                raise ValueError("reader_backend='pyarrow' requires a single-character delimiter")
+
         config = {
             'file_path': file_path,
             'delimiter': delimiter,
             'encoding': encoding,
             'has_header': has_header,
+            'reader_backend': reader_backend,
+            'hash_algo': hash_algo,
             **kwargs
         }
         super().__init__(config)
@@ -48,6 +121,14 @@ class CSVSource(SourceAdapter):
         self.encoding = encoding
         self.has_header = has_header
         self.pandas_kwargs = kwargs
+        self.hash_algo = hash_algo
+
+        if reader_backend == 'auto':
+            use_arrow = (
+                HAS_PYARROW and not kwargs and has_header and len(delimiter) == 1
+            )
+            reader_backend = 'pyarrow' if use_arrow else 'pandas'
+        self.reader_backend = reader_backend
 
         self._df: Optional[pd.DataFrame] = None
         self._current_row = 0
@@ -64,14 +145,28 @@ class CSVSource(SourceAdapter):
         self._connected = True
         self.logger.info(f"Connected to CSV file: {self.file_path}")
 
-        # Calculate file hash for state tracking
-        self._file_hash = self._calculate_file_hash()
+        # File hash for state tracking is computed lazily by get_state()
+        self._file_hash = None
+
+    def _get_file_hash(self) -> str:
+        """Get the file's change-detection hash, computing it on first use"""
+        if self._file_hash is None:
+            if self.hash_algo == 'sha256':
+                self._file_hash = self._calculate_file_hash()
+            else:
+                stat = self.file_path.stat()
+                self._file_hash = f"{stat.st_size}-{stat.st_mtime_ns}"
+        return self._file_hash
 
     def _calculate_file_hash(self) -> str:
         """Calculate SHA256 hash of file for change detection"""
-        sha256 = hashlib.sha256()
         with open(self.file_path, 'rb') as f:
-            for chunk in iter(lambda: f.read(8192), b''):
+            if hasattr(hashlib, 'file_digest'):
+                # Python 3.11+: hashes in C straight from the file descriptor
+                return hashlib.file_digest(f, 'sha256').hexdigest()
+
+            sha256 = hashlib.sha256()
+            for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b''):
                 sha256.update(chunk)
         return sha256.hexdigest()
 
@@ -89,26 +184,22 @@ class CSVSource(SourceAdapter):
             raise ReadError("Not connected. Call connect() first.")
 
         try:
-            # Read CSV in chunks for memory efficiency
-            chunk_iter = pd.read_csv(
-                self.file_path,
-                delimiter=self.delimiter,
-                encoding=self.encoding,
-                header=0 if self.has_header else None,
-                chunksize=batch_size,
-                **self.pandas_kwargs
-            )
+            source_id = str(self.file_path)
+
+            if self.reader_backend == 'pyarrow':
+                chunks = self._read_arrow_chunks(batch_size)
+            else:
+                chunks = self._read_pandas_chunks(batch_size)
 
             row_num = 0
-            for chunk in chunk_iter:
-                for idx, row in chunk.iterrows():
-                    # Convert row to dictionary
-                    data = row.to_dict()
+            for rows in chunks:
+                extracted_at = datetime.now()
 
+                for data in rows:
                     # Create metadata
                     metadata = RecordMetadata(
                         source_type="csv",
-                        source_id=str(self.file_path),
+                        source_id=source_id,
                         record_id=f"row_{row_num}",
                         stage="extract"
                     )
@@ -117,7 +208,7 @@ class CSVSource(SourceAdapter):
                     record = Record(
                         data=data,
                         metadata=metadata,
-                        extracted_at=datetime.now()
+                        extracted_at=extracted_at
                     )
 
                     yield record
@@ -128,6 +219,105 @@ class CSVSource(SourceAdapter):
         except Exception as e:
             raise ReadError(f"Error reading CSV file: {e}")
 
+    def _read_pandas_chunks(
+        self,
+        batch_size: int,
+        skip_rows: int = 0,
+        names: Optional[List[str]] = None
+    ) -> Iterator[List[Dict]]:
+        """
+        Read the file with pandas, one list of row dictionaries per chunk
+
+        Args:
+            batch_size: Number of rows per chunk
+            skip_rows: Data rows to skip after the header
+            names: Column names to use instead of pandas' defaults
+
+        Yields:
+            List[Dict]: Rows of one chunk
+        """
+        first_row = 1 if self.has_header else 0
+
+        chunk_iter = pd.read_csv(
+            self.file_path,
+            delimiter=self.delimiter,
+            encoding=self.encoding,
+            header=0 if self.has_header else None,
+            names=names,
+            chunksize=batch_size,
+            skiprows=range(first_row, first_row + skip_rows) if skip_rows else None,
+            **self.pandas_kwargs
+        )
+
+        for chunk in chunk_iter:
+            # Convert the whole chunk to dictionaries in one pass
+            # (iterrows builds a Series per row)
+            yield chunk.to_dict(orient='records')
+
+    def _open_arrow_reader(self, column_types: Optional[Dict] = None):
+        """Open a streaming pyarrow CSV reader on the file"""
+        return pa_csv.open_csv(
+            self.file_path,
+            read_options=pa_csv.ReadOptions(
+                block_size=ARROW_BLOCK_SIZE,
+                encoding=self.encoding,
+                autogenerate_column_names=not self.has_header
+            ),
+            parse_options=pa_csv.ParseOptions(delimiter=self.delimiter),
+            convert_options=pa_csv.ConvertOptions(
+                column_types=column_types,
+                strings_can_be_null=True
+            )
+        )
+
+    def _read_arrow_chunks(self, batch_size: int) -> Iterator[List[Dict]]:
+        """
+        Read the file with pyarrow, one list of row dictionaries per batch
+
+        Date and timestamp columns are kept as strings, as pandas does.
+        pyarrow fixes column types from the first block; if a later block
+        does not fit them, the rest of the file is read with pandas.
+
+        Args:
+            batch_size: Rows per chunk if reading falls back to pandas
+
+        Yields:
+            List[Dict]: Rows of one record batch
+        """
+        reader = self._open_arrow_reader()
+        temporal = {
+            field.name: pa.string() for field in reader.schema
+            if pa.types.is_temporal(field.type)
+        }
+        if temporal:
+            reader.close()
+            reader = self._open_arrow_reader(temporal)
+
+        rows_read = 0
+        try:
+            while True:
+                try:
+                    batch = reader.read_next_batch()
+                except StopIteration:
+                    return
+                except pa.ArrowInvalid as e:
+                    self.logger.warning(
+                        f"pyarrow could not parse {self.file_path} past row "
+                        f"{rows_read} ({e}); reading the rest with pandas"
+                    )
+                    break
+
+                rows_read += batch.num_rows
+                yield batch.to_pylist()
+        finally:
+            reader.close()
+
+        yield from self._read_pandas_chunks(
+            batch_size,
+            skip_rows=rows_read,
+            names=None if self.has_header else reader.schema.names
+        )
+
     def get_schema(self) -> Schema:
         """
         Infer schema from CSV file
@@ -149,14 +339,14 @@ class CSVSource(SourceAdapter):
                 **self.pandas_kwargs
             )
 
+            # Check for nulls in all columns at once
+            has_nulls = sample_df.isna().any().to_dict()
+
             fields = []
             for col_name, dtype in sample_df.dtypes.items():
                 # Map pandas dtype to our FieldType
                 field_type = self._map_pandas_dtype(dtype)
-
-                # Check for nulls
-                null_count = sample_df[col_name].isnull().sum()
-                nullable = null_count > 0
+                nullable = bool(has_nulls[col_name])
 
                 field = Field(
                     name=str(col_name),
@@ -183,20 +373,7 @@ class CSVSource(SourceAdapter):
 
     def _map_pandas_dtype(self, dtype) -> FieldType:
         """Map pandas dtype to FieldType"""
-        dtype_str = str(dtype)
-
-        if 'int' in dtype_str:
-            return FieldType.INTEGER
-        elif 'float' in dtype_str:
-            return FieldType.FLOAT
-        elif 'bool' in dtype_str:
-            return FieldType.BOOLEAN
-        elif 'datetime' in dtype_str:
-            return FieldType.DATETIME
-        elif 'object' in dtype_str:
-            return FieldType.STRING
-        else:
-            return FieldType.STRING  # Default to string
+        return DTYPE_KIND_TYPES.get(getattr(dtype, 'kind', 'O'), FieldType.STRING)
 
     def supports_incremental(self) -> bool:
         """CSV files support incremental via file hash comparison"""
@@ -206,7 +383,7 @@ class CSVSource(SourceAdapter):
         """Get current state for incremental processing"""
         return {
             'file_path': str(self.file_path),
-            'file_hash': self._file_hash,
+            'file_hash': self._get_file_hash(),
             'last_modified': self.file_path.stat().st_mtime,
             'rows_processed': self._current_row
         }
@@ -1,17 +1,113 @@
 """
 JSON source adapter for reading JSON and JSONL files
 """
+import codecs
 import hashlib
 import json
+import mmap
+from collections import defaultdict, deque
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict
 from datetime import datetime
+from itertools import islice
 from pathlib import Path
-from typing import Any, Dict, Iterator, List, Optional, Union
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple, Union
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+try:
+    import ijson
+    HAS_IJSON = True
+except ImportError:
+    HAS_IJSON = False
 
 from src.adapters.base import SourceAdapter
 from src.common.models import Field, FieldType, Record, RecordMetadata, Schema
 from src.common.exceptions import ConnectionError, ReadError
 
 
+# Python type names for the ijson event that starts a value, for error messages
+_IJSON_VALUE_TYPES = {
+    'start_map': 'dict',
+    'start_array': 'list',
+    'string': 'str',
+    'number': 'number',
+    'boolean': 'bool',
+    'null': 'NoneType',
+}
+
+# Whitespace bytes skipped when sniffing a file's format
+_JSON_WHITESPACE = b' \t\r\n'
+
+# Change-detection methods for get_state(): 'fingerprint' (size and mtime,
+# no file read) or 'sha256' (content hash, reads the whole file)
+HASH_ALGOS = ('fingerprint', 'sha256')
+
+# Records sampled by get_schema()
+SCHEMA_SAMPLE_SIZE = 100
+
+# Records stamped with one extracted_at before it is refreshed
+EXTRACTED_AT_INTERVAL = 1000
+
+# Read size when hashing without hashlib.file_digest (Python < 3.11)
+HASH_CHUNK_SIZE = 1024 * 1024
+
+# Bytes of JSONL handed to each parallelism worker task; files no larger
+# than one chunk are parsed in-process
+PARALLEL_CHUNK_SIZE = 4 * 1024 * 1024
+
+
+# Most distinct keys _intern_keys() pools; keys seen after that are only
+# shared if already pooled, so files with data-like keys stay bounded
+KEY_POOL_SIZE = 10_000
+
+
+def _intern_keys(data: Dict[str, Any], key_pool: Dict[str, str]) -> Dict[str, Any]:
+    """Rebuild a record dict with its keys taken from key_pool, so equal keys across records share one str"""
+    if len(key_pool) < KEY_POOL_SIZE:
+        return {key_pool.setdefault(key, key): value for key, value in data.items()}
+    return {key_pool.get(key, key): value for key, value in data.items()}
+
+
+def _parse_jsonl_chunk(
+    file_path: str,
+    start: int,
+    end: int,
+    use_orjson: bool
+) -> Tuple[int, List[Tuple[int, Any]], List[Tuple[int, str]]]:
+    """
+    Parse the JSONL lines in bytes [start, end) of a file in a worker process
+
+    Returns:
+        Tuple of (line count, [(line index, value)], [(line index, error)])
+    """
+    loads = orjson.loads if use_orjson else json.loads
+
+    with open(file_path, 'rb') as f:
+        f.seek(start)
+        lines = f.read(end - start).split(b'\n')
+    # Chunks end just after a newline, which leaves an empty last element
+    if not lines[-1]:
+        lines.pop()
+
+    values = []
+    errors = []
+    for idx, line in enumerate(lines):
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            values.append((idx, loads(line)))
+        except json.JSONDecodeError as e:
+            errors.append((idx, str(e)))
+
+    return len(lines), values, errors
+
+
 class JSONSource(SourceAdapter):
     """Source adapter for JSON and JSONL files"""
 
@@ -21,6 +117,9 @@ class JSONSource(SourceAdapter):
         encoding: str = "utf-8",
         mode: str = "auto",  # 'auto', 'array', 'lines'
         json_path: Optional[str] = None,  # Path to nested array (e.g., "data.records")
+        hash_algo: str = "fingerprint",
+        schema_cache_dir: Optional[str] = None,
+        parallelism: int = 1,
         **kwargs
     ):
         """
@@ -34,13 +133,36 @@ class JSONSource(SourceAdapter):
                 - 'array': JSON array of objects
                 - 'lines': JSONL (one JSON object per line)
             json_path: Dot-notation path to nested array (e.g., "data.records")
+            hash_algo: File hash reported by get_state() - 'fingerprint'
+                (default, '<size>-<mtime_ns>') or 'sha256' (content hash).
+                Computed on the first get_state() call
+            schema_cache_dir: Directory to cache the inferred schema in, one
+                JSON file per source path; it is reused while the file's
+                size and mtime are unchanged (default: None, no caching)
+            parallelism: Worker processes parsing JSONL in
+                PARALLEL_CHUNK_SIZE chunks (default: 1, off). Records keep
+                file order; needs a UTF-8 file larger than one chunk. Pays
+                off with the stdlib json fallback - returning orjson's
+                output from the workers costs about as much as parsing it
             **kwargs: Additional configuration
         """
+        if parallelism < 1:
+            raise ValueError(f"parallelism must be at least 1, got {parallelism}")
+
+        if hash_algo not in HASH_ALGOS:
+            raise ValueError(
+                f"Invalid hash_algo '{hash_algo}'. "
+                f"Must be one of: {', '.join(HASH_ALGOS)}"
+            )
+
         config = {
             'file_path': file_path,
             'encoding': encoding,
             'mode': mode,
             'json_path': json_path,
+            'hash_algo': hash_algo,
+            'schema_cache_dir': schema_cache_dir,
+            'parallelism': parallelism,
             **kwargs
         }
         super().__init__(config)
@@ -49,6 +171,14 @@ class JSONSource(SourceAdapter):
         self.encoding = encoding
         self.mode = mode
         self.json_path = json_path
+        self.hash_algo = hash_algo
+        self.schema_cache_dir = Path(schema_cache_dir) if schema_cache_dir else None
+        self.parallelism = parallelism
+
+        # orjson and ijson parse UTF-8 only; other encodings use stdlib json
+        self._utf8 = codecs.lookup(encoding).name == 'utf-8'
+        self._use_orjson = HAS_ORJSON and self._utf8
+        self._loads = orjson.loads if self._use_orjson else json.loads
 
         self._file_hash: Optional[str] = None
         self._records_count = 0
@@ -64,47 +194,94 @@ class JSONSource(SourceAdapter):
         self._connected = True
         self.logger.info(f"Connected to JSON file: {self.file_path}")
 
-        # Calculate file hash for state tracking
-        self._file_hash = self._calculate_file_hash()
+        # File hash for state tracking is computed lazily by get_state()
+        self._file_hash = None
 
         # Auto-detect mode if set to 'auto'
         if self.mode == 'auto':
             self.mode = self._detect_mode()
             self.logger.info(f"Auto-detected mode: {self.mode}")
 
+    def _get_file_hash(self) -> str:
+        """Get the file's change-detection hash, computing it on first use"""
+        if self._file_hash is None:
+            if self.hash_algo == 'sha256':
+                self._file_hash = self._calculate_file_hash()
+            else:
+                stat = self.file_path.stat()
+                self._file_hash = f"{stat.st_size}-{stat.st_mtime_ns}"
+        return self._file_hash
+
     def _calculate_file_hash(self) -> str:
         """Calculate SHA256 hash of file for change detection"""
-        sha256 = hashlib.sha256()
         with open(self.file_path, 'rb') as f:
-            for chunk in iter(lambda: f.read(8192), b''):
+            if hasattr(hashlib, 'file_digest'):
+                # Python 3.11+: hashes in C straight from the file descriptor
+                return hashlib.file_digest(f, 'sha256').hexdigest()
+
+            sha256 = hashlib.sha256()
+            for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b''):
                 sha256.update(chunk)
         return sha256.hexdigest()
 
     def _detect_mode(self) -> str:
-        """Auto-detect JSON format"""
+        """
+        Auto-detect JSON format from the start of the file
+
+        Only the first non-whitespace character (and, for '{', the end
+        of its line) is looked at; nothing is parsed. JSONL is a '{' whose
+        object closes on the same line. Anything else - an array, a
+        pretty-printed object, or an object searched with json_path - is
+        read as a single JSON document.
+        """
         try:
+            if self._utf8:
+                return self._detect_mode_mmap()
+
             with open(self.file_path, 'r', encoding=self.encoding) as f:
-                first_line = f.readline().strip()
+                first_char = f.read(1)
+                while first_char.isspace():
+                    first_char = f.read(1)
 
-                # Check if it's JSONL (object on first line)
-                if first_line.startswith('{') and first_line.endswith('}'):
-                    try:
-                        json.loads(first_line)
+                if first_char == '{' and not self.json_path:
+                    if f.readline().rstrip().endswith('}'):
                         return 'lines'
-                    except json.JSONDecodeError:
-                        pass
 
-                # Check if it's JSON array
-                if first_line.startswith('['):
-                    return 'array'
-
-                # Default to array
                 return 'array'
 
         except Exception as e:
             self.logger.warning(f"Error detecting mode: {e}, defaulting to 'array'")
             return 'array'
 
+    def _detect_mode_mmap(self) -> str:
+        """
+        _detect_mode() for UTF-8 files, peeking at the bytes through a memory map
+
+        The first line is located with mmap.find() and only its last
+        non-whitespace byte is checked, so a long first line (such as a
+        whole document on one line) is never read into memory or decoded.
+        """
+        with open(self.file_path, 'rb') as f:
+            # mmap cannot map an empty file
+            if not self.file_path.stat().st_size:
+                return 'array'
+
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                size = len(mm)
+                start = 0
+                while start < size and mm[start] in _JSON_WHITESPACE:
+                    start += 1
+
+                if start == size or mm[start] != ord('{') or self.json_path:
+                    return 'array'
+
+                end = mm.find(b'\n', start)
+                last = (size if end == -1 else end) - 1
+                while last > start and mm[last] in _JSON_WHITESPACE:
+                    last -= 1
+
+                return 'lines' if last > start and mm[last] == ord('}') else 'array'
+
     def read(self, batch_size: int = 100) -> Iterator[Record]:
         """
         Read records from JSON file
@@ -133,72 +310,239 @@ class JSONSource(SourceAdapter):
 
     def _read_jsonl(self) -> Iterator[Record]:
         """Read JSONL file (one JSON object per line)"""
-        with open(self.file_path, 'r', encoding=self.encoding) as f:
-            for line_num, line in enumerate(f, 1):
-                line = line.strip()
-                if not line:
-                    continue
+        source_id = str(self.file_path)
+
+        use_workers = (
+            self.parallelism > 1
+            and self._utf8
+            and self.file_path.stat().st_size > PARALLEL_CHUNK_SIZE
+        )
+        values = self._parse_jsonl_parallel() if use_workers else self._parse_jsonl()
+
+        # orjson already reuses key strings across calls; stdlib json and
+        # unpickled worker output create fresh ones for every record
+        key_pool = {} if use_workers or not self._use_orjson else None
+
+        for idx, (line_num, data) in enumerate(values):
+            if idx % EXTRACTED_AT_INTERVAL == 0:
+                extracted_at = datetime.now()
+
+            if key_pool is not None and isinstance(data, dict):
+                data = _intern_keys(data, key_pool)
+
+            # Create metadata
+            metadata = RecordMetadata(
+                source_type="jsonl",
+                source_id=source_id,
+                record_id=f"line_{line_num}",
+                stage="extract"
+            )
 
-                try:
-                    data = json.loads(line)
+            # Create record
+            record = Record(
+                data=data if isinstance(data, dict) else {"value": data},
+                metadata=metadata,
+                extracted_at=extracted_at
+            )
 
-                    # Create metadata
-                    metadata = RecordMetadata(
-                        source_type="jsonl",
-                        source_id=str(self.file_path),
-                        record_id=f"line_{line_num}",
-                        stage="extract"
-                    )
+            yield record
+            self._records_count += 1
 
-                    # Create record
-                    record = Record(
-                        data=data if isinstance(data, dict) else {"value": data},
-                        metadata=metadata,
-                        extracted_at=datetime.now()
-                    )
+    def _parse_jsonl(self) -> Iterator[Tuple[int, Any]]:
+        """Yield (line number, value) for each non-blank JSONL line"""
+        for line_num, line in enumerate(self._iter_jsonl_lines(), 1):
+            line = line.strip()
+            if not line:
+                continue
 
-                    yield record
-                    self._records_count += 1
+            try:
+                yield line_num, self._loads(line)
+            except json.JSONDecodeError as e:
+                self.logger.warning(f"Invalid JSON on line {line_num}: {e}")
+                continue
 
-                except json.JSONDecodeError as e:
-                    self.logger.warning(f"Invalid JSON on line {line_num}: {e}")
+    def _parse_jsonl_parallel(self) -> Iterator[Tuple[int, Any]]:
+        """
+        Yield (line number, value) for each non-blank JSONL line, parsed by
+        parallelism worker processes
+
+        The file is cut into PARALLEL_CHUNK_SIZE chunks, each boundary moved
+        forward to just past the next newline. At most two chunks per worker
+        are in flight, and results are yielded in file order.
+        """
+        pool = ProcessPoolExecutor(max_workers=self.parallelism)
+        pending = deque()
+        line_offset = 0
+
+        try:
+            for start, end in self._jsonl_chunks():
+                pending.append(pool.submit(
+                    _parse_jsonl_chunk, str(self.file_path), start, end, self._use_orjson
+                ))
+                if len(pending) < 2 * self.parallelism:
                     continue
+                line_offset = yield from self._drain_jsonl_chunk(pending.popleft(), line_offset)
+
+            while pending:
+                line_offset = yield from self._drain_jsonl_chunk(pending.popleft(), line_offset)
+        finally:
+            pool.shutdown(cancel_futures=True)
+
+    def _drain_jsonl_chunk(self, future, line_offset: int):
+        """
+        Yield a worker's parsed lines numbered from line_offset
+
+        Returns:
+            int: Line offset for the next chunk
+        """
+        line_count, values, errors = future.result()
+
+        for idx, error in errors:
+            self.logger.warning(f"Invalid JSON on line {line_offset + idx + 1}: {error}")
+        for idx, value in values:
+            yield line_offset + idx + 1, value
+
+        return line_offset + line_count
+
+    def _jsonl_chunks(self) -> Iterator[Tuple[int, int]]:
+        """Yield (start, end) byte ranges of about PARALLEL_CHUNK_SIZE ending on line boundaries"""
+        with open(self.file_path, 'rb') as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                size = len(mm)
+                start = 0
+                while start < size:
+                    newline = mm.find(b'\n', min(start + PARALLEL_CHUNK_SIZE, size) - 1)
+                    end = size if newline == -1 else newline + 1
+                    yield start, end
+                    start = end
+
+    def _iter_jsonl_lines(self) -> Iterator[Union[bytes, str]]:
+        """
+        Yield the file's lines, including blank ones
+
+        With orjson, lines are bytes read from a memory map (mmap.readline()
+        finds each newline with memchr), skipping the text decode; otherwise
+        lines come from a text-mode file.
+        """
+        if not self._use_orjson:
+            with open(self.file_path, 'r', encoding=self.encoding) as f:
+                yield from f
+            return
+
+        with open(self.file_path, 'rb') as f:
+            # mmap cannot map an empty file
+            if not self.file_path.stat().st_size:
+                return
+
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                yield from iter(mm.readline, b'')
 
     def _read_json_array(self) -> Iterator[Record]:
         """Read JSON file containing an array of objects"""
-        with open(self.file_path, 'r', encoding=self.encoding) as f:
-            data = json.load(f)
-
-            # Navigate to nested path if specified
-            if self.json_path:
-                data = self._get_nested_value(data, self.json_path)
-
-            # Ensure data is a list
-            if not isinstance(data, list):
-                raise ReadError(
-                    f"JSON data is not an array. Found: {type(data).__name__}. "
-                    f"Use json_path parameter if data is nested."
-                )
+        if HAS_IJSON and self._utf8:
+            items = self._stream_json_array()
+            # ijson builds each item separately, so keys are not shared
+            key_pool = {}
+        else:
+            items = self._load_json_array()
+            key_pool = None
 
-            # Iterate through array
-            for idx, item in enumerate(data):
-                # Create metadata
-                metadata = RecordMetadata(
-                    source_type="json",
-                    source_id=str(self.file_path),
-                    record_id=f"item_{idx}",
-                    stage="extract"
-                )
+        source_id = str(self.file_path)
 
-                # Create record
-                record = Record(
-                    data=item if isinstance(item, dict) else {"value": item},
-                    metadata=metadata,
-                    extracted_at=datetime.now()
-                )
+        # Iterate through array
+        for idx, item in enumerate(items):
+            if idx % EXTRACTED_AT_INTERVAL == 0:
+                extracted_at = datetime.now()
+
+            if key_pool is not None and isinstance(item, dict):
+                item = _intern_keys(item, key_pool)
+
+            # Create metadata
+            metadata = RecordMetadata(
+                source_type="json",
+                source_id=source_id,
+                record_id=f"item_{idx}",
+                stage="extract"
+            )
+
+            # Create record
+            record = Record(
+                data=item if isinstance(item, dict) else {"value": item},
+                metadata=metadata,
+                extracted_at=extracted_at
+            )
+
+            yield record
+            self._records_count += 1
+
+    def _stream_json_array(self) -> Iterator[Any]:
+        """
+        Yield the array's items as ijson parses them
 
-                yield record
-                self._records_count += 1
+        Only one item is held in memory at a time, so arrays larger than
+        memory can be read. If nothing is yielded, the file is scanned
+        again to tell an empty array from a missing or non-array value.
+        """
+        prefix = f"{self.json_path}.item" if self.json_path else "item"
+        missing = object()
+
+        with open(self.file_path, 'rb') as f:
+            items = ijson.items(f, prefix, use_float=True)
+            first = next(items, missing)
+            if first is missing:
+                self._check_json_array()
+                return
+            yield first
+            yield from items
+
+    def _check_json_array(self) -> None:
+        """
+        Check that json_path (or the document) is an array, streaming the file
+
+        Raises:
+            ReadError: If the path is missing or not an array
+        """
+        path = self.json_path or ''
+
+        with open(self.file_path, 'rb') as f:
+            for prefix, event, _ in ijson.parse(f):
+                if prefix == path and event in _IJSON_VALUE_TYPES:
+                    if event == 'start_array':
+                        return
+                    raise ReadError(
+                        f"JSON data is not an array. Found: {_IJSON_VALUE_TYPES[event]}. "
+                        f"Use json_path parameter if data is nested."
+                    )
+
+        raise ReadError(f"Invalid json_path: '{path}' not found")
+
+    def _load_json_array(self) -> List[Any]:
+        """
+        Parse the whole file and return the array at json_path
+
+        Raises:
+            ReadError: If the path is missing or not an array
+        """
+        if self._use_orjson:
+            # orjson parses the raw bytes, skipping the decode to str
+            with open(self.file_path, 'rb') as f:
+                data = orjson.loads(f.read())
+        else:
+            with open(self.file_path, 'r', encoding=self.encoding) as f:
+                data = json.load(f)
+
+        # Navigate to nested path if specified
+        if self.json_path:
+            data = self._get_nested_value(data, self.json_path)
+
+        # Ensure data is a list
+        if not isinstance(data, list):
+            raise ReadError(
+                f"JSON data is not an array. Found: {type(data).__name__}. "
+                f"Use json_path parameter if data is nested."
+            )
+
+        return data
 
     def _get_nested_value(self, data: Any, path: str) -> Any:
         """
@@ -232,31 +576,38 @@ class JSONSource(SourceAdapter):
         if not self._connected:
             self.connect()
 
+        if self.schema_cache_dir is not None:
+            fingerprint = self._get_fingerprint()
+            schema = self._load_cached_schema(fingerprint)
+            if schema is not None:
+                self.logger.info(f"Using cached schema with {len(schema.fields)} fields")
+                return schema
+
         try:
-            # Read sample to infer schema
-            sample = []
-            for i, record in enumerate(self.read()):
-                sample.append(record.data)
-                if i >= 99:  # Sample first 100 records
-                    break
-
-            if not sample:
+            # Collect each key's value types and nulls in one pass over the sample
+            value_types: Dict[str, Set[str]] = defaultdict(set)
+            nullable_keys: Set[str] = set()
+            sample_size = 0
+
+            for record in islice(self.read(), SCHEMA_SAMPLE_SIZE):
+                sample_size += 1
+                for key, value in record.data.items():
+                    types = value_types[key]
+                    if value is None:
+                        nullable_keys.add(key)
+                    else:
+                        types.add(type(value).__name__)
+
+            if not sample_size:
                 raise ReadError("No records found to infer schema")
 
-            # Get all unique keys across samples
-            all_keys = set()
-            for item in sample:
-                all_keys.update(item.keys())
-
             # Infer type for each field
             fields = []
-            for key in sorted(all_keys):
-                field_type, nullable = self._infer_field_type(sample, key)
-
+            for key in sorted(value_types):
                 field = Field(
                     name=key,
-                    type=field_type,
-                    nullable=nullable,
+                    type=self._infer_field_type(value_types[key]),
+                    nullable=key in nullable_keys,
                     inferred=True,
                     confidence=0.85
                 )
@@ -267,46 +618,110 @@ class JSONSource(SourceAdapter):
                 fields=fields,
                 inferred=True,
                 created_at=datetime.now(),
-                sample_size=len(sample)
+                sample_size=sample_size
             )
 
             self.logger.info(f"Inferred schema with {len(fields)} fields")
-            return schema
 
         except Exception as e:
             raise ReadError(f"Error inferring schema: {e}")
 
-    def _infer_field_type(self, sample: List[Dict], key: str) -> tuple:
+        if self.schema_cache_dir is not None:
+            self._save_cached_schema(fingerprint, schema)
+
+        return schema
+
+    def _get_fingerprint(self) -> List[Any]:
+        """Fingerprint the schema cache is keyed on - no file bytes are read"""
+        stat = self.file_path.stat()
+        return [stat.st_size, stat.st_mtime_ns, self.mode, self.json_path, self.encoding]
+
+    def _schema_cache_path(self) -> Path:
+        """Cache file for this source's absolute path"""
+        path_hash = hashlib.sha1(str(self.file_path.resolve()).encode('utf-8')).hexdigest()
+        return self.schema_cache_dir / f"{path_hash}.json"
+
+    def _load_cached_schema(self, fingerprint: List[Any]) -> Optional[Schema]:
         """
-        Infer field type from sample data
+        Load the cached schema if the file is unchanged since it was inferred
+
+        Args:
+            fingerprint: Current fingerprint from _get_fingerprint()
+
+        Returns:
+            Cached Schema, or None on a miss or an unreadable cache file
+        """
+        try:
+            with open(self._schema_cache_path(), 'r', encoding='utf-8') as f:
+                cached = json.load(f)
+
+            if cached['fingerprint'] != fingerprint:
+                return None
+
+            schema_dict = cached['schema']
+            fields = [
+                Field(**{**field_dict, 'type': FieldType(field_dict['type'])})
+                for field_dict in schema_dict['fields']
+            ]
+            created_at = schema_dict['created_at']
+            return Schema(**{
+                **schema_dict,
+                'fields': fields,
+                'created_at': datetime.fromisoformat(created_at) if created_at else None,
+            })
+
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            self.logger.debug(f"Ignoring unreadable schema cache: {e}")
+            return None
+
+    def _save_cached_schema(self, fingerprint: List[Any], schema: Schema) -> None:
+        """
+        Write the inferred schema to the cache (failures are logged, not raised)
+
+        Args:
+            fingerprint: Fingerprint the schema was inferred at
+            schema: Inferred schema
+        """
+        schema_dict = asdict(schema)
+        for field_dict in schema_dict['fields']:
+            field_dict['type'] = field_dict['type'].value
+        if schema.created_at:
+            schema_dict['created_at'] = schema.created_at.isoformat()
+
+        cache_path = self._schema_cache_path()
+        tmp_path = cache_path.with_suffix('.tmp')
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump({'fingerprint': fingerprint, 'schema': schema_dict}, f, default=str)
+            tmp_path.replace(cache_path)
+        except (OSError, TypeError, ValueError) as e:
+            self.logger.debug(f"Could not write schema cache: {e}")
+
+    def _infer_field_type(self, type_names: Set[str]) -> FieldType:
+        """
+        Infer field type from the value types seen in the sample
+
+        Args:
+            type_names: Type names of the field's non-null values
 
         Returns:
-            (FieldType, nullable)
+            FieldType (STRING if only nulls were seen)
         """
-        values = [item.get(key) for item in sample if key in item]
-        non_null_values = [v for v in values if v is not None]
-
-        # Check if nullable
-        nullable = len(non_null_values) < len(values)
-
-        if not non_null_values:
-            return FieldType.STRING, True
-
-        # Infer type from non-null values
-        types = set(type(v).__name__ for v in non_null_values)
-
-        if 'dict' in types:
-            return FieldType.JSON, nullable
-        elif 'list' in types:
-            return FieldType.ARRAY, nullable
-        elif 'bool' in types:
-            return FieldType.BOOLEAN, nullable
-        elif 'int' in types:
-            return FieldType.INTEGER, nullable
-        elif 'float' in types:
-            return FieldType.FLOAT, nullable
+        if 'dict' in type_names:
+            return FieldType.JSON
+        elif 'list' in type_names:
+            return FieldType.ARRAY
+        elif 'bool' in type_names:
+            return FieldType.BOOLEAN
+        elif 'int' in type_names:
+            return FieldType.INTEGER
+        elif 'float' in type_names:
+            return FieldType.FLOAT
         else:
-            return FieldType.STRING, nullable
+            return FieldType.STRING
 
     def supports_incremental(self) -> bool:
         """JSON files support incremental via file hash comparison"""
@@ -316,7 +731,7 @@ class JSONSource(SourceAdapter):
         """Get current state for incremental processing"""
         return {
             'file_path': str(self.file_path),
-            'file_hash': self._file_hash,
+            'file_hash': self._get_file_hash(),
             'last_modified': self.file_path.stat().st_mtime,
             'records_processed': self._records_count
         }
@@ -1,21 +1,68 @@
 """
 PostgreSQL source adapter for reading from PostgreSQL database
 """
+import json
+import uuid
 from datetime import datetime
-from typing import Any, Dict, Iterator, Optional
+from decimal import Decimal
+from typing import Any, Callable, Dict, Iterator, List, Optional
+from urllib.parse import quote
 
 try:
     import psycopg2
     import psycopg2.extras
+    import psycopg2.sql
     HAS_PSYCOPG2 = True
 except ImportError:
     HAS_PSYCOPG2 = False
 
+try:
+    import psycopg
+    import psycopg.rows
+    import psycopg.sql
+    HAS_PSYCOPG = True
+except ImportError:
+    HAS_PSYCOPG = False
+
+try:
+    import adbc_driver_postgresql.dbapi as adbc_postgresql
+    HAS_ADBC = True
+except ImportError:
+    HAS_ADBC = False
+
 from src.adapters.base import SourceAdapter
 from src.common.models import Field, FieldType, Record, RecordMetadata, Schema
 from src.common.exceptions import ConnectionError, ReadError
 
 
+# Database errors of whichever drivers are installed (psycopg2, psycopg 3 and/or ADBC)
+_DB_ERRORS = tuple(
+    [psycopg2.Error] if HAS_PSYCOPG2 else []
+) + tuple(
+    [psycopg.Error] if HAS_PSYCOPG else []
+) + tuple(
+    [adbc_postgresql.Error] if HAS_ADBC else []
+)
+
+# Field metadata key ADBC uses to record the PostgreSQL type name
+_ADBC_TYPNAME = b'ADBC:postgresql:typname'
+
+
+def _arrow_converter(field: Any) -> Optional[Callable[[Any], Any]]:
+    """
+    Get the conversion matching psycopg2's result types for an ADBC column
+    (a pyarrow.Field from the ADBC result schema)
+
+    ADBC hands json/jsonb as JSON text and numeric as its string form;
+    psycopg2 returns them parsed and as Decimal.
+    """
+    if getattr(field.type, 'extension_name', None) == 'arrow.json':
+        return json.loads
+    if field.metadata and field.metadata.get(_ADBC_TYPNAME) == b'numeric':
+        return Decimal
+    return None
+
+
 class PostgreSQLSource(SourceAdapter):
     """Source adapter for PostgreSQL database"""
 
@@ -29,6 +76,10 @@ class PostgreSQLSource(SourceAdapter):
         table: Optional[str] = None,
         query: Optional[str] = None,
         schema: str = "public",
+        columns: Optional[List[str]] = None,
+        where: Optional[str] = None,
+        use_copy: bool = False,
+        use_binary: bool = False,
         **kwargs
     ):
         """
@@ -43,13 +94,39 @@ class PostgreSQLSource(SourceAdapter):
             table: Table name to read from (if not using custom query)
             query: Custom SQL query (overrides table)
             schema: Schema name (default: 'public')
+            columns: Columns to select from the table (default: None, all).
+                Only these are sent by the server
+            where: SQL condition filtering the table's rows on the server,
+                e.g. "updated_at > '2024-01-01'" (default: None). Inserted
+                into the query as-is, so it must come from trusted config
+            use_copy: Read rows with the ADBC PostgreSQL driver, which
+                extracts them with COPY ... TO STDOUT (FORMAT BINARY) and
+                decodes whole columns into Arrow batches (default: False).
+                Requires adbc-driver-postgresql
+            use_binary: Connect with psycopg 3 instead of psycopg2 and fetch
+                rows over the binary protocol, so integers, numerics and
+                timestamps are decoded from their binary form instead of
+                being parsed from text (default: False). Columns of types
+                psycopg 3 has no binary loader for (e.g. enums) come back
+                as bytes
             **kwargs: Additional psycopg2 connection parameters
         """
-        if not HAS_PSYCOPG2:
+        if use_binary:
+            if not HAS_PSYCOPG:
+                raise ImportError(
+                    "psycopg 3 is required for use_binary=True. "
+                    "Install it with: pip install 'psycopg[binary]>=3.1'"
+                )
+        elif not HAS_PSYCOPG2:
             raise ImportError(
                 "psycopg2 is required for PostgreSQL support. "
                 "Install it with: pip install psycopg2-binary"
             )
+        if use_copy and not HAS_ADBC:
+            raise ImportError(
+                "adbc-driver-postgresql is required for use_copy=True. "
+                "Install it with: pip install adbc-driver-postgresql"
+            )
 
         config = {
             'host': host,
@@ -60,6 +137,10 @@ class PostgreSQLSource(SourceAdapter):
             'table': table,
             'query': query,
             'schema': schema,
+            'columns': columns,
+            'where': where,
+            'use_copy': use_copy,
+            'use_binary': use_binary,
             **kwargs
         }
         super().__init__(config)
@@ -72,36 +153,68 @@ class PostgreSQLSource(SourceAdapter):
         self.table = table
         self.query = query
         self.schema_name = schema
+        self.columns = columns
+        self.where = where
+        self.use_copy = use_copy
+        self.use_binary = use_binary
 
         if not table and not query:
             raise ValueError("Either 'table' or 'query' must be specified")
 
-        self._conn: Optional[psycopg2.extensions.connection] = None
-        self._cursor: Optional[psycopg2.extensions.cursor] = None
+        if query and (columns or where):
+            raise ValueError("'columns' and 'where' apply to 'table' and cannot be combined with 'query'")
+
+        if columns is not None and not columns:
+            raise ValueError("'columns' must name at least one column")
+
+        self._conn = None  # psycopg2 connection, or psycopg 3 with use_binary
+        self._cursor = None
+        self._adbc_conn = None
         self._records_count = 0
 
     def connect(self) -> None:
         """Establish connection to PostgreSQL database"""
         try:
-            self._conn = psycopg2.connect(
-                host=self.host,
-                port=self.port,
-                database=self.database,
-                user=self.user,
-                password=self.password
-            )
+            # Sources only read; named cursors in read() run in a read-only transaction
+            if self.use_binary:
+                self._conn = psycopg.connect(
+                    host=self.host,
+                    port=self.port,
+                    dbname=self.database,
+                    user=self.user,
+                    password=self.password
+                )
+                self._conn.read_only = True
 
-            # Use DictCursor to get results as dictionaries
-            self._cursor = self._conn.cursor(
-                cursor_factory=psycopg2.extras.RealDictCursor
-            )
+                # Dictionary rows for get_schema()
+                self._cursor = self._conn.cursor(row_factory=psycopg.rows.dict_row)
+            else:
+                self._conn = psycopg2.connect(
+                    host=self.host,
+                    port=self.port,
+                    database=self.database,
+                    user=self.user,
+                    password=self.password
+                )
+                self._conn.set_session(readonly=True)
+
+                # Use DictCursor to get results as dictionaries
+                self._cursor = self._conn.cursor(
+                    cursor_factory=psycopg2.extras.RealDictCursor
+                )
+
+            if self.use_copy:
+                self._adbc_conn = adbc_postgresql.connect(
+                    f"postgresql://{quote(self.user, safe='')}:{quote(self.password or '', safe='')}"
+                    f"@{self.host}:{self.port}/{quote(self.database, safe='')}"
+                )
 
             self._connected = True
             self.logger.info(
                 f"Connected to PostgreSQL: {self.host}:{self.port}/{self.database}"
             )
 
-        except psycopg2.Error as e:
+        except _DB_ERRORS as e:
             raise ConnectionError(f"Failed to connect to PostgreSQL: {e}")
 
     def read(self, batch_size: int = 1000) -> Iterator[Record]:
@@ -114,53 +227,165 @@ class PostgreSQLSource(SourceAdapter):
         Yields:
             Record: Individual records
         """
+        for records in self.read_batches(batch_size):
+            yield from records
+
+    def read_batches(self, batch_size: int = 1000) -> Iterator[List[Record]]:
+        """
+        Read records from PostgreSQL, one list per fetched batch
+
+        Args:
+            batch_size: Number of rows to fetch at once
+
+        Yields:
+            List[Record]: Records of one batch (up to batch_size)
+        """
         if not self._connected:
             raise ReadError("Not connected. Call connect() first.")
 
         try:
             # Determine query to execute
-            if self.query:
-                sql = self.query
-            else:
-                sql = f"SELECT * FROM {self.schema_name}.{self.table}"
+            sql = self.query or self._build_table_query()
 
             # Execute query
             self.logger.info(f"Executing query: {sql[:100]}...")
-            self._cursor.execute(sql)
-
-            # Fetch and yield records in batches
-            while True:
-                rows = self._cursor.fetchmany(batch_size)
-                if not rows:
-                    break
+            if self.use_copy:
+                batches = self._fetch_arrow_batches(sql, batch_size)
+            else:
+                batches = self._fetch_batches(sql, batch_size)
 
-                for row in rows:
-                    # Convert RealDictRow to regular dict
-                    data = dict(row)
+            source_id = f"{self.database}.{self.schema_name}.{self.table or 'query'}"
 
-                    # Create metadata
-                    metadata = RecordMetadata(
-                        source_type="postgres",
-                        source_id=f"{self.database}.{self.schema_name}.{self.table or 'query'}",
-                        record_id=f"row_{self._records_count}",
-                        stage="extract"
-                    )
+            # Yield records batch by batch; a batch shares one extraction time
+            for rows in batches:
+                extracted_at = datetime.now()
 
-                    # Create record
-                    record = Record(
+                records = [
+                    Record(
                         data=data,
-                        metadata=metadata,
-                        extracted_at=datetime.now()
+                        metadata=RecordMetadata(
+                            source_type="postgres",
+                            source_id=source_id,
+                            record_id=f"row_{row_num}",
+                            stage="extract"
+                        ),
+                        extracted_at=extracted_at
                     )
+                    for row_num, data in enumerate(rows, self._records_count)
+                ]
+                self._records_count += len(records)
 
-                    yield record
-                    self._records_count += 1
+                yield records
 
             self.logger.info(f"Read {self._records_count} records from PostgreSQL")
 
-        except psycopg2.Error as e:
+        except _DB_ERRORS as e:
             raise ReadError(f"Error reading from PostgreSQL: {e}")
 
+    def _build_table_query(self) -> str:
+        """
+        Build the SELECT for table reads, with columns and where pushed down
+
+        Returns:
+            str: Query with quoted identifiers
+        """
+        sql = psycopg.sql if self.use_binary else psycopg2.sql
+
+        if self.columns:
+            select_list = sql.SQL(', ').join(map(sql.Identifier, self.columns))
+        else:
+            select_list = sql.SQL('*')
+
+        query = sql.SQL("SELECT {} FROM {}").format(
+            select_list, sql.Identifier(self.schema_name, self.table)
+        )
+        if self.where:
+            query = sql.SQL("{} WHERE {}").format(query, sql.SQL(self.where))
+
+        return query.as_string(self._conn)
+
+    def _fetch_batches(self, sql: str, batch_size: int) -> Iterator[List[Dict]]:
+        """
+        Run the query on a named (server-side) cursor and yield row batches
+
+        The server sends batch_size rows per round-trip instead of the
+        whole result set up front, so client memory stays bounded. Rows
+        come back as plain tuples and are zipped with the column names
+        once into row dictionaries. With use_binary the cursor asks for
+        binary results.
+
+        Args:
+            sql: Query to run
+            batch_size: Number of rows to fetch at once
+
+        Yields:
+            Lists of row dictionaries
+        """
+        # Unique per read, so concurrent or nested reads never share a cursor
+        name = f"etl_read_{uuid.uuid4().hex}"
+        if self.use_binary:
+            cursor = self._conn.cursor(name=name, binary=True)
+        else:
+            cursor = self._conn.cursor(name=name)
+        try:
+            cursor.itersize = batch_size
+            cursor.execute(sql)
+
+            names = None
+            while True:
+                rows = cursor.fetchmany(batch_size)
+                if not rows:
+                    break
+
+                # A named cursor's description is only set by the first fetch
+                if names is None:
+                    names = tuple(column.name for column in cursor.description)
+
+                yield [dict(zip(names, row)) for row in rows]
+
+        finally:
+            if not self._conn.closed:
+                cursor.close()
+
+    def _fetch_arrow_batches(self, sql: str, batch_size: int) -> Iterator[List[Dict]]:
+        """
+        Run the query through ADBC and yield row batches (use_copy)
+
+        ADBC streams the result with binary COPY into Arrow record
+        batches, which are re-sliced (without copying) to batch_size rows.
+        Each slice is converted to Python one column at a time and then
+        zipped into row dictionaries.
+
+        Args:
+            sql: Query to run
+            batch_size: Number of rows per yielded batch
+
+        Yields:
+            Lists of row dictionaries
+        """
+        cursor = self._adbc_conn.cursor()
+        try:
+            cursor.execute(sql)
+            reader = cursor.fetch_record_batch()
+            names = reader.schema.names
+            converters = [_arrow_converter(field) for field in reader.schema]
+
+            for arrow_batch in reader:
+                for offset in range(0, arrow_batch.num_rows, batch_size):
+                    batch = arrow_batch.slice(offset, batch_size)
+
+                    columns = []
+                    for column, convert in zip(batch.columns, converters):
+                        values = column.to_pylist()
+                        if convert:
+                            values = [None if v is None else convert(v) for v in values]
+                        columns.append(values)
+
+                    yield [dict(zip(names, values)) for values in zip(*columns)]
+
+        finally:
+            cursor.close()
+
     def get_schema(self) -> Schema:
         """
         Get schema from PostgreSQL table
@@ -193,9 +418,12 @@ class PostgreSQLSource(SourceAdapter):
             if not columns:
                 raise ReadError(f"Table not found: {self.schema_name}.{self.table}")
 
-            # Convert to Field objects
+            # Convert to Field objects (only the selected columns, if any)
+            selected = set(self.columns) if self.columns else None
             fields = []
             for col in columns:
+                if selected is not None and col['column_name'] not in selected:
+                    continue
                 field_type = self._map_postgres_type(col['data_type'])
                 nullable = col['is_nullable'] == 'YES'
 
@@ -232,7 +460,7 @@ class PostgreSQLSource(SourceAdapter):
             self.logger.info(f"Retrieved schema with {len(fields)} fields")
             return schema
 
-        except psycopg2.Error as e:
+        except _DB_ERRORS as e:
             raise ReadError(f"Error getting schema: {e}")
 
     def _map_postgres_type(self, pg_type: str) -> FieldType:
@@ -277,6 +505,10 @@ class PostgreSQLSource(SourceAdapter):
         if self._cursor:
             self._cursor.close()
 
+        if self._adbc_conn:
+            self._adbc_conn.close()
+            self._adbc_conn = None
+
         if self._conn:
             self._conn.close()
 
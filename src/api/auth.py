@@ -3,29 +3,67 @@ Authentication module for AI ETL Framework
 Handles password hashing and JWT token management
 """
 import os
-from datetime import datetime, timedelta
+import string
+import time
+from datetime import timedelta
 from typing import Optional, Dict, Any
 
-from passlib.hash import argon2
-from jose import JWTError, jwt
+import jwt
+from argon2 import PasswordHasher
+from argon2.exceptions import InvalidHashError, VerificationError
 
 # Configuration
 SECRET_KEY = os.getenv('JWT_SECRET_KEY', 'dev-secret-key-change-in-production')
+SECRET_KEY_BYTES = SECRET_KEY.encode('utf-8')  # Encoded once, not per token
 ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_HOURS = 24
+ACCESS_TOKEN_EXPIRE_SECONDS = ACCESS_TOKEN_EXPIRE_HOURS * 3600
 MAX_PASSWORD_LENGTH = 128  # Characters
 
+# Shared argon2id hasher; hashes from older parameters still verify and are
+# flagged by password_needs_rehash()
+_password_hasher = PasswordHasher(time_cost=2, memory_cost=64 * 1024, parallelism=2)
+
+# Characters generate_slug() keeps as-is; whitespace becomes '-', the rest is dropped
+_SLUG_CHARS = frozenset(string.ascii_lowercase + string.digits + '-')
+
+
+class _SlugTable(dict):
+    """str.translate() table for generate_slug(), filled in per code point on first use"""
+
+    def __missing__(self, codepoint: int) -> Optional[str]:
+        char = chr(codepoint)
+        if char in _SLUG_CHARS:
+            value = char
+        elif char.isspace():
+            value = '-'
+        else:
+            value = None
+        self[codepoint] = value
+        return value
+
+
+_SLUG_TABLE = _SlugTable()
+
 
 def hash_password(password: str) -> str:
     """Hash a password using argon2 (modern, no length limits)"""
-    return argon2.hash(password)
+    return _password_hasher.hash(password)
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """Verify a password against its hash"""
     try:
-        return argon2.verify(plain_password, hashed_password)
-    except Exception:
+        return _password_hasher.verify(hashed_password, plain_password)
+    except (VerificationError, InvalidHashError):
+        return False
+
+
+def password_needs_rehash(hashed_password: str) -> bool:
+    """Check whether a hash was made with different argon2 parameters"""
+    try:
+        return _password_hasher.check_needs_rehash(hashed_password)
+    except InvalidHashError:
         return False
 
 
@@ -52,10 +90,12 @@ def create_access_token(data: Dict[str, Any], expires_delta: Optional[timedelta]
     Returns:
         Encoded JWT token string
     """
-    to_encode = data.copy()
-    expire = datetime.utcnow() + (expires_delta or timedelta(hours=ACCESS_TOKEN_EXPIRE_HOURS))
-    to_encode.update({"exp": expire})
-    return jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
+    # exp is a Unix timestamp, so skip building datetimes
+    expires_seconds = (
+        int(expires_delta.total_seconds()) if expires_delta else ACCESS_TOKEN_EXPIRE_SECONDS
+    )
+    to_encode = {**data, "exp": int(time.time()) + expires_seconds}
+    return jwt.encode(to_encode, SECRET_KEY_BYTES, algorithm=ALGORITHM)
 
 
 def verify_token(token: str) -> Optional[Dict[str, Any]]:
@@ -69,9 +109,14 @@ def verify_token(token: str) -> Optional[Dict[str, Any]]:
         Decoded payload if valid, None if invalid/expired
     """
     try:
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+        payload = jwt.decode(
+            token,
+            SECRET_KEY_BYTES,
+            algorithms=[ALGORITHM],
+            options={'require': ['exp']}
+        )
         return payload
-    except JWTError:
+    except jwt.PyJWTError:
         return None
 
 
@@ -88,11 +133,12 @@ def extract_token_from_header(authorization: Optional[str]) -> Optional[str]:
     if not authorization:
         return None
 
-    parts = authorization.split()
-    if len(parts) != 2 or parts[0].lower() != 'bearer':
+    scheme, _, token = authorization.partition(' ')
+    token = token.lstrip()
+    if scheme.lower() != 'bearer' or not token or ' ' in token:
         return None
 
-    return parts[1]
+    return token
 
 
 def generate_slug(name: str) -> str:
@@ -105,15 +151,8 @@ def generate_slug(name: str) -> str:
     Returns:
         Lowercase slug with spaces replaced by hyphens
     """
-    import re
-    # Convert to lowercase, replace spaces with hyphens
-    slug = name.lower().strip()
-    # Remove special characters, keep only alphanumeric and hyphens
-    slug = re.sub(r'[^a-z0-9\s-]', '', slug)
-    # Replace spaces with hyphens
-    slug = re.sub(r'\s+', '-', slug)
-    # Remove multiple consecutive hyphens
-    slug = re.sub(r'-+', '-', slug)
-    # Remove leading/trailing hyphens
-    slug = slug.strip('-')
+    # Lowercase, drop special characters and turn whitespace into hyphens
+    slug = name.lower().translate(_SLUG_TABLE)
+    # Collapse hyphen runs and remove leading/trailing hyphens
+    slug = '-'.join(filter(None, slug.split('-')))
     return slug or 'organization'
@@ -5,7 +5,7 @@ Generates ECharts-compatible chart configurations from data analysis.
 Replaces the Plotly-based visualization_generator for the interactive dashboard.
 """
 
-from typing import Dict, List, Any, Optional
+from typing import Any, Callable, Dict, List, Optional, Union
 import pandas as pd
 import numpy as np
 from enum import Enum
@@ -24,8 +24,42 @@ class ChartType(str, Enum):
     GAUGE = "gauge"
 
 
+def _field_values(data: Union[List[Dict], pd.DataFrame], field: str, default: Any) -> List[Any]:
+    """
+    Get one field's values across all records.
+
+    A DataFrame is read as a whole column, without building a dict per
+    row; missing values become None and a missing column gives default.
+
+    Args:
+        data: List of data records, or a DataFrame with one row per record
+        field: Field (column) name
+        default: Value for records without the field
+
+    Returns:
+        List of plain Python values
+    """
+    if isinstance(data, pd.DataFrame):
+        if field not in data.columns:
+            return [default] * len(data)
+        column = data[field]
+        if column.hasnans:
+            column = column.astype(object).where(column.notna(), None)
+        return column.tolist()
+
+    return [d.get(field, default) for d in data]
+
+
+def _field_strings(data: Union[List[Dict], pd.DataFrame], field: str) -> List[str]:
+    """Get one field's values across all records as strings ('' where missing)"""
+    if isinstance(data, pd.DataFrame):
+        return list(map(str, _field_values(data, field, '')))
+
+    return [str(d.get(field, '')) for d in data]
+
+
 def generate_echarts_config(
-    data: List[Dict],
+    data: Union[List[Dict], pd.DataFrame],
     chart_type: ChartType,
     x_field: str,
     y_field: str,
@@ -36,7 +70,7 @@ def generate_echarts_config(
     Generate ECharts configuration from data.
 
     Args:
-        data: List of data records
+        data: List of data records, or a DataFrame (read column-wise)
         chart_type: Type of chart to generate
         x_field: Field name for x-axis/categories
         y_field: Field name for y-axis/values
@@ -47,23 +81,12 @@ def generate_echarts_config(
         ECharts option configuration
     """
 
-    generators = {
-        ChartType.BAR: _generate_bar_config,
-        ChartType.LINE: _generate_line_config,
-        ChartType.PIE: _generate_pie_config,
-        ChartType.SCATTER: _generate_scatter_config,
-        ChartType.AREA: _generate_area_config,
-        ChartType.TREEMAP: _generate_treemap_config,
-        ChartType.HEATMAP: _generate_heatmap_config,
-        ChartType.GAUGE: _generate_gauge_config,
-    }
-
-    generator = generators.get(chart_type, _generate_bar_config)
+    generator = _GENERATORS.get(chart_type, _generate_bar_config)
     return generator(data, x_field, y_field, title, **kwargs)
 
 
 def _generate_bar_config(
-    data: List[Dict],
+    data: Union[List[Dict], pd.DataFrame],
     x_field: str,
     y_field: str,
     title: Optional[str] = None,
@@ -73,8 +96,8 @@ def _generate_bar_config(
 ) -> Dict[str, Any]:
     """Generate bar chart configuration"""
 
-    categories = [str(d.get(x_field, '')) for d in data]
-    values = [d.get(y_field, 0) for d in data]
+    categories = _field_strings(data, x_field)
+    values = _field_values(data, y_field, 0)
 
     config = {
         "title": {"text": title, "left": "center"} if title else None,
@@ -101,8 +124,7 @@ def _generate_bar_config(
             "type": "bar",
             "data": values,
             "emphasis": {"focus": "series"},
-            "itemStyle": {"borderRadius": [4, 4, 0, 0] if not horizontal else [0, 4, 4, 0]},
-            "animationDelay": lambda idx: idx * 30
+            "itemStyle": {"borderRadius": [4, 4, 0, 0] if not horizontal else [0, 4, 4, 0]}
         }],
         "animationEasing": "elasticOut"
     }
@@ -112,7 +134,7 @@ def _generate_bar_config(
 
 
 def _generate_line_config(
-    data: List[Dict],
+    data: Union[List[Dict], pd.DataFrame],
     x_field: str,
     y_field: str,
     title: Optional[str] = None,
@@ -122,8 +144,8 @@ def _generate_line_config(
 ) -> Dict[str, Any]:
     """Generate line chart configuration"""
 
-    categories = [str(d.get(x_field, '')) for d in data]
-    values = [d.get(y_field, 0) for d in data]
+    categories = _field_strings(data, x_field)
+    values = _field_values(data, y_field, 0)
 
     series_config = {
         "type": "line",
@@ -158,7 +180,7 @@ def _generate_line_config(
 
 
 def _generate_pie_config(
-    data: List[Dict],
+    data: Union[List[Dict], pd.DataFrame],
     x_field: str,
     y_field: str,
     title: Optional[str] = None,
@@ -168,8 +190,8 @@ def _generate_pie_config(
     """Generate pie chart configuration"""
 
     pie_data = [
-        {"name": str(d.get(x_field, '')), "value": d.get(y_field, 0)}
-        for d in data
+        {"name": name, "value": value}
+        for name, value in zip(_field_strings(data, x_field), _field_values(data, y_field, 0))
     ]
 
     return {
@@ -205,7 +227,7 @@ def _generate_pie_config(
 
 
 def _generate_scatter_config(
-    data: List[Dict],
+    data: Union[List[Dict], pd.DataFrame],
     x_field: str,
     y_field: str,
     title: Optional[str] = None,
@@ -216,8 +238,8 @@ def _generate_scatter_config(
     """Generate scatter chart configuration"""
 
     scatter_data = [
-        [d.get(x_field, 0), d.get(y_field, 0)]
-        for d in data
+        [x, y]
+        for x, y in zip(_field_values(data, x_field, 0), _field_values(data, y_field, 0))
     ]
 
     series_config = {
@@ -233,16 +255,20 @@ def _generate_scatter_config(
         }
     }
 
+    # Per-point sizes go on the data items, so the config stays plain JSON
     if size_field:
-        sizes = [d.get(size_field, 10) for d in data]
+        sizes = _field_values(data, size_field, 10)
         max_size = max(sizes) if sizes else 1
-        series_config["symbolSize"] = lambda idx: (sizes[idx] / max_size) * 40 + 5
+        series_config["data"] = [
+            {"value": point, "symbolSize": (size / max_size) * 40 + 5}
+            for point, size in zip(scatter_data, sizes)
+        ]
 
     return {
         "title": {"text": title, "left": "center"} if title else None,
         "tooltip": {
             "trigger": "item",
-            "formatter": lambda params: f"{x_field}: {params['value'][0]}<br/>{y_field}: {params['value'][1]}"
+            "formatter": f"{x_field}: {{@[0]}}<br/>{y_field}: {{@[1]}}"
         },
         "grid": {
             "left": "3%",
@@ -264,7 +290,7 @@ def _generate_scatter_config(
 
 
 def _generate_area_config(
-    data: List[Dict],
+    data: Union[List[Dict], pd.DataFrame],
     x_field: str,
     y_field: str,
     title: Optional[str] = None,
@@ -275,7 +301,7 @@ def _generate_area_config(
 
 
 def _generate_treemap_config(
-    data: List[Dict],
+    data: Union[List[Dict], pd.DataFrame],
     name_field: str,
     value_field: str,
     title: Optional[str] = None,
@@ -284,8 +310,8 @@ def _generate_treemap_config(
     """Generate treemap configuration for hierarchical data"""
 
     treemap_data = [
-        {"name": str(d.get(name_field, '')), "value": d.get(value_field, 0)}
-        for d in data
+        {"name": name, "value": value}
+        for name, value in zip(_field_strings(data, name_field), _field_values(data, value_field, 0))
     ]
 
     return {
@@ -323,7 +349,7 @@ def _generate_treemap_config(
 
 
 def _generate_heatmap_config(
-    data: List[Dict],
+    data: Union[List[Dict], pd.DataFrame],
     x_field: str,
     y_field: str,
     value_field: str = "value",
@@ -332,17 +358,20 @@ def _generate_heatmap_config(
 ) -> Dict[str, Any]:
     """Generate heatmap configuration"""
 
-    x_categories = sorted(set(str(d.get(x_field, '')) for d in data))
-    y_categories = sorted(set(str(d.get(y_field, '')) for d in data))
+    x_names = _field_strings(data, x_field)
+    y_names = _field_strings(data, y_field)
+    x_categories = sorted(set(x_names))
+    y_categories = sorted(set(y_names))
+
+    # Category -> axis position, so each cell is placed with a hash lookup
+    x_index = {name: idx for idx, name in enumerate(x_categories)}
+    y_index = {name: idx for idx, name in enumerate(y_categories)}
 
-    heatmap_data = []
-    values = []
-    for d in data:
-        x_idx = x_categories.index(str(d.get(x_field, '')))
-        y_idx = y_categories.index(str(d.get(y_field, '')))
-        value = d.get(value_field, 0)
-        heatmap_data.append([x_idx, y_idx, value])
-        values.append(value)
+    values = _field_values(data, value_field, 0)
+    heatmap_data = [
+        [x_index[x_name], y_index[y_name], value]
+        for x_name, y_name, value in zip(x_names, y_names, values)
+    ]
 
     min_val = min(values) if values else 0
     max_val = max(values) if values else 100
@@ -395,7 +424,7 @@ def _generate_heatmap_config(
 
 
 def _generate_gauge_config(
-    data: List[Dict],
+    data: Union[List[Dict], pd.DataFrame],
     value_field: str,
     max_value: float = 100,
     title: Optional[str] = None,
@@ -403,7 +432,7 @@ def _generate_gauge_config(
 ) -> Dict[str, Any]:
     """Generate gauge chart configuration"""
 
-    value = data[0].get(value_field, 0) if data else 0
+    value = _field_values(data[:1], value_field, 0)[0] if len(data) else 0
 
     return {
         "title": {"text": title, "left": "center"} if title else None,
@@ -443,6 +472,19 @@ def _generate_gauge_config(
     }
 
 
+# Chart type -> config generator used by generate_echarts_config()
+_GENERATORS: Dict[ChartType, Callable[..., Dict[str, Any]]] = {
+    ChartType.BAR: _generate_bar_config,
+    ChartType.LINE: _generate_line_config,
+    ChartType.PIE: _generate_pie_config,
+    ChartType.SCATTER: _generate_scatter_config,
+    ChartType.AREA: _generate_area_config,
+    ChartType.TREEMAP: _generate_treemap_config,
+    ChartType.HEATMAP: _generate_heatmap_config,
+    ChartType.GAUGE: _generate_gauge_config,
+}
+
+
 def suggest_chart_type(df: pd.DataFrame, x_col: str, y_col: str) -> ChartType:
     """
     Suggest the best chart type based on data characteristics.
@@ -459,15 +501,15 @@ def suggest_chart_type(df: pd.DataFrame, x_col: str, y_col: str) -> ChartType:
     if x_col not in df.columns or y_col not in df.columns:
         return ChartType.BAR
 
-    x_dtype = df[x_col].dtype
-    y_dtype = df[y_col].dtype
+    x_series = df[x_col]
+    x_dtype = x_series.dtype
 
-    # Check if x is temporal
+    # Check if x is temporal (before the O(N) cardinality count)
     if pd.api.types.is_datetime64_any_dtype(x_dtype):
         return ChartType.LINE
 
     # Check cardinality
-    x_cardinality = df[x_col].nunique()
+    x_cardinality = x_series.nunique()
 
     # Low cardinality categorical -> pie chart
     if x_cardinality <= 6 and x_cardinality >= 2:
@@ -478,7 +520,7 @@ def suggest_chart_type(df: pd.DataFrame, x_col: str, y_col: str) -> ChartType:
         return ChartType.BAR
 
     # High cardinality numeric data -> scatter
-    if pd.api.types.is_numeric_dtype(x_dtype) and pd.api.types.is_numeric_dtype(y_dtype):
+    if pd.api.types.is_numeric_dtype(x_dtype) and pd.api.types.is_numeric_dtype(df[y_col].dtype):
         return ChartType.SCATTER
 
     # Default to bar
@@ -486,7 +528,7 @@ def suggest_chart_type(df: pd.DataFrame, x_col: str, y_col: str) -> ChartType:
 
 
 def generate_multi_series_config(
-    data: List[Dict],
+    data: Union[List[Dict], pd.DataFrame],
     x_field: str,
     y_fields: List[str],
     chart_type: ChartType = ChartType.LINE,
@@ -497,7 +539,7 @@ def generate_multi_series_config(
     Generate multi-series chart configuration.
 
     Args:
-        data: List of data records
+        data: List of data records, or a DataFrame (read column-wise)
         x_field: Field for x-axis
         y_fields: List of fields for series
         chart_type: Type of chart (line or bar)
@@ -507,11 +549,11 @@ def generate_multi_series_config(
         ECharts configuration
     """
 
-    categories = [str(d.get(x_field, '')) for d in data]
+    categories = _field_strings(data, x_field)
 
     series = []
     for y_field in y_fields:
-        values = [d.get(y_field, 0) for d in data]
+        values = _field_values(data, y_field, 0)
         series_config = {
             "name": y_field,
             "type": chart_type.value,
@@ -5,15 +5,37 @@ Generates data summaries and key insights using OpenAI API
 after ETL or RAG pipeline processing completes.
 """
 
+import asyncio
 import os
 import json
 import logging
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 from typing import Dict, Any, List, Optional, Tuple
 from pathlib import Path
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 logger = logging.getLogger(__name__)
 
+# Rows read from a data file for analysis
+MAX_READ_ROWS = 1000
+
+# Characters of sample-row JSON included in the LLM context
+SAMPLE_JSON_CHARS = 2000
+
+# LLM requests in flight at once for batch insight generation
+MAX_CONCURRENT_INSIGHTS = 8
+
+# Sample values shown per non-numeric column, and the leading rows searched for them
+SAMPLE_VALUES = 3
+SAMPLE_SCAN_ROWS = 50
+
 
 class InsightGenerator:
     """Generates AI-powered insights from processed data files."""
@@ -28,16 +50,17 @@ class InsightGenerator:
         if not self.api_key:
             raise ValueError("OpenAI API key not found. Set OPENAI_API_KEY environment variable.")
 
-        # Import OpenAI here to avoid issues if not installed
-        from openai import OpenAI
-        self.client = OpenAI(api_key=self.api_key)
+        # Import OpenAI here to avoid issues if not installed.
+        # The async client keeps LLM calls from blocking the API's event loop
+        from openai import AsyncOpenAI
+        self.client = AsyncOpenAI(api_key=self.api_key)
 
         # Default model settings
         self.model = os.getenv('LLM_MODEL', 'gpt-4o-mini')
         self.max_tokens = int(os.getenv('LLM_MAX_TOKENS', '1500'))
         self.temperature = float(os.getenv('LLM_TEMPERATURE', '0.3'))
 
-    def generate_insights(
+    async def generate_insights(
         self,
         file_path: str,
         source_name: str,
@@ -56,8 +79,8 @@ class InsightGenerator:
         logger.info(f"Generating insights for {source_name} from {file_path}")
 
         try:
-            # Read and analyze the data
-            df, file_type = self._read_data_file(file_path)
+            # Read and analyze the data (file I/O runs off the event loop)
+            df, file_type = await asyncio.to_thread(self._read_data_file, file_path)
 
             if df is None or df.empty:
                 logger.warning(f"No data found in {file_path}")
@@ -76,7 +99,7 @@ class InsightGenerator:
             data_context = self._build_data_context(sample_df, total_records, source_name)
 
             # Generate insights using LLM
-            result = self._call_llm(data_context, source_name)
+            result = await self._call_llm(data_context, source_name)
 
             result['records_analyzed'] = total_records
             return result
@@ -89,6 +112,33 @@ class InsightGenerator:
                 'records_analyzed': 0
             }
 
+    async def generate_insights_batch(
+        self,
+        jobs: List[Tuple[str, str]],
+        concurrency: int = MAX_CONCURRENT_INSIGHTS
+    ) -> List[Dict[str, Any]]:
+        """Generate insights for several data files concurrently.
+
+        Args:
+            jobs: List of (file_path, source_name) pairs
+            concurrency: Maximum number of LLM requests in flight
+
+        Returns:
+            List of insight dictionaries, in the same order as jobs
+        """
+        if concurrency < 1:
+            raise ValueError(f"concurrency must be at least 1, got {concurrency}")
+
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def _generate_one(file_path: str, source_name: str) -> Dict[str, Any]:
+            async with semaphore:
+                return await self.generate_insights(file_path, source_name)
+
+        return await asyncio.gather(*(
+            _generate_one(file_path, source_name) for file_path, source_name in jobs
+        ))
+
     def _read_data_file(self, file_path: str) -> Tuple[Optional[pd.DataFrame], str]:
         """Read data from CSV or Parquet file.
 
@@ -106,13 +156,10 @@ class InsightGenerator:
 
         try:
             if path.suffix.lower() == '.csv':
-                df = pd.read_csv(file_path, nrows=1000)  # Limit for large files
+                df = pd.read_csv(file_path, nrows=MAX_READ_ROWS)  # Limit for large files
                 return df, 'csv'
             elif path.suffix.lower() == '.parquet':
-                df = pd.read_parquet(file_path)
-                if len(df) > 1000:
-                    df = df.head(1000)
-                return df, 'parquet'
+                return self._read_parquet_head(file_path), 'parquet'
             else:
                 logger.error(f"Unsupported file type: {path.suffix}")
                 return None, ""
@@ -120,6 +167,31 @@ class InsightGenerator:
             logger.error(f"Failed to read file {file_path}: {e}")
             return None, ""
 
+    def _read_parquet_head(self, file_path: str) -> pd.DataFrame:
+        """Read the first MAX_READ_ROWS rows of a Parquet file.
+
+        Row groups are decoded one batch at a time and reading stops once
+        enough rows are in hand, so large files are not loaded whole.
+
+        Args:
+            file_path: Path to the Parquet file
+
+        Returns:
+            DataFrame with at most MAX_READ_ROWS rows
+        """
+        parquet_file = pq.ParquetFile(file_path)
+
+        batches = []
+        rows = 0
+        for batch in parquet_file.iter_batches(batch_size=MAX_READ_ROWS):
+            batches.append(batch)
+            rows += batch.num_rows
+            if rows >= MAX_READ_ROWS:
+                break
+
+        table = pa.Table.from_batches(batches, schema=parquet_file.schema_arrow)
+        return table.slice(0, MAX_READ_ROWS).to_pandas()
+
     def _build_data_context(
         self,
         df: pd.DataFrame,
@@ -137,19 +209,22 @@ class InsightGenerator:
             Context string for LLM
         """
         # Column information
-        columns_info = []
-        for col in df.columns:
-            dtype = str(df[col].dtype)
-            non_null = df[col].notna().sum()
-            sample_values = df[col].dropna().head(3).tolist()
+        # Non-null counts for all columns in one pass; dtypes classified once
+        non_null_counts = df.notna().sum().tolist()
+        dtypes = df.dtypes
+        numeric_mask = dtypes.map(pd.api.types.is_numeric_dtype).tolist()
 
+        columns_info = []
+        for (col, series), dtype, is_numeric, non_null in zip(
+            df.items(), dtypes, numeric_mask, non_null_counts
+        ):
             col_info = f"- {col} ({dtype}): {non_null}/{len(df)} non-null"
 
-            # Add statistics for numeric columns
-            if pd.api.types.is_numeric_dtype(df[col]):
-                col_info += f", min={df[col].min():.2f}, max={df[col].max():.2f}, mean={df[col].mean():.2f}"
-            elif len(sample_values) > 0:
-                col_info += f", samples: {sample_values[:3]}"
+            # Add statistics for numeric columns, samples for the rest
+            if is_numeric:
+                col_info += f", min={series.min():.2f}, max={series.max():.2f}, mean={series.mean():.2f}"
+            elif non_null:
+                col_info += f", samples: {self._sample_values(series, non_null)}"
 
             columns_info.append(col_info)
 
@@ -165,11 +240,56 @@ Column Details:
 {chr(10).join(columns_info)}
 
 Sample Data (first 5 rows):
-{json.dumps(sample_data, indent=2, default=str)[:2000]}
+{self._dumps_sample(sample_data)[:SAMPLE_JSON_CHARS]}
 """
         return context
 
-    def _call_llm(self, data_context: str, source_name: str) -> Dict[str, Any]:
+    def _dumps_sample(self, sample_data: List[Dict[str, Any]]) -> str:
+        """Serialize sample rows as indented JSON.
+
+        orjson writes NaN as null, non-ASCII text unescaped and plain
+        datetimes/dates in ISO 8601 ('T' separator), unlike the stdlib
+        encoder's str(); other values it has no encoding for (e.g. pandas
+        Timestamps, Decimal) go through str() as with the stdlib encoder.
+        Rows orjson rejects outright, such as ints beyond 64 bits, are
+        serialized with the stdlib encoder instead.
+
+        Args:
+            sample_data: Sample rows as dictionaries
+
+        Returns:
+            JSON string
+        """
+        if HAS_ORJSON:
+            try:
+                return orjson.dumps(
+                    sample_data,
+                    default=str,
+                    option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+                ).decode()
+            except orjson.JSONEncodeError:
+                pass
+        return json.dumps(sample_data, indent=2, default=str)
+
+    def _sample_values(self, series: pd.Series, non_null: int) -> List[Any]:
+        """Get up to SAMPLE_VALUES non-null values of a column, in row order.
+
+        Only the first SAMPLE_SCAN_ROWS rows are searched unless they hold
+        too few values, so mostly-filled columns skip the full null mask.
+
+        Args:
+            series: Column to sample
+            non_null: Number of non-null values in the column
+
+        Returns:
+            List of sample values
+        """
+        samples = series.iloc[:SAMPLE_SCAN_ROWS].dropna().head(SAMPLE_VALUES)
+        if len(samples) < min(SAMPLE_VALUES, non_null):
+            samples = series.dropna().head(SAMPLE_VALUES)
+        return samples.tolist()
+
+    async def _call_llm(self, data_context: str, source_name: str) -> Dict[str, Any]:
         """Call OpenAI API to generate insights.
 
         Args:
@@ -204,7 +324,7 @@ Respond in this exact JSON format:
 Remember to respond in the exact JSON format specified."""
 
         try:
-            response = self.client.chat.completions.create(
+            response = await self.client.chat.completions.create(
                 model=self.model,
                 messages=[
                     {"role": "system", "content": system_prompt},
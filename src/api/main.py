@@ -4,6 +4,7 @@ Supports both unified and staged execution modes
 """
 from fastapi import FastAPI, HTTPException, BackgroundTasks, Header, UploadFile, File
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse, Response
 from typing import Optional, List, Dict, Any
 from datetime import datetime
 import uuid
@@ -47,7 +48,9 @@ logger = get_logger("API")
 app = FastAPI(
     title="AI ETL Framework API",
     description="Backend API for unified and staged ETL pipeline execution",
-    version="2.0.0"
+    version="2.0.0",
+    # Encode responses with orjson (C) instead of the stdlib json module
+    default_response_class=ORJSONResponse
 )
 
 # CORS middleware for frontend
@@ -74,25 +77,30 @@ async def startup_event():
         # Don't fail startup - allow pipeline operations to continue
 
 
+# Static prefix of the root response body; only the timestamp varies per call
+_ROOT_SKELETON = (
+    b'{"service":"AI ETL Framework API","version":"2.0.0",'
+    b'"status":"healthy","timestamp":"'
+)
+_NO_CACHE_HEADERS = {"Cache-Control": "no-cache, max-age=0"}
+
+
 @app.get("/")
 async def root():
     """Health check endpoint"""
-    return {
-        "service": "AI ETL Framework API",
-        "version": "2.0.0",
-        "status": "healthy",
-        "timestamp": datetime.utcnow().isoformat()
-    }
+    body = _ROOT_SKELETON + datetime.utcnow().isoformat().encode() + b'"}'
+    return Response(content=body, media_type="application/json", headers=_NO_CACHE_HEADERS)
 
 
 @app.get("/health")
 async def health():
     """Detailed health check"""
-    return {
+    # Returned directly, skipping jsonable_encoder; polled by load balancers
+    return ORJSONResponse({
         "status": "healthy",
-        "active_pipelines": len(pipeline_service.get_active_pipelines()),
+        "active_pipelines": pipeline_service.active_pipeline_count,
         "timestamp": datetime.utcnow().isoformat()
-    }
+    })
 
 
 # ============================================================
@@ -878,7 +886,7 @@ async def _generate_and_save_insights(
         from src.database.analytics_db import save_source_insights
 
         generator = get_insight_generator()
-        result = generator.generate_insights(file_path, source_name)
+        result = await generator.generate_insights(file_path, source_name)
 
         # Save to database
         save_source_insights(
@@ -1807,8 +1815,17 @@ async def login(data: Dict[str, Any]):
         - token: JWT access token
     """
     try:
-        from src.api.auth import verify_password, create_access_token
-        from src.database.analytics_db import get_user_by_email, get_user_organizations
+        from src.api.auth import (
+            verify_password,
+            password_needs_rehash,
+            hash_password,
+            create_access_token,
+        )
+        from src.database.analytics_db import (
+            get_user_by_email,
+            get_user_organizations,
+            update_user_password,
+        )
 
         email = data.get('email', '').strip().lower()
         password = data.get('password', '')
@@ -1834,6 +1851,10 @@ async def login(data: Dict[str, Any]):
                 detail="Invalid email or password"
             )
 
+        # Upgrade hashes made with older argon2 parameters
+        if password_needs_rehash(user['password_hash']):
+            update_user_password(user['id'], hash_password(password))
+
         # Get user's organizations
         organizations = get_user_organizations(user['id'])
 
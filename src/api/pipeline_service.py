@@ -55,6 +55,11 @@ class PipelineService:
         """Get list of active pipeline IDs"""
         return list(self.pipelines.keys())
 
+    @property
+    def active_pipeline_count(self) -> int:
+        """Number of tracked pipelines, without materializing the ID list"""
+        return len(self.pipelines)
+
     async def run_unified(
         self,
         pipeline_id: str,
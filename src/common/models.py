@@ -65,7 +65,9 @@ class Schema:
         return None
 
 
-@dataclass
+# Record and RecordMetadata are created once per row, so they use __slots__
+# instead of a per-instance __dict__
+@dataclass(slots=True)
 class RecordMetadata:
     """Metadata associated with a record"""
 
@@ -87,7 +89,7 @@ class RecordMetadata:
     custom: Dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class Record:
     """Standardized record format for pipeline data flow"""
 
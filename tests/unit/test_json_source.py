@@ -0,0 +1,55 @@
+"""
+Unit tests for JSONSource's parallel JSONL parsing
+"""
+import pytest
+
+from src.adapters.sources import json_source
+from src.adapters.sources.json_source import JSONSource
+
+
+def _jsonl_body(line_count: int) -> str:
+    """JSONL text with blank, whitespace-only and invalid lines mixed in"""
+    lines = []
+    for i in range(line_count):
+        if i % 17 == 5:
+            lines.append('')
+        elif i % 23 == 7:
+            lines.append('   ')
+        elif i == 40:
+            lines.append('{"id": 40, "broken": ')
+        else:
+            lines.append(f'{{"id": {i}, "name": "row-{i}", "tags": [{i % 3}]}}')
+    return '\n'.join(lines)
+
+
+def _read(path, parallelism: int):
+    """Read a JSONL file and return (data, record_id) per record"""
+    source = JSONSource(str(path), mode='lines', parallelism=parallelism)
+    source.connect()
+    try:
+        return [(record.data, record.metadata.record_id) for record in source.read()]
+    finally:
+        source.close()
+
+
+@pytest.mark.parametrize('ending', ['', '\n', '\n\n  \n'], ids=['no-newline', 'newline', 'blank-tail'])
+@pytest.mark.parametrize('use_orjson', [True, False], ids=['orjson', 'stdlib'])
+def test_parallel_jsonl_matches_serial(tmp_path, monkeypatch, ending, use_orjson):
+    if use_orjson and not json_source.HAS_ORJSON:
+        pytest.skip("orjson not installed")
+    monkeypatch.setattr(json_source, 'HAS_ORJSON', use_orjson)
+    # Small chunks so the file spans many worker chunks, with boundaries
+    # landing inside lines, on blank lines and on the last line
+    monkeypatch.setattr(json_source, 'PARALLEL_CHUNK_SIZE', 97)
+
+    path = tmp_path / 'data.jsonl'
+    path.write_text(_jsonl_body(200) + ending, encoding='utf-8')
+
+    serial = _read(path, parallelism=1)
+    parallel = _read(path, parallelism=3)
+
+    assert parallel == serial
+    record_ids = [record_id for _, record_id in serial]
+    assert 'line_41' not in record_ids  # the invalid line is skipped
+    assert 'line_6' not in record_ids  # blank lines are skipped
+    assert serial[-1] == ({'id': 199, 'name': 'row-199', 'tags': [1]}, 'line_200')